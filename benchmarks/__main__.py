@@ -0,0 +1,81 @@
+"""Throughput, tail latency and memory of the tool handlers against a mock ClickUp API."""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+
+from .harness import SCENARIOS, compare, load_baseline, run_scenario, save_baseline
+from .mock_clickup import MockClickUp, SyntheticWorkspace
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="comma separated, default: all")
+    parser.add_argument("--concurrency", default="1,8,32", help="comma separated worker counts")
+    parser.add_argument("--calls", type=int, default=200, help="tool calls per scenario and concurrency level")
+    parser.add_argument("--tasks", type=int, default=10_000, help="tasks in the synthetic workspace")
+    parser.add_argument("--tasks-per-list", type=int, default=1_000)
+    parser.add_argument("--page-size", type=int, default=100, help="tasks per get-tasks page")
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds added to every API response")
+    parser.add_argument("--jitter", type=float, default=0.01, help="random extra latency, up to this many seconds")
+    parser.add_argument("--rate-limit", type=float, help="requests per minute the mock API accepts before 429s")
+    parser.add_argument("--client-rate-limit", type=float, help="the client's own CLICKUP_RATE_LIMIT")
+    parser.add_argument("--offload", choices=["inline", "thread", "process"],
+                        help="CLICKUP_OFFLOAD policy for large responses (default: the environment's)")
+    parser.add_argument("--offload-threshold", type=int, help="CLICKUP_OFFLOAD_THRESHOLD in bytes")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", metavar="PATH", help="write results as a baseline JSON file")
+    parser.add_argument("--compare", metavar="PATH", help="compare against a baseline and fail on regressions")
+    parser.add_argument("--threshold", type=float, default=0.2, help="relative change counted as a regression")
+    return parser.parse_args(argv)
+
+
+def _format(value) -> str:
+    if isinstance(value, float):
+        return f"{value * 1000:.1f}ms" if value < 10 else f"{value:.1f}s"
+    return str(value)
+
+
+async def main(argv=None) -> int:
+    args = parse_args(argv)
+    # One INFO line per mocked request would drown the report
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    if args.offload:
+        os.environ["CLICKUP_OFFLOAD"] = args.offload
+    if args.offload_threshold is not None:
+        os.environ["CLICKUP_OFFLOAD_THRESHOLD"] = str(args.offload_threshold)
+    workspace = SyntheticWorkspace(tasks=args.tasks, tasks_per_list=args.tasks_per_list)
+    mock = MockClickUp(workspace, args.latency, args.jitter, args.rate_limit, args.page_size, args.seed)
+    results = {}
+    print(f"{'run':<32} {'calls/s':>9} {'p50':>9} {'p95':>9} {'p99':>9} {'lag p99':>9} {'errors':>6} {'api':>6} {'peak KiB':>10}")
+    for name in args.scenarios.split(","):
+        for concurrency in (int(c) for c in args.concurrency.split(",")):
+            result = await run_scenario(
+                name, mock, concurrency, args.calls, args.seed, args.client_rate_limit, not args.no_memory
+            )
+            key = f"{name}@{concurrency}"
+            results[key] = result
+            print(f"{key:<32} {result['throughput']:>9} {_format(result['p50']):>9} {_format(result['p95']):>9} "
+                  f"{_format(result['p99']):>9} {_format(result['loop_lag_p99']):>9} {result['errors']:>6} "
+                  f"{result['api_requests']:>6} {result.get('peak_memory_kib', '-'):>10}")
+
+    if args.save:
+        save_baseline(args.save, results, {k: v for k, v in vars(args).items() if k not in ("save", "compare")})
+        print(f"Baseline written to {args.save}")
+    if args.compare:
+        rows = compare(load_baseline(args.compare), results, args.threshold)
+        regressions = [row for row in rows if row["regression"]]
+        for row in rows:
+            flag = "REGRESSION" if row["regression"] else ""
+            print(f"{row['run']:<32} {row['metric']:<16} {row['baseline']:>12} -> {row['current']:<12} "
+                  f"{row['change']:+.1%} {flag}")
+        if regressions:
+            print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,183 @@
+"""Drive the real tool handlers against MockClickUp and compare runs with saved baselines."""
+import asyncio
+import json
+import os
+import platform
+import random
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from clickup.api import ClickUpClient
+from clickup.metrics import Histogram, monitor_loop_lag, registry
+from clickup.server import dispatch_tool
+
+from .mock_clickup import MockClickUp, SyntheticWorkspace
+from .payloads import DAY_MS, EPOCH_MS
+
+
+@dataclass
+class Scenario:
+    tool: str
+    arguments: Callable[[random.Random, SyntheticWorkspace], dict]
+
+
+SCENARIOS = {
+    "get-tasks": Scenario("get-tasks", lambda rng, ws: {
+        "list_id": f"l{rng.randrange(ws.list_count)}",
+        "page": rng.randrange(max(ws.tasks_per_list // 100, 1))
+    }),
+    "get-task-details": Scenario("get-task-details", lambda rng, ws: {"task_id": f"t{rng.randrange(ws.tasks)}"}),
+    "get-tasks-by-id": Scenario("get-tasks-by-id", lambda rng, ws: {
+        "task_ids": [f"t{rng.randrange(ws.tasks)}" for _ in range(20)]
+    }),
+    "get-comments-batch": Scenario("get-comments-batch", lambda rng, ws: {
+        "task_ids": [f"t{rng.randrange(ws.tasks)}" for _ in range(10)]
+    }),
+    "get-doc-pages": Scenario("get-doc-pages", lambda rng, ws: {
+        "workspace_id": ws.team_id, "doc_id": f"d{rng.randrange(ws.docs)}", "return_mode": "important"
+    }),
+    "get-workspace-tree": Scenario("get-workspace-tree", lambda rng, ws: {"refresh": True}),
+    "time-report": Scenario("time-report", lambda rng, ws: {
+        "team_id": ws.team_id, "start_date": EPOCH_MS, "end_date": EPOCH_MS + 14 * DAY_MS - 1,
+        "group_by": ["user", "week"]
+    }),
+}
+
+# Relative changes beyond the threshold count as regressions; True means higher is better
+COMPARED = {"throughput": True, "p95": False, "p99": False, "loop_lag_p99": False, "peak_memory_kib": False}
+
+
+def make_client(mock: MockClickUp, rate_limit: Optional[float] = None) -> ClickUpClient:
+    """Client wired to the mock, with the persistent cache off and its own limiter effectively off by default."""
+    previous = os.environ.get("CLICKUP_RATE_LIMIT")
+    os.environ["CLICKUP_RATE_LIMIT"] = str(rate_limit or 1e9)
+    try:
+        client = ClickUpClient("bench-token", transport=mock.transport())
+    finally:
+        if previous is None:
+            del os.environ["CLICKUP_RATE_LIMIT"]
+        else:
+            os.environ["CLICKUP_RATE_LIMIT"] = previous
+    client.disk_cache = None
+    return client
+
+
+def percentile(ordered: list[float], q: float) -> Optional[float]:
+    if not ordered:
+        return None
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+async def drive(client: ClickUpClient, scenario: Scenario, workspace: SyntheticWorkspace, concurrency: int,
+                calls: int, seed: int) -> dict:
+    """Issue `calls` tool calls from `concurrency` workers and collect per-call latency."""
+    rng = random.Random(seed)
+    arguments = [scenario.arguments(rng, workspace) for _ in range(calls)]
+    latencies, errors, response_bytes = [], 0, 0
+    pending = iter(arguments)
+
+    async def worker():
+        nonlocal errors, response_bytes
+        for args in pending:
+            started = time.perf_counter()
+            try:
+                # Same path as the server, so per-tool scheduling, budgets and metrics apply
+                contents = await dispatch_tool(client, scenario.tool, dict(args))
+                response_bytes += sum(len(c.text) for c in contents)
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    # How long rendering and other callbacks hold up the loop, i.e. everyone else's calls
+    registry.loop_lag = Histogram()
+    monitor = asyncio.create_task(monitor_loop_lag(0.01))
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    finally:
+        monitor.cancel()
+    elapsed = time.perf_counter() - started
+    ordered = sorted(latencies)
+    return {
+        "calls": calls,
+        "errors": errors,
+        "seconds": round(elapsed, 4),
+        "throughput": round(calls / elapsed, 2) if elapsed else None,
+        "mean": round(sum(ordered) / len(ordered), 6) if ordered else None,
+        "p50": percentile(ordered, 0.5),
+        "p95": percentile(ordered, 0.95),
+        "p99": percentile(ordered, 0.99),
+        "max": ordered[-1] if ordered else None,
+        "loop_lag_p99": registry.loop_lag.quantiles()["p99"],
+        "response_bytes": response_bytes
+    }
+
+
+async def run_scenario(name: str, mock: MockClickUp, concurrency: int, calls: int, seed: int = 0,
+                       client_rate_limit: Optional[float] = None, memory: bool = True) -> dict:
+    """Timing pass, then a separate tracemalloc pass so tracing overhead does not skew latency."""
+    scenario = SCENARIOS[name]
+    registry.reset()
+    requests_before = mock.stats.requests
+    client = make_client(mock, client_rate_limit)
+    try:
+        result = await drive(client, scenario, mock.workspace, concurrency, calls, seed)
+    finally:
+        await client.client.aclose()
+    result["api_requests"] = mock.stats.requests - requests_before
+    result["retries"] = sum(stats.retries for stats in registry.endpoints.values())
+
+    if memory:
+        client = make_client(mock, client_rate_limit)
+        tracemalloc.start()
+        try:
+            await drive(client, scenario, mock.workspace, concurrency, min(calls, concurrency * 2), seed + 1)
+            result["peak_memory_kib"] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+        finally:
+            tracemalloc.stop()
+            await client.client.aclose()
+    for key in ("mean", "p50", "p95", "p99", "max"):
+        if result[key] is not None:
+            result[key] = round(result[key], 6)
+    return result
+
+
+def environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "timestamp": int(time.time())
+    }
+
+
+def save_baseline(path: str, results: dict, config: dict) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"environment": environment(), "config": config, "results": results}, f, indent=2)
+
+
+def load_baseline(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(baseline: dict, results: dict, threshold: float = 0.2, metrics: Optional[dict] = None) -> list[dict]:
+    """Relative change of every compared metric present in both runs, flagged when worse than `threshold`."""
+    rows = []
+    for key, current in results.items():
+        previous = baseline.get("results", {}).get(key)
+        if not previous:
+            continue
+        for metric, higher_is_better in (metrics or COMPARED).items():
+            old, new = previous.get(metric), current.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            worse = -change if higher_is_better else change
+            rows.append({
+                "run": key, "metric": metric, "baseline": old, "current": new,
+                "change": round(change, 4), "regression": worse > threshold
+            })
+    return rows
@@ -0,0 +1,234 @@
+"""In-process stand-in for the ClickUp API, served through an httpx transport."""
+import asyncio
+import json
+import math
+import random
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional
+
+import httpx
+
+from .payloads import DAY_MS, EPOCH_MS, STATUSES, make_comment, make_page, make_task, make_time_entry, make_user
+
+
+@dataclass
+class SyntheticWorkspace:
+    """One team of spaces, folders and lists; entities are generated on request, never stored."""
+
+    tasks: int = 10_000
+    tasks_per_list: int = 1_000
+    lists_per_space: int = 20
+    lists_per_folder: int = 5
+    docs: int = 10
+    pages_per_doc: int = 50
+    page_bytes: int = 4_000
+    max_comments: int = 60
+    time_entries_per_day: int = 40
+    users: int = 50
+    team_id: str = "9000"
+
+    @property
+    def list_count(self) -> int:
+        return max(1, math.ceil(self.tasks / self.tasks_per_list))
+
+    @property
+    def space_count(self) -> int:
+        return max(1, math.ceil(self.list_count / self.lists_per_space))
+
+    def space_lists(self, space: int) -> range:
+        return range(space * self.lists_per_space, min((space + 1) * self.lists_per_space, self.list_count))
+
+    def list_location(self, list_index: int) -> tuple[int, Optional[int]]:
+        """Space of a list and its folder; the first half of each space's lists live in folders."""
+        space = list_index // self.lists_per_space
+        offset = list_index % self.lists_per_space
+        if offset < self.lists_per_space // 2:
+            return space, space * self.lists_per_space + offset // self.lists_per_folder
+        return space, None
+
+    def list_tasks(self, list_index: int) -> range:
+        return range(list_index * self.tasks_per_list, min((list_index + 1) * self.tasks_per_list, self.tasks))
+
+    def task(self, index: int) -> dict:
+        list_index = index // self.tasks_per_list
+        space, folder = self.list_location(list_index)
+        return make_task(index, f"l{list_index}", f"s{space}", f"f{folder}" if folder is not None else "")
+
+    def comment_count(self, task_index: int) -> int:
+        return random.Random(task_index).randint(0, self.max_comments)
+
+    def list_node(self, list_index: int) -> dict:
+        return {
+            "id": f"l{list_index}", "name": f"List {list_index}", "orderindex": list_index,
+            "task_count": len(self.list_tasks(list_index)), "archived": False
+        }
+
+    def space_node(self, space: int) -> dict:
+        return {"id": f"s{space}", "name": f"Space {space}", "private": False, "statuses": STATUSES, "archived": False}
+
+    def folders(self, space: int) -> list[dict]:
+        folders = {}
+        for list_index in self.space_lists(space):
+            folder = self.list_location(list_index)[1]
+            if folder is not None:
+                folders.setdefault(folder, []).append(self.list_node(list_index))
+        return [{"id": f"f{folder}", "name": f"Folder {folder}", "lists": lists} for folder, lists in folders.items()]
+
+    def folderless_lists(self, space: int) -> list[dict]:
+        return [self.list_node(i) for i in self.space_lists(space) if self.list_location(i)[1] is None]
+
+
+@dataclass
+class MockStats:
+    requests: int = 0
+    rate_limited: int = 0
+    not_found: int = 0
+    by_route: dict = field(default_factory=dict)
+
+
+class MockClickUp:
+    """Serves a SyntheticWorkspace with configurable latency, rate limit and page size.
+
+    `latency` and `jitter` are seconds added to every response; `rate_limit` is
+    requests per minute across all callers, answered with 429 like ClickUp does.
+    """
+
+    def __init__(self, workspace: Optional[SyntheticWorkspace] = None, latency: float = 0.0, jitter: float = 0.0,
+                 rate_limit: Optional[float] = None, page_size: int = 100, seed: int = 0):
+        self.workspace = workspace or SyntheticWorkspace()
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.page_size = page_size
+        self.stats = MockStats()
+        # Encoded GET bodies, so generating payloads does not dominate the client's own CPU time
+        self._bodies: "OrderedDict[str, bytes]" = OrderedDict()
+        self.body_cache_size = 2048
+        self._rng = random.Random(seed)
+        self._window_start = time.time()
+        self._window_count = 0
+        self._routes = [
+            ("GET", r"/api/v2/team", self._teams),
+            ("GET", r"/api/v2/team/(?P<team>\w+)/space", self._spaces),
+            ("GET", r"/api/v2/space/s(?P<space>\d+)/folder", self._folders),
+            ("GET", r"/api/v2/space/s(?P<space>\d+)/list", self._lists),
+            ("GET", r"/api/v2/(?P<kind>team|space|folder|list)/(?P<id>\w+)/view", self._views),
+            ("GET", r"/api/v2/list/l(?P<list>\d+)/task", self._list_tasks),
+            ("GET", r"/api/v2/task/t(?P<task>\d+)", self._task),
+            ("PUT", r"/api/v2/task/t(?P<task>\d+)", self._task),
+            ("GET", r"/api/v2/task/t(?P<task>\d+)/comment", self._comments),
+            ("GET", r"/api/v2/team/(?P<team>\w+)/time_entries", self._time_entries),
+            ("GET", r"/api/v3/workspaces/(?P<team>\w+)/docs/d(?P<doc>\d+)/pages", self._pages),
+        ]
+        self._routes = [(method, re.compile(pattern + "$"), route) for method, pattern, route in self._routes]
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.stats.requests += 1
+        limited = self._rate_limited()
+        if self.latency or self.jitter:
+            await asyncio.sleep(self.latency + self._rng.uniform(0, self.jitter))
+        if limited is not None:
+            self.stats.rate_limited += 1
+            return limited
+        for method, pattern, route in self._routes:
+            match = pattern.match(request.url.path)
+            if match and method == request.method:
+                name = route.__name__.lstrip("_")
+                self.stats.by_route[name] = self.stats.by_route.get(name, 0) + 1
+                body = self._body(request, route, match.groupdict())
+                if body is not None:
+                    return httpx.Response(200, content=body, headers={"Content-Type": "application/json"})
+        self.stats.not_found += 1
+        return httpx.Response(404, json={"err": "Route not found", "ECODE": "APP_001"})
+
+    def _body(self, request: httpx.Request, route, params: dict) -> Optional[bytes]:
+        key = str(request.url)
+        if request.method == "GET" and key in self._bodies:
+            self._bodies.move_to_end(key)
+            return self._bodies[key]
+        data = route(request, **params)
+        if data is None:
+            return None
+        body = json.dumps(data).encode("utf-8")
+        if request.method == "GET":
+            self._bodies[key] = body
+            while len(self._bodies) > self.body_cache_size:
+                self._bodies.popitem(last=False)
+        return body
+
+    def _rate_limited(self) -> Optional[httpx.Response]:
+        """Fixed one-minute windows, reported through X-RateLimit-* headers."""
+        if not self.rate_limit:
+            return None
+        now = time.time()
+        if now - self._window_start >= 60:
+            self._window_start, self._window_count = now, 0
+        self._window_count += 1
+        reset = self._window_start + 60
+        if self._window_count <= self.rate_limit:
+            return None
+        return httpx.Response(429, json={"err": "Rate limit reached", "ECODE": "APP_002"}, headers={
+            "X-RateLimit-Limit": str(int(self.rate_limit)),
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(int(math.ceil(reset)))
+        })
+
+    def _teams(self, request):
+        ws = self.workspace
+        members = [{"user": make_user(i)} for i in range(ws.users)]
+        return {"teams": [{"id": ws.team_id, "name": "Synthetic team", "members": members}]}
+
+    def _spaces(self, request, team):
+        return {"spaces": [self.workspace.space_node(s) for s in range(self.workspace.space_count)]}
+
+    def _folders(self, request, space):
+        return {"folders": self.workspace.folders(int(space))}
+
+    def _lists(self, request, space):
+        return {"lists": self.workspace.folderless_lists(int(space))}
+
+    def _views(self, request, kind, id):
+        return {"views": [{"id": f"v-{kind}-{id}", "name": "List", "type": "list"}]}
+
+    def _list_tasks(self, request, list):
+        page = int(request.url.params.get("page", 0))
+        tasks = self.workspace.list_tasks(int(list))
+        chunk = tasks[page * self.page_size:(page + 1) * self.page_size]
+        return {"tasks": [self.workspace.task(i) for i in chunk], "last_page": (page + 1) * self.page_size >= len(tasks)}
+
+    def _task(self, request, task):
+        index = int(task)
+        return self.workspace.task(index) if index < self.workspace.tasks else None
+
+    def _comments(self, request, task):
+        """Newest first, 25 per page, continued with start/start_id like ClickUp."""
+        task_index = int(task)
+        count = self.workspace.comment_count(task_index)
+        # Comment i is i hours after the task was created, so older pages have smaller indexes
+        newest = count - 1
+        if "start_id" in request.url.params:
+            newest = int(request.url.params["start_id"].rsplit("-", 1)[1]) - 1
+        indexes = range(newest, max(newest - 25, -1), -1)
+        return {"comments": [make_comment(task_index, i, EPOCH_MS + i * 3_600_000) for i in indexes]}
+
+    def _time_entries(self, request, team):
+        start = int(request.url.params.get("start_date", EPOCH_MS))
+        end = int(request.url.params.get("end_date", start + DAY_MS))
+        per_day = self.workspace.time_entries_per_day
+        entries = []
+        for day in range(max((start - EPOCH_MS) // DAY_MS, 0), (end - EPOCH_MS) // DAY_MS + 1):
+            for i in range(per_day):
+                entry = make_time_entry(day, i, per_day)
+                if start <= int(entry["start"]) <= end:
+                    entries.append(entry)
+        return {"data": entries}
+
+    def _pages(self, request, team, doc):
+        ws = self.workspace
+        return [make_page(f"d{doc}", i, ws.page_bytes) for i in range(ws.pages_per_doc)]
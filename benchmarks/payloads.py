@@ -0,0 +1,263 @@
+"""Deterministic synthetic ClickUp payloads shaped like real API responses."""
+import random
+
+DAY_MS = 24 * 60 * 60 * 1000
+# 2024-01-01T00:00:00Z
+EPOCH_MS = 1704067200000
+
+STATUSES = [
+    {"status": "to do", "color": "#d3d3d3", "type": "open", "orderindex": 0},
+    {"status": "in progress", "color": "#4194f6", "type": "custom", "orderindex": 1},
+    {"status": "review", "color": "#a875ff", "type": "custom", "orderindex": 2},
+    {"status": "complete", "color": "#6bc950", "type": "closed", "orderindex": 3},
+]
+PRIORITIES = [
+    None,
+    {"id": "1", "priority": "urgent", "color": "#f50000", "orderindex": "1"},
+    {"id": "2", "priority": "high", "color": "#ffcc00", "orderindex": "2"},
+    {"id": "3", "priority": "normal", "color": "#6fddff", "orderindex": "3"},
+    {"id": "4", "priority": "low", "color": "#d8d8d8", "orderindex": "4"},
+]
+TAGS = ["backend", "frontend", "bug", "feature", "infra", "docs", "customer", "tech-debt", "q3", "security"]
+WORDS = (
+    "sync export invoice dashboard onboarding webhook cache latency report migrate audit billing "
+    "search permissions import mobile release review customer rollout alert schema retry"
+).split()
+DROPDOWN_OPTIONS = [
+    {"id": f"opt-{i}", "name": name, "color": color, "orderindex": i}
+    for i, (name, color) in enumerate([("Small", "#02BCD4"), ("Medium", "#1bbc9c"), ("Large", "#FF7FAB"), ("XL", "#e50000")])
+]
+USER_COUNT = 50
+
+
+def make_user(index: int) -> dict:
+    return {
+        "id": 100000 + index,
+        "username": f"User {index}",
+        "email": f"user{index}@example.com",
+        "color": "#7b68ee",
+        "initials": f"U{index % 10}",
+        "profilePicture": f"https://attachments.clickup.com/profilePictures/{100000 + index}.jpg"
+    }
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def _custom_fields(rng: random.Random, index: int) -> list[dict]:
+    return [
+        {
+            "id": "cf-size", "name": "Size", "type": "drop_down", "required": False,
+            "type_config": {"default": 0, "placeholder": None, "options": DROPDOWN_OPTIONS},
+            "value": rng.randrange(len(DROPDOWN_OPTIONS))
+        },
+        {"id": "cf-estimate", "name": "Estimate (h)", "type": "number", "type_config": {}, "value": str(rng.randint(1, 40))},
+        {"id": "cf-budget", "name": "Budget", "type": "currency",
+         "type_config": {"precision": 2, "currency_type": "USD"}, "value": str(round(rng.uniform(100, 10000), 2))},
+        {"id": "cf-customer", "name": "Customer", "type": "short_text", "type_config": {}, "value": f"Customer {index % 300}"},
+        {"id": "cf-notes", "name": "Notes", "type": "text", "type_config": {}, "value": _sentence(rng, 12)},
+        {"id": "cf-deadline", "name": "External deadline", "type": "date", "type_config": {},
+         "value": str(EPOCH_MS + rng.randint(0, 365) * DAY_MS)},
+        {"id": "cf-labels", "name": "Components", "type": "labels",
+         "type_config": {"options": [{"id": f"lbl-{t}", "label": t, "color": "#800000"} for t in TAGS]},
+         "value": [f"lbl-{t}" for t in rng.sample(TAGS, rng.randint(0, 3))]},
+        {"id": "cf-reviewer", "name": "Reviewer", "type": "users", "type_config": {},
+         "value": [make_user(rng.randrange(USER_COUNT))] if rng.random() < 0.6 else []},
+    ]
+
+
+def make_task(index: int, list_id: str = "l0", space_id: str = "s0", folder_id: str = "f0") -> dict:
+    """Task number `index`, always identical for the same arguments."""
+    rng = random.Random(index)
+    created = EPOCH_MS + rng.randint(0, 365) * DAY_MS + rng.randint(0, DAY_MS)
+    status = rng.choice(STATUSES)
+    assignees = [make_user(u) for u in rng.sample(range(USER_COUNT), rng.choice((0, 1, 1, 1, 2, 3)))]
+    description = "\n".join(_sentence(rng, rng.randint(6, 16)) for _ in range(rng.randint(0, 6)))
+    return {
+        "id": f"t{index}",
+        "custom_id": f"ENG-{index}",
+        "name": _sentence(rng, rng.randint(3, 8)),
+        "text_content": description,
+        "description": description,
+        "status": status,
+        "orderindex": f"{index}.00000000000000000000000000000000",
+        "date_created": str(created),
+        "date_updated": str(created + rng.randint(0, 30) * DAY_MS),
+        "date_closed": str(created + 30 * DAY_MS) if status["type"] == "closed" else None,
+        "date_done": str(created + 30 * DAY_MS) if status["type"] == "closed" else None,
+        "archived": False,
+        "creator": make_user(rng.randrange(USER_COUNT)),
+        "assignees": assignees,
+        "group_assignees": [],
+        "watchers": assignees + [make_user(rng.randrange(USER_COUNT))],
+        "checklists": [],
+        "tags": [
+            {"name": tag, "tag_fg": "#800000", "tag_bg": "#2ecd6f", "creator": 100000}
+            for tag in rng.sample(TAGS, rng.randint(0, 4))
+        ],
+        "parent": f"t{index - 1}" if index % 10 == 9 else None,
+        "top_level_parent": None,
+        "priority": rng.choice(PRIORITIES),
+        "due_date": str(created + rng.randint(1, 60) * DAY_MS) if rng.random() < 0.7 else None,
+        "start_date": str(created) if rng.random() < 0.3 else None,
+        "points": rng.choice((None, 1, 2, 3, 5, 8)),
+        "time_estimate": rng.choice((None, 3_600_000, 14_400_000, 28_800_000)),
+        "time_spent": rng.randint(0, 40) * 900_000,
+        "custom_fields": _custom_fields(rng, index),
+        "dependencies": [],
+        "linked_tasks": [],
+        "locations": [],
+        "team_id": "9000",
+        "url": f"https://app.clickup.com/t/t{index}",
+        "sharing": {"public": False, "public_share_expires_on": None, "public_fields": [], "token": None, "seo_optimized": False},
+        "permission_level": "create",
+        "list": {"id": list_id, "name": f"List {list_id}", "access": True},
+        "project": {"id": folder_id, "name": f"Folder {folder_id}", "hidden": False, "access": True},
+        "folder": {"id": folder_id, "name": f"Folder {folder_id}", "hidden": False, "access": True},
+        "space": {"id": space_id}
+    }
+
+
+def make_tasks(count: int, start: int = 0) -> list[dict]:
+    return [make_task(index) for index in range(start, start + count)]
+
+
+def make_comment(task_index: int, index: int, date: int) -> dict:
+    rng = random.Random(task_index * 1000 + index)
+    text = _sentence(rng, rng.randint(5, 40))
+    return {
+        "id": f"c{task_index}-{index}",
+        "comment": [{"text": text}],
+        "comment_text": text,
+        "user": make_user(rng.randrange(USER_COUNT)),
+        "resolved": rng.random() < 0.2,
+        "assignee": None,
+        "assigned_by": None,
+        "reactions": [],
+        "date": str(date)
+    }
+
+
+def make_page(doc_id: str, index: int, content_bytes: int = 4000) -> dict:
+    rng = random.Random(f"{doc_id}-{index}")
+    lines = []
+    size = 0
+    while size < content_bytes:
+        line = _sentence(rng, rng.randint(6, 20)) + "."
+        lines.append(f"## {line}" if rng.random() < 0.1 else line)
+        size += len(line) + 1
+    return {
+        "id": f"p{doc_id}-{index}",
+        "doc_id": doc_id,
+        "workspace_id": 9000,
+        "name": _sentence(rng, 3),
+        "sub_title": None,
+        "date_created": EPOCH_MS,
+        "date_updated": EPOCH_MS + index * DAY_MS,
+        "content": "\n".join(lines),
+        "creator_id": 100000,
+        "archived": False,
+        "protected": False,
+        "pages": []
+    }
+
+
+def make_time_entry(day: int, index: int, per_day: int) -> dict:
+    rng = random.Random(day * 100000 + index)
+    start = EPOCH_MS + day * DAY_MS + 8 * 3_600_000 + index * (10 * 3_600_000 // max(per_day, 1))
+    task_index = rng.randrange(10000)
+    return {
+        "id": f"te{day}-{index}",
+        "task": {"id": f"t{task_index}", "name": f"Task {task_index}", "status": rng.choice(STATUSES)},
+        "wid": "9000",
+        "user": make_user(rng.randrange(USER_COUNT)),
+        "billable": rng.random() < 0.5,
+        "start": str(start),
+        "end": str(start + 1_800_000),
+        "duration": str(rng.randint(5, 120) * 60_000),
+        "description": _sentence(rng, 4),
+        "tags": [{"name": tag} for tag in rng.sample(TAGS, rng.randint(0, 2))],
+        "source": "clickup",
+        "at": str(start + 1_800_000)
+    }
+
+
+
+def make_list(index: int) -> dict:
+    rng = random.Random(f"list-{index}")
+    return {
+        "id": f"l{index}", "name": f"List {index}", "orderindex": index, "content": _sentence(rng, 10),
+        "status": {"status": "green", "color": "#6bc950", "hide_label": True}, "priority": rng.choice(PRIORITIES),
+        "assignee": None, "task_count": rng.randint(0, 1000), "due_date": None, "start_date": None,
+        "folder": {"id": f"f{index // 5}", "name": f"Folder {index // 5}", "hidden": False, "access": True},
+        "space": {"id": f"s{index // 20}", "name": f"Space {index // 20}", "access": True},
+        "archived": False, "override_statuses": False, "permission_level": "create"
+    }
+
+
+def make_space(index: int) -> dict:
+    feature = {"enabled": True}
+    return {
+        "id": f"s{index}", "name": f"Space {index}", "private": False, "statuses": STATUSES,
+        "multiple_assignees": True,
+        "features": {
+            "due_dates": {"enabled": True, "start_date": True, "remap_due_dates": False, "remap_closed_due_date": False},
+            "time_tracking": feature, "tags": feature, "time_estimates": feature, "checklists": feature,
+            "custom_fields": feature, "remap_dependencies": feature, "dependency_warning": feature, "portfolios": feature
+        },
+        "archived": False
+    }
+
+
+def make_folder(index: int) -> dict:
+    return {
+        "id": f"f{index}", "name": f"Folder {index}", "orderindex": index, "override_statuses": False,
+        "hidden": False, "space": {"id": f"s{index // 4}", "name": f"Space {index // 4}", "access": True},
+        "task_count": str(index % 500), "archived": False, "statuses": STATUSES,
+        "lists": [make_list(index * 5 + i) for i in range(5)], "permission_level": "create"
+    }
+
+
+def make_team(index: int, members: int = 50) -> dict:
+    return {
+        "id": str(9000 + index), "name": f"Team {index}", "color": "#7b68ee", "avatar": None,
+        "members": [{"user": {**make_user(i), "role": 3}} for i in range(members)]
+    }
+
+
+def make_doc(index: int) -> dict:
+    return {
+        "id": f"d{index}", "name": f"Doc {index}", "type": 1, "visibility": "PRIVATE", "status": "active",
+        "date_created": EPOCH_MS + index * 3_600_000, "date_updated": EPOCH_MS + index * 7_200_000,
+        "creator": 100000 + index % USER_COUNT, "deleted": False, "archived": False, "workspace_id": 9000,
+        "parent": {"id": f"s{index % 10}", "type": 4},
+        "sharing": {"public": False, "public_share_expires_on": None, "public_fields": [], "token": None}
+    }
+
+
+def make_goal(index: int) -> dict:
+    rng = random.Random(f"goal-{index}")
+    owners = [make_user(u) for u in rng.sample(range(USER_COUNT), rng.randint(1, 3))]
+    return {
+        "id": f"g{index}", "pretty_id": str(index), "name": f"Goal {index}", "team_id": "9000",
+        "creator": owners[0]["id"], "owner": owners[0], "color": "#32a852", "date_created": str(EPOCH_MS),
+        "start_date": None, "due_date": str(EPOCH_MS + 90 * DAY_MS), "description": _sentence(rng, 20),
+        "private": False, "archived": False, "multiple_owners": len(owners) > 1, "members": [], "owners": owners,
+        "key_results": [], "percent_completed": rng.randint(0, 100), "history": []
+    }
+
+
+def make_webhook(index: int) -> dict:
+    return {
+        "id": f"wh-{index}", "userid": 100000, "team_id": 9000, "endpoint": f"https://example.com/hooks/{index}",
+        "client_id": f"client-{index}", "events": ["taskCreated", "taskUpdated", "taskDeleted"],
+        "task_id": None, "list_id": None, "folder_id": None, "space_id": None,
+        "health": {"status": "active", "fail_count": 0}, "secret": f"secret-{index}"
+    }
+
+
+def make_custom_field(index: int) -> dict:
+    rng = random.Random(f"cf-{index}")
+    return {**_custom_fields(rng, index)[index % 8], "id": f"cf-{index}", "date_created": str(EPOCH_MS),
+            "hide_from_guests": False}
@@ -0,0 +1,154 @@
+"""Micro-benchmarks of every *Transformer.transform and the JSON encoding step on synthetic payloads.
+
+    python -m benchmarks.transformers --sizes 100,1000,10000 --save transformers.json
+"""
+import argparse
+import gc
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+from clickup.tools.base import ReturnMode
+from clickup.tools.comments import CommentTransformer
+from clickup.tools.custom_fields import CustomFieldTransformer
+from clickup.tools.docs import DocTransformer, PageTransformer
+from clickup.tools.folders import FolderTransformer
+from clickup.tools.goals import GoalTransformer
+from clickup.tools.lists import ListTransformer
+from clickup.tools.spaces import SpaceTransformer
+from clickup.tools.tasks import TaskTransformer
+from clickup.tools.teams import TeamTransformer
+from clickup.tools.time_tracking import TimeEntryTransformer
+from clickup.tools.views import ViewTransformer
+from clickup.tools.webhooks import WebhookTransformer
+
+from .harness import compare, load_baseline, save_baseline
+from .payloads import (
+    EPOCH_MS, make_comment, make_custom_field, make_doc, make_folder, make_goal, make_list, make_page, make_space,
+    make_task, make_team, make_time_entry, make_webhook
+)
+
+# Transformer and the payload it receives from the API, as a function of the entity count
+PAYLOADS: dict[str, tuple[type, Callable[[int], object]]] = {
+    "Task": (TaskTransformer, lambda n: {"tasks": [make_task(i) for i in range(n)], "last_page": True}),
+    "View": (ViewTransformer, lambda n: [make_task(i) for i in range(n)]),
+    "Comment": (CommentTransformer, lambda n: [make_comment(i // 25, i % 25, EPOCH_MS + i) for i in range(n)]),
+    "TimeEntry": (TimeEntryTransformer, lambda n: [make_time_entry(i // 40, i % 40, 40) for i in range(n)]),
+    "Page": (PageTransformer, lambda n: [make_page("d1", i, 2000) for i in range(n)]),
+    "Doc": (DocTransformer, lambda n: [make_doc(i) for i in range(n)]),
+    "List": (ListTransformer, lambda n: [make_list(i) for i in range(n)]),
+    "Folder": (FolderTransformer, lambda n: [make_folder(i) for i in range(n)]),
+    "Space": (SpaceTransformer, lambda n: [make_space(i) for i in range(n)]),
+    "Team": (TeamTransformer, lambda n: [make_team(i, members=10) for i in range(n)]),
+    "Goal": (GoalTransformer, lambda n: [make_goal(i) for i in range(n)]),
+    "Webhook": (WebhookTransformer, lambda n: [make_webhook(i) for i in range(n)]),
+    "CustomField": (CustomFieldTransformer, lambda n: [make_custom_field(i) for i in range(n)]),
+}
+COMPARED = {"transform_ms": False, "serialize_ms": False, "transform_peak_kib": False, "serialize_peak_kib": False}
+
+
+def timed(function: Callable, repeat: int) -> tuple[float, float, object]:
+    """Best and median wall time in ms over `repeat` runs, with GC paused like timeit does."""
+    samples = []
+    result = None
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = function()
+            samples.append((time.perf_counter() - started) * 1000)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return min(samples), statistics.median(samples), result
+
+
+def traced(function: Callable) -> tuple[float, int]:
+    """Peak KiB allocated while running `function` and memory blocks still held by its result."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        result = function()
+        peak = tracemalloc.get_traced_memory()[1]
+        after = tracemalloc.take_snapshot()
+        blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+        del result
+    finally:
+        tracemalloc.stop()
+    return round(peak / 1024, 1), blocks
+
+
+def bench(name: str, size: int, mode: ReturnMode, payload, repeat: int, memory: bool) -> dict:
+    transformer = PAYLOADS[name][0]
+    transform = lambda: transformer.transform(payload, mode)
+    transform_best, transform_median, transformed = timed(transform, repeat)
+    serialize = lambda: json.dumps(transformed, indent=2)
+    serialize_best, serialize_median, text = timed(serialize, repeat)
+    result = {
+        "transform_ms": round(transform_best, 3),
+        "transform_median_ms": round(transform_median, 3),
+        "serialize_ms": round(serialize_best, 3),
+        "serialize_median_ms": round(serialize_median, 3),
+        "output_bytes": len(text.encode("utf-8")),
+        "entities_per_second": round(size / (transform_best + serialize_best) * 1000) if transform_best + serialize_best else None
+    }
+    if memory:
+        result["transform_peak_kib"], result["transform_blocks"] = traced(transform)
+        result["serialize_peak_kib"], _ = traced(serialize)
+    return result
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.transformers", description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", default="100,1000,10000", help="entity counts, up to 100000")
+    parser.add_argument("--transformers", default=",".join(PAYLOADS), help="comma separated, default: all")
+    parser.add_argument("--modes", default="minimal,important,full")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per measurement")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--save", metavar="PATH", help="write results as a baseline JSON file")
+    parser.add_argument("--compare", metavar="PATH", help="compare against a baseline and fail on regressions")
+    parser.add_argument("--threshold", type=float, default=0.2, help="relative change counted as a regression")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    results = {}
+    print(f"{'run':<32} {'transform':>11} {'serialize':>11} {'bytes':>12} {'entities/s':>11} {'peak KiB':>10} {'blocks':>9}")
+    for name in args.transformers.split(","):
+        for size in (int(s) for s in args.sizes.split(",")):
+            # Generating the payload is not part of the measurement
+            payload = PAYLOADS[name][1](size)
+            for mode in (ReturnMode(m) for m in args.modes.split(",")):
+                key = f"{name}.{mode.value}@{size}"
+                result = bench(name, size, mode, payload, args.repeat, not args.no_memory)
+                results[key] = result
+                print(f"{key:<32} {result['transform_ms']:>9.2f}ms {result['serialize_ms']:>9.2f}ms "
+                      f"{result['output_bytes']:>12} {result['entities_per_second'] or '-':>11} "
+                      f"{result.get('transform_peak_kib', '-'):>10} {result.get('transform_blocks', '-'):>9}")
+            del payload
+
+    if args.save:
+        save_baseline(args.save, results, {k: v for k, v in vars(args).items() if k not in ("save", "compare")})
+        print(f"Baseline written to {args.save}")
+    if args.compare:
+        rows = compare(load_baseline(args.compare), results, args.threshold, COMPARED)
+        for row in rows:
+            flag = "REGRESSION" if row["regression"] else ""
+            print(f"{row['run']:<32} {row['metric']:<20} {row['baseline']:>10} -> {row['current']:<10} "
+                  f"{row['change']:+.1%} {flag}")
+        regressions = [row for row in rows if row["regression"]]
+        if regressions:
+            print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""Throughput of the tool handlers as the number of worker processes grows.
+
+Every process drives its share of the calls against its own MockClickUp, like a
+server worker behind a shared port, while the cache and the rate limit are shared
+through one SQLite database (`CLICKUP_SHARED_STATE`). With JSON-heavy scenarios the
+single-process run is bound by one core, so throughput should grow with the workers
+up to the number of cores.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+from .harness import SCENARIOS, environment, make_client, drive
+from .mock_clickup import MockClickUp, SyntheticWorkspace
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.workers", description=__doc__)
+    parser.add_argument("--scenario", default="get-doc-pages", choices=sorted(SCENARIOS))
+    parser.add_argument("--workers", default=",".join(str(n) for n in _default_workers()),
+                        help="comma separated process counts")
+    parser.add_argument("--concurrency", type=int, default=8, help="concurrent calls per process")
+    parser.add_argument("--calls", type=int, default=400, help="tool calls per run, split across the processes")
+    parser.add_argument("--tasks", type=int, default=10_000, help="tasks in the synthetic workspace")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every API response")
+    parser.add_argument("--client-rate-limit", type=float, help="shared CLICKUP_RATE_LIMIT of all processes")
+    parser.add_argument("--save", metavar="PATH", help="write results as JSON")
+    return parser.parse_args(argv)
+
+
+def _default_workers() -> list[int]:
+    counts, n = [], 1
+    while n < (os.cpu_count() or 1):
+        counts.append(n)
+        n *= 2
+    return counts + [os.cpu_count() or 1]
+
+
+def _worker(args: argparse.Namespace, calls: int, seed: int, ready, start, results) -> None:
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    workspace = SyntheticWorkspace(tasks=args.tasks)
+    mock = MockClickUp(workspace, args.latency, 0.0, None, 100, seed)
+    ready.put(seed)
+    start.wait()
+
+    async def run():
+        client = make_client(mock, args.client_rate_limit)
+        try:
+            return await drive(client, SCENARIOS[args.scenario], workspace, args.concurrency, calls, seed)
+        finally:
+            await client.client.aclose()
+
+    results.put(asyncio.run(run()))
+
+
+def run_workers(args: argparse.Namespace, workers: int, shared_state: str) -> dict:
+    """Start `workers` processes, release them together and time until the last one is done."""
+    os.environ["CLICKUP_SHARED_STATE"] = shared_state
+    context = multiprocessing.get_context("spawn")
+    ready, start, results = context.Queue(), context.Event(), context.Queue()
+    shares = [args.calls // workers + (1 if i < args.calls % workers else 0) for i in range(workers)]
+    processes = [
+        context.Process(target=_worker, args=(args, share, seed, ready, start, results))
+        for seed, share in enumerate(shares)
+    ]
+    for process in processes:
+        process.start()
+    # Process start-up (imports, mock setup) is not part of the measurement
+    for _ in processes:
+        ready.get()
+    started = time.perf_counter()
+    start.set()
+    parts = [results.get() for _ in processes]
+    elapsed = time.perf_counter() - started
+    for process in processes:
+        process.join()
+    return {
+        "workers": workers,
+        "calls": sum(part["calls"] for part in parts),
+        "errors": sum(part["errors"] for part in parts),
+        "seconds": round(elapsed, 4),
+        "throughput": round(args.calls / elapsed, 2),
+        "p95": max(part["p95"] or 0 for part in parts)
+    }
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    results = []
+    print(f"{'workers':>7} {'calls/s':>9} {'speedup':>8} {'p95':>9} {'errors':>6}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for workers in (int(w) for w in args.workers.split(",")):
+            result = run_workers(args, workers, os.path.join(tmp, f"shared-{workers}.sqlite3"))
+            result["speedup"] = round(result["throughput"] / results[0]["throughput"], 2) if results else 1.0
+            results.append(result)
+            print(f"{workers:>7} {result['throughput']:>9} {result['speedup']:>7}x "
+                  f"{result['p95'] * 1000:>7.1f}ms {result['errors']:>6}")
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"environment": environment(), "config": vars(args), "results": results}, f, indent=2)
+        print(f"Results written to {args.save}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
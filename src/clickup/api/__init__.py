@@ -1,3 +1,5 @@
 from .client import ClickUpClient
+from .cache import TTLCache, DiskCache
+from .manager import ClientManager
 
-__all__ = ['ClickUpClient']
\ No newline at end of file
+__all__ = ['ClickUpClient', 'TTLCache', 'DiskCache', 'ClientManager']
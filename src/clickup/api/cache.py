@@ -0,0 +1,86 @@
+import json
+import os
+import time
+import urllib.parse
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from ..metrics import registry
+
+
+class TTLCache:
+    """Small in-memory LRU cache with per-entry expiry, shared by the API mixins."""
+
+    def __init__(self, default_ttl: float = 300.0, max_entries: int = 1024):
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a live entry, dropping it if it has expired."""
+        item = self._entries.get(key)
+        if item is not None and item[0] <= time.monotonic():
+            del self._entries[key]
+            item = None
+        registry.record_cache(_cache_name(key), item is not None)
+        if item is None:
+            return default
+        self._entries.move_to_end(key)
+        return item[1]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entries when full."""
+        ttl = self.default_ttl if ttl is None else ttl
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        item = self._entries.pop(key, None)
+        return default if item is None else item[1]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        item = self._entries.get(key)
+        return item is not None and item[0] > time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskCache:
+    """Persistent JSON cache for data that does not change once written, one file per key."""
+
+    def __init__(self, root: str):
+        self.root = os.path.expanduser(root)
+
+    def _path(self, namespace: str, key: str) -> str:
+        parts = [urllib.parse.quote(part, safe="") for part in namespace.split("/")]
+        return os.path.join(self.root, *parts, urllib.parse.quote(key, safe="") + ".json")
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        try:
+            with open(self._path(namespace, key), encoding="utf-8") as f:
+                value = json.load(f)
+        except (OSError, ValueError):
+            registry.record_cache(f"disk:{namespace.split('/')[0]}", False)
+            return default
+        registry.record_cache(f"disk:{namespace.split('/')[0]}", True)
+        return value
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        """Write atomically so a crash never leaves a truncated entry behind."""
+        path = self._path(namespace, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(value, f)
+        os.replace(tmp_path, path)
+
+
+def _cache_name(key: Hashable) -> str:
+    """Metrics label for a key: the leading tag of tuple keys such as ("task", id)."""
+    return str(key[0]) if isinstance(key, tuple) and key else "default"
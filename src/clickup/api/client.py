@@ -1,4 +1,6 @@
+import contextlib
 import os
+import hashlib
 import httpx
 from dotenv import load_dotenv
 from typing import Optional
@@ -16,6 +18,15 @@ from ..tools.custom_fields import CustomFieldAPI
 from ..tools.folders import FolderAPI
 from ..tools.dependencies import DependencyAPI
 from ..tools.docs import DocAPI
+from ..tools.workspace import WorkspaceAPI
+from ..tools.resolver import ResolverAPI
+from .cache import TTLCache, DiskCache
+from .ratelimit import RateLimiter, RateLimitedTransport
+from .instrumentation import InstrumentedTransport, TracingTransport
+from .recording import Recorder, RecordingTransport
+from .scheduler import Scheduler, SchedulingTransport
+from .deadline import DeadlineTransport
+from .shared import SharedCache, SharedRateLimiter
 
 class ClickUpClient(
     TaskAPI,
@@ -30,11 +41,14 @@ class ClickUpClient(
     CustomFieldAPI,
     FolderAPI,
     DependencyAPI,
-    DocAPI
+    DocAPI,
+    WorkspaceAPI,
+    ResolverAPI
 ):
     """ClickUp API client that combines all entity-specific APIs."""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, transport: Optional[httpx.AsyncBaseTransport] = None,
+                 recorder: Optional[Recorder] = None):
         self.api_key = api_key
         self.base_url = "https://api.clickup.com/api/v2"  # For v2 endpoints
         self.base_url_v3 = "https://api.clickup.com/api/v3"  # For v3 endpoints
@@ -42,27 +56,64 @@ class ClickUpClient(
             "Authorization": api_key,
             "Content-Type": "application/json"
         }
-        self._setup_client()
+        # Persistent entries are partitioned per token so users never see each other's data
+        self.cache_namespace = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        # Worker processes keep the cache and the token's quota in one shared database
+        shared_state = os.getenv("CLICKUP_SHARED_STATE")
+        self.cache = SharedCache(shared_state, self.cache_namespace) if shared_state else TTLCache()
+        cache_dir = os.getenv("CLICKUP_CACHE_DIR", "~/.cache/clickup-mcp")
+        self.disk_cache = DiskCache(cache_dir) if cache_dir else None
+        self.time_entry_horizon_days = int(os.getenv("CLICKUP_TIME_ENTRY_HORIZON_DAYS", "3"))
+        self.time_entry_partition = os.getenv("CLICKUP_TIME_ENTRY_PARTITION", "day")
+        rate = float(os.getenv("CLICKUP_RATE_LIMIT", "100"))
+        if shared_state:
+            self.rate_limiter = SharedRateLimiter(shared_state, self.cache_namespace, rate=rate)
+        else:
+            self.rate_limiter = RateLimiter(rate=rate)
+        self.recorder = recorder
+        self.scheduler = Scheduler.from_env()
+        # Background work outliving a tool call (jobs, keep-alive pings) using this client
+        self.pins = 0
+        self._setup_client(transport)
     
     @classmethod
-    async def create(cls) -> 'ClickUpClient':
+    async def create(cls, **kwargs) -> 'ClickUpClient':
         """Factory method for creating client instance."""
         load_dotenv()
         api_key = os.getenv("CLICKUP_API_TOKEN")
         if not api_key:
             raise ValueError("CLICKUP_API_TOKEN environment variable not set")
-        return cls(api_key)
+        return cls(api_key, **kwargs)
     
-    def _setup_client(self):
+    def _setup_client(self, transport: Optional[httpx.AsyncBaseTransport] = None):
         """Setup the HTTP client with proper timeout and retry settings."""
         timeout = httpx.Timeout(30.0, connect=10.0)
-        limits = httpx.Limits(max_keepalive_connections=5, max_connections=10)
+        limits = httpx.Limits(
+            max_keepalive_connections=5,
+            max_connections=self.scheduler.max_concurrency,
+            keepalive_expiry=float(os.getenv("CLICKUP_KEEPALIVE_EXPIRY", "120"))
+        )
+        transport = transport or httpx.AsyncHTTPTransport(limits=limits)
+        if self.recorder is not None:
+            transport = RecordingTransport(transport, self.recorder)
         self.client = httpx.AsyncClient(
             headers=self.headers,
             timeout=timeout,
-            limits=limits
+            transport=InstrumentedTransport(DeadlineTransport(SchedulingTransport(
+                RateLimitedTransport(TracingTransport(transport), self.rate_limiter),
+                self.scheduler
+            )))
         )
 
+    @contextlib.contextmanager
+    def pinned(self):
+        """Keep a ClientManager from closing this client while background work uses it."""
+        self.pins += 1
+        try:
+            yield self
+        finally:
+            self.pins -= 1
+
     async def __aenter__(self) -> 'ClickUpClient':
         return self
 
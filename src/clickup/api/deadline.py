@@ -0,0 +1,40 @@
+import asyncio
+import math
+
+import httpx
+
+from .. import deadlines
+
+
+class DeadlineTransport(httpx.AsyncBaseTransport):
+    """Fails requests once the tool call's deadline has passed and caps each request's timeouts to what is left.
+
+    The cap covers time spent queued in the scheduler and rate limiter, not only the network.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        remaining = deadlines.remaining()
+        if remaining is None:
+            return await self.transport.handle_async_request(request)
+        if remaining <= 0:
+            raise deadlines.DeadlineExceeded(f"Deadline exceeded before {request.method} {request.url.path}")
+        timeouts = request.extensions.get("timeout") or {}
+        request.extensions = {
+            **request.extensions,
+            "timeout": {
+                key: min(timeouts.get(key) or math.inf, remaining)
+                for key in ("connect", "read", "write", "pool")
+            }
+        }
+        try:
+            return await asyncio.wait_for(self.transport.handle_async_request(request), remaining)
+        except asyncio.TimeoutError:
+            raise deadlines.DeadlineExceeded(
+                f"Deadline exceeded while waiting for {request.method} {request.url.path}"
+            ) from None
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
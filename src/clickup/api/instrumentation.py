@@ -0,0 +1,95 @@
+import time
+
+import httpx
+
+from .. import tracing
+from ..metrics import registry
+
+
+class InstrumentedTransport(httpx.AsyncBaseTransport):
+    """Transport recording call counts, latency, payload sizes and errors per endpoint template."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        stats = registry.endpoint(request.method, request.url.path)
+        stats.calls += 1
+        stats.request_bytes += int(request.headers.get("content-length") or 0)
+        started = time.perf_counter()
+        # The query string can carry search terms and other user data, so spans only keep the path
+        url = str(request.url.copy_with(query=None))
+        with tracing.span("http.request", method=request.method, url=url) as span:
+            try:
+                response = await self.transport.handle_async_request(request)
+                # Every caller reads the whole body anyway; reading it here makes latency include the download
+                await response.aread()
+            except Exception:
+                stats.errors += 1
+                raise
+            finally:
+                stats.latency.observe(time.perf_counter() - started)
+            if span is not None:
+                span.set(status_code=response.status_code, response_bytes=len(response.content))
+        if response.status_code >= 400:
+            stats.errors += 1
+        stats.response_bytes += len(response.content)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class TracingTransport(httpx.AsyncBaseTransport):
+    """Innermost transport: a span per attempt with pool wait and connection phases from httpcore."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not tracing.enabled():
+            return await self.transport.handle_async_request(request)
+        with tracing.span("http.attempt") as span:
+            request.extensions = {**request.extensions, "trace": _PhaseRecorder(span)}
+            response = await self.transport.handle_async_request(request)
+            # The client hands the returned object to the API mixins, so wrapping it traces decoding too
+            traced = _TracedResponse(response.status_code, headers=response.headers, stream=response.stream,
+                                     extensions=response.extensions, request=request)
+            await traced.aread()
+            span.set(status_code=traced.status_code)
+        return traced
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class _TracedResponse(httpx.Response):
+    """A response recording a span whenever its body is decoded as JSON."""
+
+    def json(self, **kwargs):
+        with tracing.span("json.decode", bytes=len(self.content)):
+            return super().json(**kwargs)
+
+
+class _PhaseRecorder:
+    """httpcore `trace` extension turning started/complete event pairs into child spans."""
+
+    def __init__(self, span: tracing.Span):
+        self.span = span
+        self.started: dict[str, float] = {}
+        self.waiting = True
+
+    async def __call__(self, event: str, info: dict) -> None:
+        phase, _, stage = event.rpartition(".")
+        now = time.perf_counter()
+        if self.waiting:
+            # Nothing happens on the wire until the pool hands out a connection
+            self.waiting = False
+            tracing.Span("http.pool_wait", self.span, start=self.span.start).finish(now)
+        if stage == "started":
+            self.started[phase] = now
+        elif phase in self.started:
+            child = tracing.Span(f"http.{phase.split('.')[-1]}", self.span, start=self.started.pop(phase))
+            if stage == "failed":
+                child.error = repr(info.get("exception"))
+            child.finish(now)
@@ -0,0 +1,108 @@
+import asyncio
+import contextlib
+import logging
+import os
+from collections import OrderedDict
+from typing import AsyncIterator, Optional
+
+import httpx
+
+from ..metrics import registry
+from .cache import DiskCache
+from .client import ClickUpClient
+from .recording import Recorder
+
+logger = logging.getLogger("clickup-server")
+
+DEFAULT_MAX_TENANTS = 16
+DEFAULT_POOL_CONNECTIONS = 50
+
+
+class SharedTransport(httpx.AsyncBaseTransport):
+    """Lends one connection pool to many clients; closing a client leaves the pool open."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class ClientManager:
+    """One ClickUpClient per API token, so each tenant keeps its own rate limiter, scheduler and caches.
+
+    All clients send through a single connection pool and share the persistent cache,
+    whose entries are already partitioned per token. Clients not used recently are
+    closed once more than `max_clients` are open; clients with calls in flight or pinned
+    by background work are kept.
+    """
+
+    def __init__(self, max_clients: int = DEFAULT_MAX_TENANTS,
+                 transport: Optional[httpx.AsyncBaseTransport] = None,
+                 recorder: Optional[Recorder] = None):
+        self.max_clients = max_clients
+        self.recorder = recorder
+        if transport is None:
+            limits = httpx.Limits(
+                max_keepalive_connections=10,
+                max_connections=int(os.getenv("CLICKUP_POOL_CONNECTIONS", str(DEFAULT_POOL_CONNECTIONS))),
+                keepalive_expiry=float(os.getenv("CLICKUP_KEEPALIVE_EXPIRY", "120"))
+            )
+            transport = httpx.AsyncHTTPTransport(limits=limits)
+        self.transport = transport
+        cache_dir = os.getenv("CLICKUP_CACHE_DIR", "~/.cache/clickup-mcp")
+        self.disk_cache = DiskCache(cache_dir) if cache_dir else None
+        self._clients: "OrderedDict[str, ClickUpClient]" = OrderedDict()
+        self._active: dict[str, int] = {}
+
+    @classmethod
+    def from_env(cls, **kwargs) -> "ClientManager":
+        return cls(max_clients=int(os.getenv("CLICKUP_MAX_TENANTS", str(DEFAULT_MAX_TENANTS))), **kwargs)
+
+    def get(self, api_key: str) -> ClickUpClient:
+        """Return the token's client, creating it (and evicting idle tenants) as needed."""
+        client = self._clients.get(api_key)
+        if client is None:
+            client = ClickUpClient(api_key, transport=SharedTransport(self.transport), recorder=self.recorder)
+            client.disk_cache = self.disk_cache
+            self._clients[api_key] = client
+            logger.info("Opened client for tenant %s (%d open)", client.cache_namespace, len(self._clients))
+            self._evict()
+        self._clients.move_to_end(api_key)
+        return client
+
+    @contextlib.asynccontextmanager
+    async def lease(self, api_key: str) -> AsyncIterator[ClickUpClient]:
+        """Use a token's client for one call; it is not evicted until the call is done."""
+        client = self.get(api_key)
+        self._active[api_key] = self._active.get(api_key, 0) + 1
+        try:
+            yield client
+        finally:
+            self._active[api_key] -= 1
+            if not self._active[api_key]:
+                del self._active[api_key]
+            self._evict()
+
+    def _evict(self) -> None:
+        for api_key in list(self._clients):
+            if len(self._clients) <= self.max_clients:
+                break
+            if api_key in self._active or self._clients[api_key].pins:
+                continue
+            client = self._clients.pop(api_key)
+            logger.info("Evicted idle tenant %s", client.cache_namespace)
+            asyncio.ensure_future(client.client.aclose())
+        registry.gauges["tenants"] = len(self._clients)
+
+    async def aclose(self) -> None:
+        clients = list(self._clients.values())
+        self._clients.clear()
+        self._active.clear()
+        registry.gauges["tenants"] = 0
+        for client in clients:
+            await client.client.aclose()
+        await self.transport.aclose()
@@ -0,0 +1,123 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import Optional
+
+import httpx
+
+from .. import tracing
+from ..metrics import registry
+from .scheduler import CLASSES, INTERACTIVE
+
+logger = logging.getLogger(__name__)
+
+# Rate-limit priority of each scheduler class, lowest first
+PRIORITIES = {cls: priority for priority, cls in enumerate(CLASSES)}
+
+
+class PriorityLock:
+    """asyncio.Lock handing itself to the waiter with the lowest priority, in arrival order within one."""
+
+    def __init__(self):
+        self.locked = False
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+    async def acquire(self, priority: int = 0) -> None:
+        if not self.locked and not self._waiters:
+            self.locked = True
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Handed over just before the cancellation landed: pass it on
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self.locked = False
+
+
+class RateLimiter:
+    """Token bucket sized to ClickUp's per-token quota (100 requests per minute by default)."""
+
+    def __init__(self, rate: float = 100.0, per: float = 60.0, burst: Optional[float] = None):
+        self.rate = rate / per
+        self.capacity = burst if burst is not None else rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = PriorityLock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, priority: int = 0) -> None:
+        """Wait until a request may be sent; waiters are served by priority, then in arrival order."""
+        await self._lock.acquire(priority)
+        try:
+            self._refill()
+            # A pause_until() after a 429 may drain the bucket again while we sleep
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+        finally:
+            self._lock.release()
+
+    async def pause_until(self, reset_at: float) -> None:
+        """Drain the bucket after a 429 so the next request waits until `reset_at`."""
+        self._refill()
+        self.tokens = min(self.tokens, 1 - max(reset_at - time.time(), 0.0) * self.rate)
+
+
+class RateLimitedTransport(httpx.AsyncBaseTransport):
+    """Transport that spends a rate-limit token per request and retries 429 responses."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, limiter: RateLimiter, max_retries: int = 3):
+        self.transport = transport
+        self.limiter = limiter
+        self.max_retries = max_retries
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(self.max_retries + 1):
+            with tracing.span("ratelimit.wait", attempt=attempt):
+                # Set by SchedulingTransport, so queued bulk requests do not take tokens ahead of interactive ones
+                await self.limiter.acquire(PRIORITIES.get(request.extensions.get("request_class", INTERACTIVE), 0))
+            response = await self.transport.handle_async_request(request)
+            if response.status_code != 429 or attempt == self.max_retries:
+                return response
+            await response.aclose()
+            stats = registry.endpoint(request.method, request.url.path)
+            stats.rate_limited += 1
+            stats.retries += 1
+            delay = _retry_delay(response.headers, attempt)
+            logger.warning("ClickUp rate limit hit for %s, retrying in %.1fs", request.url.path, delay)
+            await self.limiter.pause_until(time.time() + delay)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+def _retry_delay(headers: httpx.Headers, attempt: int) -> float:
+    """Seconds to wait before retrying, from Retry-After or ClickUp's X-RateLimit-Reset."""
+    try:
+        if "retry-after" in headers:
+            return max(float(headers["retry-after"]), 0.0)
+        if "x-ratelimit-reset" in headers:
+            return min(max(float(headers["x-ratelimit-reset"]) - time.time(), 0.0), 60.0)
+    except ValueError:
+        pass
+    return min(2.0 ** attempt, 30.0)
@@ -0,0 +1,169 @@
+import asyncio
+import base64
+import contextvars
+import json
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Any, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Id of the recorded tool call whose handler is running, so HTTP exchanges can be attributed to it
+current_call: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar("current_call", default=None)
+
+REDACTED = "REDACTED"
+SENSITIVE_HEADERS = {"authorization", "cookie", "set-cookie", "x-api-key", "proxy-authorization"}
+# Bodies are stored decoded, so headers describing the wire encoding no longer apply
+ENCODING_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class Recorder:
+    """Append tool calls and the HTTP exchanges they caused to a JSON-lines trace file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8", buffering=1)
+        self._started = time.perf_counter()
+        self._next_call = 0
+        self._write({"type": "session", "started": time.time(), "version": 1})
+
+    def _write(self, record: dict) -> None:
+        line = json.dumps(record, default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def offset(self) -> float:
+        return round(time.perf_counter() - self._started, 6)
+
+    def begin_call(self, tool: str, arguments: dict) -> dict:
+        """Snapshot the arguments before handlers mutate them."""
+        self._next_call += 1
+        return {
+            "type": "call",
+            "id": self._next_call,
+            "tool": tool,
+            "arguments": json.loads(json.dumps(arguments, default=str)),
+            "offset": self.offset()
+        }
+
+    def end_call(self, call: dict, error: Optional[BaseException] = None, response_bytes: int = 0) -> None:
+        call["duration"] = round(self.offset() - call["offset"], 6)
+        call["error"] = f"{type(error).__name__}: {error}" if error else None
+        call["response_bytes"] = response_bytes
+        self._write(call)
+
+    def record_exchange(self, request: httpx.Request, response: httpx.Response, offset: float) -> None:
+        try:
+            request_body = _encode_body(request.content)
+        except httpx.RequestNotRead:
+            # Streamed uploads are not buffered just to record them
+            request_body = None
+        self._write({
+            "type": "http",
+            "call": current_call.get(),
+            "offset": offset,
+            "duration": round(self.offset() - offset, 6),
+            "method": request.method,
+            "url": str(request.url),
+            "request_headers": redact_headers(request.headers),
+            "request_body": request_body,
+            "status": response.status_code,
+            "response_headers": {
+                k: v for k, v in redact_headers(response.headers).items() if k.lower() not in ENCODING_HEADERS
+            },
+            "response_body": _encode_body(response.content)
+        })
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def redact_headers(headers: httpx.Headers) -> dict:
+    return {k: REDACTED if k.lower() in SENSITIVE_HEADERS else v for k, v in headers.items()}
+
+
+def _encode_body(content: bytes) -> Any:
+    if not content:
+        return None
+    try:
+        return content.decode("utf-8")
+    except UnicodeDecodeError:
+        return {"base64": base64.b64encode(content).decode("ascii")}
+
+
+def _decode_body(body: Any) -> bytes:
+    if body is None:
+        return b""
+    if isinstance(body, dict):
+        return base64.b64decode(body["base64"])
+    return body.encode("utf-8")
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Innermost transport writing every request/response pair, including retried ones, to a Recorder."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, recorder: Recorder):
+        self.transport = transport
+        self.recorder = recorder
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        offset = self.recorder.offset()
+        response = await self.transport.handle_async_request(request)
+        await response.aread()
+        try:
+            self.recorder.record_exchange(request, response, offset)
+        except Exception:
+            logger.exception("Could not record %s %s", request.method, request.url)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+def load_trace(path: str) -> list[dict]:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _exchange_key(method: str, url: str) -> tuple[str, str]:
+    parsed = httpx.URL(url)
+    query = sorted(parsed.params.multi_items())
+    return method, str(parsed.copy_with(query=None, fragment=None)) + "?" + "&".join(f"{k}={v}" for k, v in query)
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Serve recorded responses by method and URL, in recorded order, without touching the network.
+
+    Responses are delayed by their recorded duration divided by `speed`; speed 0
+    answers immediately. When a URL was requested more often than recorded, its
+    last response is repeated; URLs never recorded get a 404.
+    """
+
+    def __init__(self, records: list[dict], speed: float = 1.0):
+        self.speed = speed
+        self.unmatched: list[str] = []
+        self._exchanges: dict[tuple[str, str], deque] = defaultdict(deque)
+        self._last: dict[tuple[str, str], dict] = {}
+        for record in sorted((r for r in records if r.get("type") == "http"), key=lambda r: r["offset"]):
+            self._exchanges[_exchange_key(record["method"], record["url"])].append(record)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = _exchange_key(request.method, str(request.url))
+        queue = self._exchanges.get(key)
+        record = queue.popleft() if queue else self._last.get(key)
+        if record is None:
+            self.unmatched.append(f"{request.method} {request.url}")
+            return httpx.Response(404, json={"err": "Not in recorded trace"})
+        self._last[key] = record
+        if self.speed > 0 and record.get("duration"):
+            await asyncio.sleep(record["duration"] / self.speed)
+        return httpx.Response(
+            record["status"],
+            headers=record.get("response_headers") or {},
+            content=_decode_body(record.get("response_body"))
+        )
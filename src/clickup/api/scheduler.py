@@ -0,0 +1,179 @@
+import asyncio
+import contextvars
+import os
+import time
+from collections import Counter, deque
+from typing import Optional
+
+import httpx
+
+from .. import tracing
+from ..metrics import Histogram, current_tool
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+# Highest priority first
+CLASSES = (INTERACTIVE, BULK)
+
+# Tools that fan out into many requests; everything else is interactive
+DEFAULT_BULK_TOOLS = {
+    "get-workspace-tree", "get-tasks-by-id", "get-task-tree", "get-comments-batch",
+    "get-time-entries", "time-report", "upload-task-attachments"
+}
+DEFAULT_MAX_CONCURRENCY = 10
+# Share of the slots bulk work may hold, so interactive calls always find a free one
+DEFAULT_BULK_SHARE = 0.6
+# Grants per round when both classes are waiting
+DEFAULT_WEIGHTS = {INTERACTIVE: 4, BULK: 1}
+
+# Explicit class for the running task, overriding the per-tool default
+request_class: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("request_class", default=None)
+
+
+class Scheduler:
+    """Grants request slots by priority class with weighted fair queuing and per-class/per-tool caps."""
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY, class_limits: Optional[dict] = None,
+                 tool_limits: Optional[dict] = None, weights: Optional[dict] = None,
+                 tool_classes: Optional[dict] = None):
+        self.max_concurrency = max(int(max_concurrency), 1)
+        self.class_limits = {
+            INTERACTIVE: self.max_concurrency,
+            BULK: max(int(self.max_concurrency * DEFAULT_BULK_SHARE), 1),
+            **(class_limits or {})
+        }
+        self.tool_limits = dict(tool_limits or {})
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self.tool_classes = {**{tool: BULK for tool in DEFAULT_BULK_TOOLS}, **(tool_classes or {})}
+        self.active = 0
+        self.active_by_class: Counter = Counter()
+        self.active_by_tool: Counter = Counter()
+        self.queues: dict[str, deque] = {cls: deque() for cls in CLASSES}
+        self.credits = dict(self.weights)
+        self.granted: Counter = Counter()
+        self.wait = {cls: Histogram() for cls in CLASSES}
+
+    @classmethod
+    def from_env(cls) -> "Scheduler":
+        return cls(
+            max_concurrency=int(os.getenv("CLICKUP_MAX_CONCURRENCY", str(DEFAULT_MAX_CONCURRENCY))),
+            class_limits=_parse_pairs(os.getenv("CLICKUP_CLASS_LIMITS"), int),
+            tool_limits=_parse_pairs(os.getenv("CLICKUP_TOOL_LIMITS"), int),
+            weights=_parse_pairs(os.getenv("CLICKUP_CLASS_WEIGHTS"), int),
+            tool_classes=_parse_pairs(os.getenv("CLICKUP_TOOL_CLASSES"), str)
+        )
+
+    def classify(self, tool: Optional[str]) -> str:
+        return request_class.get() or self.tool_classes.get(tool, INTERACTIVE)
+
+    async def acquire(self, tool: Optional[str] = None) -> tuple[str, Optional[str]]:
+        """Wait for a slot; returns the (class, tool) to pass to release()."""
+        tool = tool or current_tool.get()
+        cls = self.classify(tool)
+        started = time.perf_counter()
+        waiter = (asyncio.get_running_loop().create_future(), tool)
+        self.queues[cls].append(waiter)
+        self._dispatch()
+        try:
+            await waiter[0]
+        except asyncio.CancelledError:
+            if waiter[0].done() and not waiter[0].cancelled():
+                # Granted just before the cancellation landed: hand the slot on
+                self.release(cls, tool)
+            elif waiter in self.queues[cls]:
+                self.queues[cls].remove(waiter)
+            raise
+        self.wait[cls].observe(time.perf_counter() - started)
+        return cls, tool
+
+    def release(self, cls: str, tool: Optional[str]) -> None:
+        self.active -= 1
+        self.active_by_class[cls] -= 1
+        self.active_by_tool[tool] -= 1
+        self._dispatch()
+
+    def _eligible(self, cls: str) -> Optional[tuple]:
+        """First waiter of a class that its class and tool caps allow to start."""
+        if self.active_by_class[cls] >= self.class_limits.get(cls, self.max_concurrency):
+            return None
+        for waiter in self.queues[cls]:
+            future, tool = waiter
+            if future.done():
+                continue
+            if tool in self.tool_limits and self.active_by_tool[tool] >= self.tool_limits[tool]:
+                continue
+            return waiter
+        return None
+
+    def _dispatch(self) -> None:
+        while self.active < self.max_concurrency:
+            candidates = [(cls, waiter) for cls in CLASSES if (waiter := self._eligible(cls))]
+            if not candidates:
+                return
+            # Weighted round robin: spend the credits of the highest class that has any, then refill
+            funded = [(cls, waiter) for cls, waiter in candidates if self.credits[cls] > 0]
+            if not funded:
+                self.credits = dict(self.weights)
+                funded = candidates
+            cls, waiter = funded[0]
+            self.credits[cls] -= 1
+            self.queues[cls].remove(waiter)
+            self.active += 1
+            self.active_by_class[cls] += 1
+            self.active_by_tool[waiter[1]] += 1
+            self.granted[cls] += 1
+            waiter[0].set_result(None)
+
+    def snapshot(self) -> dict:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "active": self.active,
+            "classes": {
+                cls: {
+                    "limit": self.class_limits.get(cls),
+                    "active": self.active_by_class[cls],
+                    "queued": sum(1 for future, _ in self.queues[cls] if not future.done()),
+                    "granted": self.granted[cls],
+                    "wait_seconds": self.wait[cls].quantiles()
+                }
+                for cls in CLASSES
+            },
+            "tool_limits": self.tool_limits
+        }
+
+
+class SchedulingTransport(httpx.AsyncBaseTransport):
+    """Holds a scheduler slot from before the rate limiter until the response body is read.
+
+    The request carries its class on to the rate limiter, which hands out tokens in the same priority order.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, scheduler: Scheduler):
+        self.transport = transport
+        self.scheduler = scheduler
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        with tracing.span("scheduler.wait") as span:
+            cls, tool = await self.scheduler.acquire()
+            if span is not None:
+                span.set(request_class=cls)
+        request.extensions = {**request.extensions, "request_class": cls}
+        try:
+            response = await self.transport.handle_async_request(request)
+            await response.aread()
+            return response
+        finally:
+            self.scheduler.release(cls, tool)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+def _parse_pairs(value: Optional[str], cast) -> dict:
+    """Parse "get-tasks=bulk,time-report=2" style settings."""
+    pairs = {}
+    for item in (value or "").split(","):
+        if "=" in item:
+            key, _, raw = item.partition("=")
+            pairs[key.strip()] = cast(raw.strip())
+    return pairs
@@ -0,0 +1,194 @@
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import time
+from typing import Any, Hashable, Optional
+
+from ..metrics import registry
+from .cache import _cache_name
+from .ratelimit import PriorityLock
+
+logger = logging.getLogger(__name__)
+
+# Longest a statement waits for another process's write lock, stalling the event loop meanwhile
+BUSY_TIMEOUT = 0.05
+_SCHEMA = """
+-- Values are JSON; the older `cache` table held pickles and is no longer read
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    expires REAL NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS entries_expires ON entries (namespace, expires);
+CREATE TABLE IF NOT EXISTS buckets (
+    name TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated REAL NOT NULL
+);
+"""
+
+_connections: dict[tuple[int, str], sqlite3.Connection] = {}
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """One connection per process and database; WAL lets the workers read while one of them writes."""
+    path = os.path.expanduser(path)
+    key = (os.getpid(), path)
+    connection = _connections.get(key)
+    if connection is None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # Autocommit mode, transactions are opened explicitly where they matter
+        connection = sqlite3.connect(path, timeout=BUSY_TIMEOUT, isolation_level=None, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(_SCHEMA)
+        _connections[key] = connection
+    return connection
+
+
+def _busy(error: sqlite3.OperationalError) -> bool:
+    return "locked" in str(error) or "busy" in str(error)
+
+
+class SharedCache:
+    """TTLCache backed by SQLite, so every worker process sees the same entries.
+
+    Keys are stored by their repr and values as JSON, so tuples come back as lists.
+    Each client uses its own namespace. When another process holds the write lock for
+    longer than BUSY_TIMEOUT, a lookup misses and a write is skipped rather than
+    stalling the event loop.
+    """
+
+    def __init__(self, path: str, namespace: str, default_ttl: float = 300.0, max_entries: int = 1024):
+        self.db = connect(path)
+        self.namespace = namespace
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self._writes = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        row = self._execute(
+            "SELECT value FROM entries WHERE namespace = ? AND key = ? AND expires > ?",
+            (self.namespace, repr(key), time.time())
+        )
+        registry.record_cache(_cache_name(key), row is not None)
+        return default if row is None else json.loads(row[0])
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.default_ttl if ttl is None else ttl
+        self._execute(
+            "INSERT OR REPLACE INTO entries (namespace, key, expires, value) VALUES (?, ?, ?, ?)",
+            (self.namespace, repr(key), time.time() + ttl, json.dumps(value))
+        )
+        self._writes += 1
+        if self._writes % 64 == 0:
+            self._trim()
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        # DELETE ... RETURNING makes the pop atomic, so a continuation is handed to one worker only
+        row = self._execute(
+            "DELETE FROM entries WHERE namespace = ? AND key = ? RETURNING expires, value",
+            (self.namespace, repr(key))
+        )
+        if row is None or row[0] <= time.time():
+            return default
+        return json.loads(row[1])
+
+    def _execute(self, sql: str, parameters: tuple) -> Optional[tuple]:
+        """First row of a statement, or None when the database stayed locked."""
+        try:
+            return self.db.execute(sql, parameters).fetchone()
+        except sqlite3.OperationalError as e:
+            if not _busy(e):
+                raise
+            logger.debug("Shared cache busy, skipped: %s", sql.split(" ", 1)[0])
+            return None
+
+    def clear(self) -> None:
+        self.db.execute("DELETE FROM entries WHERE namespace = ?", (self.namespace,))
+
+    def _trim(self) -> None:
+        """Drop expired entries, then the ones closest to expiry beyond `max_entries`."""
+        self._execute("DELETE FROM entries WHERE namespace = ? AND expires <= ?", (self.namespace, time.time()))
+        self._execute(
+            "DELETE FROM entries WHERE namespace = ? AND key IN ("
+            "SELECT key FROM entries WHERE namespace = ? ORDER BY expires DESC LIMIT -1 OFFSET ?)",
+            (self.namespace, self.namespace, self.max_entries)
+        )
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self._execute(
+            "SELECT 1 FROM entries WHERE namespace = ? AND key = ? AND expires > ?",
+            (self.namespace, repr(key), time.time())
+        ) is not None
+
+    def __len__(self) -> int:
+        return self.db.execute("SELECT COUNT(*) FROM entries WHERE namespace = ?", (self.namespace,)).fetchone()[0]
+
+
+class SharedRateLimiter:
+    """RateLimiter whose token bucket lives in SQLite, so all worker processes spend one token's quota.
+
+    A request reserves its token up front and then sleeps until the bucket would have
+    refilled, so concurrent processes queue behind each other instead of polling. A bucket
+    locked by another process is retried with asyncio.sleep, never by blocking the loop.
+    """
+
+    def __init__(self, path: str, name: str, rate: float = 100.0, per: float = 60.0,
+                 burst: Optional[float] = None):
+        self.db = connect(path)
+        self.name = name
+        self.rate = rate / per
+        self.capacity = burst if burst is not None else rate
+        # One reservation of this process at a time, so a higher priority request is next in line
+        self._lock = PriorityLock()
+
+    def _update(self, change) -> float:
+        """Refill the bucket, apply `change` to its tokens and return the new level, atomically."""
+        now = time.time()
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            row = self.db.execute("SELECT tokens, updated FROM buckets WHERE name = ?", (self.name,)).fetchone()
+            tokens = self.capacity if row is None else min(self.capacity, row[0] + (now - row[1]) * self.rate)
+            tokens = change(tokens)
+            self.db.execute(
+                "INSERT OR REPLACE INTO buckets (name, tokens, updated) VALUES (?, ?, ?)", (self.name, tokens, now)
+            )
+            self.db.execute("COMMIT")
+        except BaseException:
+            self.db.execute("ROLLBACK")
+            raise
+        return tokens
+
+    async def _reserve(self, change) -> float:
+        delay = 0.005
+        while True:
+            try:
+                return self._update(change)
+            except sqlite3.OperationalError as e:
+                if not _busy(e):
+                    raise
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.2)
+
+    async def acquire(self, priority: int = 0) -> None:
+        await self._lock.acquire(priority)
+        try:
+            tokens = await self._reserve(lambda tokens: tokens - 1)
+            if tokens >= 0:
+                return
+            try:
+                await asyncio.sleep(-tokens / self.rate)
+            except asyncio.CancelledError:
+                # Hand the reservation back to whoever is next, even if cancelled again meanwhile
+                await asyncio.shield(self._reserve(lambda tokens: tokens + 1))
+                raise
+        finally:
+            self._lock.release()
+
+    async def pause_until(self, reset_at: float) -> None:
+        await self._reserve(lambda tokens: min(tokens, 1 - max(reset_at - time.time(), 0.0) * self.rate))
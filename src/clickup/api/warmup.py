@@ -0,0 +1,71 @@
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from .. import tracing
+from ..metrics import registry
+from .scheduler import BULK, request_class
+
+logger = logging.getLogger("clickup-server")
+
+DEFAULT_CONNECTIONS = 2
+DEFAULT_KEEPALIVE_INTERVAL = 50.0
+
+
+async def open_connections(client, count: int = DEFAULT_CONNECTIONS) -> None:
+    """Send `count` concurrent cheap requests, so the pool holds that many connections with DNS and TLS done."""
+    async def ping():
+        response = await client.client.get(f"{client.base_url}/user")
+        response.raise_for_status()
+
+    await asyncio.gather(*(ping() for _ in range(max(count, 1))))
+
+
+async def prefetch(client, team_ids: Optional[list[str]] = None) -> None:
+    """Load the teams and their spaces into the client's cache."""
+    teams = await client.get_teams()
+    wanted = [str(team["id"]) for team in teams if team_ids is None or str(team["id"]) in team_ids]
+    await asyncio.gather(*(client.get_spaces(team_id) for team_id in wanted))
+
+
+async def warm_up(client, connections: int = DEFAULT_CONNECTIONS, team_ids: Optional[list[str]] = None) -> None:
+    """Open connections and prefetch the hierarchy before the first tool call needs them.
+
+    Runs in the background of server start-up as a low priority (bulk) caller; failures are
+    only logged, a cold first call is the worst case.
+    """
+    token = request_class.set(BULK)
+    started = time.perf_counter()
+    try:
+        with client.pinned(), tracing.span("warmup", connections=connections):
+            await open_connections(client, connections)
+            await prefetch(client, team_ids)
+    except Exception as e:
+        logger.warning("Warm-up failed: %s", e)
+        return
+    finally:
+        request_class.reset(token)
+    elapsed = time.perf_counter() - started
+    registry.gauges["warmup_seconds"] = round(elapsed, 6)
+    logger.info("Warmed up %d connection(s) and the team hierarchy in %.2fs", connections, elapsed)
+
+
+async def keep_alive(client, interval: float = DEFAULT_KEEPALIVE_INTERVAL,
+                     connections: int = DEFAULT_CONNECTIONS) -> None:
+    """Ping every `interval` seconds so idle pooled connections are not closed by either side.
+
+    Each round costs `connections` requests of the token's rate limit. The client stays
+    pinned, so a ClientManager never closes it under the pings.
+    """
+    token = request_class.set(BULK)
+    try:
+        with client.pinned():
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    await open_connections(client, connections)
+                except Exception as e:
+                    logger.debug("Keep-alive ping failed: %s", e)
+    finally:
+        request_class.reset(token)
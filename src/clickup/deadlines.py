@@ -0,0 +1,69 @@
+import contextlib
+import contextvars
+import os
+import time
+from typing import Iterator, Optional
+
+DEFAULT_TIMEOUT = 60.0
+# Fan-out tools legitimately run for minutes on large workspaces
+DEFAULT_TOOL_TIMEOUTS = {
+    "get-workspace-tree": 300.0,
+    "get-task-tree": 300.0,
+    "get-tasks-by-id": 120.0,
+    "get-comments-batch": 300.0,
+    "get-time-entries": 300.0,
+    "time-report": 300.0,
+    "upload-task-attachments": 600.0,
+    "wait-for-task-change": 900.0,
+}
+
+# Monotonic time by which the running tool call must finish, if any
+current_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("current_deadline", default=None)
+
+deadline_schema = {
+    "timeout_seconds": {
+        "type": "number",
+        "minimum": 0,
+        "description": "Abort the call, including all ClickUp requests made for it, after this many seconds",
+        "optional": True
+    }
+}
+
+
+class DeadlineExceeded(TimeoutError):
+    pass
+
+
+def tool_timeout(tool: str, arguments: dict) -> Optional[float]:
+    """Pop the timeout argument, falling back to per-tool and global defaults; 0 disables the deadline."""
+    value = arguments.pop("timeout_seconds", None)
+    if value is None:
+        overrides = {}
+        for item in os.getenv("CLICKUP_TOOL_TIMEOUTS", "").split(","):
+            if "=" in item:
+                name, _, seconds = item.partition("=")
+                overrides[name.strip()] = float(seconds)
+        value = overrides.get(tool, DEFAULT_TOOL_TIMEOUTS.get(tool, float(os.getenv("CLICKUP_DEFAULT_TIMEOUT", DEFAULT_TIMEOUT))))
+    value = float(value)
+    return value if value > 0 else None
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the current deadline, None without one."""
+    deadline = current_deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+@contextlib.contextmanager
+def deadline(timeout: Optional[float]) -> Iterator[Optional[float]]:
+    """Set a deadline for the block; an enclosing earlier deadline still wins."""
+    if timeout is None:
+        yield remaining()
+        return
+    at = time.monotonic() + timeout
+    outer = current_deadline.get()
+    token = current_deadline.set(at if outer is None else min(outer, at))
+    try:
+        yield remaining()
+    finally:
+        current_deadline.reset(token)
@@ -0,0 +1,125 @@
+import asyncio
+import contextlib
+import hashlib
+import hmac
+import json
+import logging
+import os
+import time
+from typing import Callable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_PATH = "/webhooks/clickup"
+# Deliveries are small JSON documents; anything larger is refused before it is read
+MAX_BODY_BYTES = 1024 * 1024
+READ_TIMEOUT = 10.0
+
+
+def verify_signature(secret: str, body: bytes, signature: str) -> bool:
+    """ClickUp signs the raw body with HMAC-SHA256 of the webhook's secret, hex encoded in X-Signature."""
+    expected = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature or "")
+
+
+class EventHub:
+    """Hands verified ClickUp webhook events to the tool calls waiting for them."""
+
+    def __init__(self):
+        # Webhook id -> (secret, namespace of the token that registered it, endpoint it delivers to)
+        self.secrets: dict[str, tuple[str, str, str]] = {}
+        self.listening = False
+        self.received = 0
+        self.last_event: Optional[float] = None
+        self._subscribers: list[tuple[Callable[[dict], bool], asyncio.Queue]] = []
+
+    def register(self, webhook_id: str, secret: str, namespace: str, endpoint: Optional[str] = None) -> None:
+        if webhook_id and secret:
+            self.secrets[str(webhook_id)] = (secret, namespace, endpoint or "")
+
+    def available(self, namespace: str) -> bool:
+        """Whether events can arrive at all: an ingestion endpoint runs and the token has a webhook
+        delivering to it, i.e. to the public URL in CLICKUP_WEBHOOK_URL."""
+        public_url = (os.getenv("CLICKUP_WEBHOOK_URL") or "").rstrip("/")
+        return self.listening and bool(public_url) and any(
+            ns == namespace and endpoint.rstrip("/") == public_url for _, ns, endpoint in self.secrets.values()
+        )
+
+    def ingest(self, body: bytes, signature: str) -> int:
+        """Verify and publish one webhook delivery; returns the HTTP status to answer with."""
+        try:
+            event = json.loads(body)
+        except ValueError:
+            return 400
+        if not isinstance(event, dict):
+            return 400
+        registered = self.secrets.get(str(event.get("webhook_id")))
+        if registered is None or not verify_signature(registered[0], body, signature):
+            logger.warning("Rejected webhook delivery for %s", event.get("webhook_id"))
+            return 401
+        self.publish({**event, "namespace": registered[1]})
+        return 200
+
+    def publish(self, event: dict) -> None:
+        self.received += 1
+        self.last_event = time.time()
+        for predicate, queue in list(self._subscribers):
+            if predicate(event):
+                queue.put_nowait(event)
+
+    @contextlib.contextmanager
+    def subscribe(self, predicate: Callable[[dict], bool]) -> Iterator[asyncio.Queue]:
+        """Queue of the published events matching `predicate`, for as long as the block runs.
+
+        Events are queued even while the subscriber is busy elsewhere, so none are missed
+        between two reads.
+        """
+        subscriber = (predicate, asyncio.Queue())
+        self._subscribers.append(subscriber)
+        try:
+            yield subscriber[1]
+        finally:
+            self._subscribers.remove(subscriber)
+
+
+hub = EventHub()
+
+
+async def serve_webhooks(host: str = "127.0.0.1", port: int = 8765) -> asyncio.AbstractServer:
+    """Accept ClickUp webhook deliveries on POST /webhooks/clickup, for servers without the HTTP transport."""
+
+    async def read_request(reader: asyncio.StreamReader) -> int:
+        request_line = await reader.readline()
+        headers = {}
+        while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        parts = request_line.decode("latin-1").split()
+        if len(parts) < 2 or parts[0] != "POST" or parts[1].split("?")[0] != WEBHOOK_PATH:
+            return 404
+        length = int(headers.get("content-length", "0"))
+        if length > MAX_BODY_BYTES:
+            return 413
+        body = await reader.readexactly(length)
+        return hub.ingest(body, headers.get("x-signature", ""))
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            try:
+                status = await asyncio.wait_for(read_request(reader), READ_TIMEOUT)
+            except asyncio.TimeoutError:
+                status = 408
+            except ValueError:
+                status = 400
+            reason = {200: "OK", 400: "Bad Request", 401: "Unauthorized", 404: "Not Found",
+                      408: "Request Timeout", 413: "Payload Too Large"}[status]
+            writer.write(f"HTTP/1.1 {status} {reason}\r\nContent-Length: 0\r\nConnection: close\r\n\r\n".encode())
+            await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    hub.listening = True
+    return server
@@ -0,0 +1,302 @@
+import asyncio
+import contextvars
+import json
+import logging
+import os
+import re
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import IO, Any, Awaitable, Callable, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: claims always succeed, so run one process per job directory
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+# Was running when the server stopped; resumes from its checkpoint
+INTERRUPTED = "interrupted"
+FINISHED = (DONE, FAILED, CANCELLED)
+
+DEFAULT_MAX_JOBS = 2
+# How long job-cancel waits for the process running a job to stop it
+CANCEL_WAIT = 10
+# Ids as start() makes them; ids coming from tool arguments become file names, so nothing else is accepted
+JOB_ID = re.compile(r"[0-9a-f]{12}")
+
+
+@dataclass
+class Job:
+    """A long-running operation; everything but the runtime fields is checkpointed to disk."""
+    id: str
+    kind: str
+    params: dict
+    namespace: str
+    state: str = QUEUED
+    done: int = 0
+    total: Optional[int] = None
+    error: Optional[str] = None
+    created: float = field(default_factory=time.time)
+    updated: float = field(default_factory=time.time)
+    checkpoint: dict = field(default_factory=dict)
+    summary: dict = field(default_factory=dict)
+    # Progress of the current run, for throughput
+    run_started: Optional[float] = field(default=None, repr=False)
+    run_done: int = field(default=0, repr=False)
+
+    def progress(self, done: int, total: Optional[int] = None) -> None:
+        self.done = done
+        if total is not None:
+            self.total = total
+
+    def status(self) -> dict:
+        status = {
+            "id": self.id,
+            "kind": self.kind,
+            "state": self.state,
+            "done": self.done,
+            "total": self.total,
+            "percent": round(100 * self.done / self.total, 1) if self.total else None,
+            "error": self.error,
+            "summary": self.summary
+        }
+        if self.state == RUNNING and self.run_started is not None:
+            elapsed = time.time() - self.run_started
+            rate = (self.done - self.run_done) / elapsed if elapsed > 0 else 0.0
+            status["items_per_second"] = round(rate, 2)
+            if rate > 0 and self.total:
+                status["eta_seconds"] = round((self.total - self.done) / rate, 1)
+        return status
+
+
+Runner = Callable[[Any, Job, "JobEngine"], Awaitable[None]]
+
+
+class JobEngine:
+    """Runs jobs in the background with at most `max_jobs` at a time, checkpointing them to `directory`.
+
+    A runner receives the ClickUp client, its Job and the engine; it reads and updates
+    `job.checkpoint`, calls `engine.save(job)` after each unit of work, and appends
+    results with `engine.write_output(job, items)`. Jobs belong to the token namespace
+    that started them and are only visible to it.
+
+    Worker processes share the directory: a process runs a job only while it holds the
+    job's lock file, and reads jobs it does not run from disk on every lookup.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_jobs: Optional[int] = None):
+        self._directory = directory
+        self.max_jobs = max_jobs or int(os.getenv("CLICKUP_MAX_JOBS", str(DEFAULT_MAX_JOBS)))
+        self.runners: dict[str, Runner] = {}
+        self.jobs: dict[str, Job] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._cancelled: set[str] = set()
+        self._claims: dict[str, IO] = {}
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    @property
+    def directory(self) -> str:
+        if self._directory is None:
+            cache_dir = os.getenv("CLICKUP_CACHE_DIR") or "~/.cache/clickup-mcp"
+            self._directory = os.getenv("CLICKUP_JOB_DIR") or os.path.join(cache_dir, "jobs")
+        return os.path.expanduser(self._directory)
+
+    def register(self, kind: str, runner: Runner) -> None:
+        self.runners[kind] = runner
+
+    def start(self, client, kind: str, params: dict) -> Job:
+        if kind not in self.runners:
+            raise ValueError(f"Unknown job kind: {kind}")
+        job = Job(uuid.uuid4().hex[:12], kind, params, client.cache_namespace)
+        self.jobs[job.id] = job
+        self.save(job)
+        self._spawn(client, job)
+        return job
+
+    def get(self, client, job_id: str) -> Job:
+        if not JOB_ID.fullmatch(str(job_id)):
+            raise ValueError(f"Unknown job: {job_id}")
+        if job_id not in self._tasks:
+            job = self._read(job_id)
+            if job is not None:
+                self.jobs[job_id] = job
+        job = self.jobs.get(job_id)
+        if job is None or job.namespace != client.cache_namespace:
+            raise ValueError(f"Unknown job: {job_id}")
+        return job
+
+    def list_jobs(self, client) -> list[Job]:
+        self._refresh()
+        return sorted((j for j in self.jobs.values() if j.namespace == client.cache_namespace),
+                      key=lambda j: j.created)
+
+    async def cancel(self, client, job_id: str) -> Job:
+        job = self.get(client, job_id)
+        task = self._tasks.get(job_id)
+        if task is not None:
+            self._cancelled.add(job_id)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        elif self._running_elsewhere(job_id):
+            # The process running it stops at its next checkpoint
+            open(self._path(job_id, "cancel"), "w").close()
+            for _ in range(int(CANCEL_WAIT / 0.2)):
+                await asyncio.sleep(0.2)
+                job = self.get(client, job_id)
+                if job.state in FINISHED:
+                    break
+        elif job.state not in FINISHED:
+            job.state = CANCELLED
+            self.save(job)
+        return job
+
+    def resume(self, client) -> list[Job]:
+        """Restart the token's jobs that were cut off by a server restart and no other process runs."""
+        self._refresh()
+        resumed = []
+        for job in list(self.jobs.values()):
+            if (job.namespace != client.cache_namespace or job.state not in (QUEUED, INTERRUPTED)
+                    or job.id in self._tasks or job.kind not in self.runners):
+                continue
+            if self._spawn(client, job):
+                logger.info("Resuming %s job %s at %d/%s", job.kind, job.id, job.done, job.total)
+                resumed.append(job)
+        return resumed
+
+    def save(self, job: Job) -> None:
+        """Write the job atomically, so a crash never leaves a truncated checkpoint behind.
+
+        Runners save after each unit of work, which is also where a cancellation
+        requested by another process takes effect.
+        """
+        if job.state == RUNNING and job.id in self._tasks and os.path.exists(self._path(job.id, "cancel")):
+            os.remove(self._path(job.id, "cancel"))
+            self._cancelled.add(job.id)
+            raise asyncio.CancelledError()
+        job.updated = time.time()
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(job.id, "json")
+        data = {k: v for k, v in asdict(job).items() if k not in ("run_started", "run_done")}
+        with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(f"{path}.tmp", path)
+
+    def write_output(self, job: Job, items: list) -> None:
+        with open(self._path(job.id, "jsonl"), "a", encoding="utf-8") as f:
+            for item in items:
+                f.write(json.dumps(item) + "\n")
+
+    def read_output(self, job: Job, offset: int = 0, limit: int = 100) -> list:
+        try:
+            with open(self._path(job.id, "jsonl"), encoding="utf-8") as f:
+                lines = [line for index, line in enumerate(f) if offset <= index < offset + limit]
+        except FileNotFoundError:
+            return []
+        return [json.loads(line) for line in lines]
+
+    def _spawn(self, client, job: Job) -> bool:
+        if not self._claim(job.id):
+            return False
+        # A fresh context, so the job does not inherit the deadline, trace or tool of the call that started it
+        task = contextvars.Context().run(asyncio.get_running_loop().create_task, self._run(client, job))
+        self._tasks[job.id] = task
+        return True
+
+    async def _run(self, client, job: Job) -> None:
+        # Imported here to keep this module free of the API layer at import time
+        from .api.scheduler import BULK, request_class
+        from .metrics import current_tool
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_jobs)
+        request_class.set(BULK)
+        current_tool.set(f"job:{job.kind}")
+        try:
+            # Pinned until the job ends, so a ClientManager does not close the client under it
+            with client.pinned():
+                async with self._slots:
+                    job.state = RUNNING
+                    job.run_started, job.run_done = time.time(), job.done
+                    self.save(job)
+                    await self.runners[job.kind](client, job, self)
+            job.state = DONE
+        except asyncio.CancelledError:
+            if job.id not in self._cancelled:
+                # Server shutdown: keep the checkpoint and resume on the next start
+                job.state = INTERRUPTED
+                raise
+            job.state = CANCELLED
+        except Exception as e:
+            logger.warning("%s job %s failed: %s", job.kind, job.id, e)
+            job.state, job.error = FAILED, str(e)
+        finally:
+            self._tasks.pop(job.id, None)
+            self._cancelled.discard(job.id)
+            self.save(job)
+            self._release(job.id)
+
+    def _refresh(self) -> None:
+        """Read the jobs this process does not run from disk."""
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return
+        for name in names:
+            job_id, extension = os.path.splitext(name)
+            if extension == ".json" and JOB_ID.fullmatch(job_id) and job_id not in self._tasks:
+                job = self._read(job_id)
+                if job is not None:
+                    self.jobs[job_id] = job
+
+    def _read(self, job_id: str) -> Optional[Job]:
+        try:
+            with open(self._path(job_id, "json"), encoding="utf-8") as f:
+                job = Job(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+        if job.state == RUNNING and not self._running_elsewhere(job_id):
+            # Left behind by a process that stopped; resumes from its checkpoint
+            job.state = INTERRUPTED
+        return job
+
+    def _claim(self, job_id: str) -> bool:
+        """Take the job's lock file; the lock goes away with the process holding it."""
+        if job_id in self._claims:
+            return True
+        os.makedirs(self.directory, exist_ok=True)
+        lock = open(self._path(job_id, "lock"), "a")
+        if fcntl is not None:
+            try:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock.close()
+                return False
+        self._claims[job_id] = lock
+        return True
+
+    def _release(self, job_id: str) -> None:
+        lock = self._claims.pop(job_id, None)
+        if lock is not None:
+            lock.close()
+
+    def _running_elsewhere(self, job_id: str) -> bool:
+        if job_id in self._claims:
+            return False
+        if not self._claim(job_id):
+            return True
+        self._release(job_id)
+        return False
+
+    def _path(self, job_id: str, extension: str) -> str:
+        if not JOB_ID.fullmatch(job_id):
+            raise ValueError(f"Invalid job id: {job_id}")
+        return os.path.join(self.directory, f"{job_id}.{extension}")
+
+
+engine = JobEngine()
@@ -0,0 +1,229 @@
+import asyncio
+import contextvars
+import logging
+import os
+import re
+import time
+from collections import deque
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Name of the MCP tool whose call is currently running, if any
+current_tool: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("current_tool", default=None)
+# Id of the MCP session the running call belongs to, if any
+current_session: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("current_session", default=None)
+# Transport the running call arrived on: "stdio", or "http" for streamable HTTP and SSE, where callers are remote
+current_transport: contextvars.ContextVar[str] = contextvars.ContextVar("current_transport", default="stdio")
+
+QUANTILES = (0.5, 0.95, 0.99)
+_ID_SEGMENT = re.compile(r"^(?!v\d+$).*\d")
+
+
+def endpoint_template(path: str) -> str:
+    """Collapse ids in an API path so /task/86b33a921/comment becomes /task/{id}/comment."""
+    return "/".join("{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/"))
+
+
+class Histogram:
+    """Latency samples over a sliding reservoir, enough for p50/p95/p99 of recent traffic."""
+
+    def __init__(self, size: int = 2048):
+        self.samples = deque(maxlen=size)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.samples.append(value)
+        self.count += 1
+        self.sum += value
+
+    def quantiles(self) -> dict[str, Optional[float]]:
+        ordered = sorted(self.samples)
+        result = {}
+        for q in QUANTILES:
+            value = ordered[min(int(q * len(ordered)), len(ordered) - 1)] if ordered else None
+            result[f"p{int(q * 100)}"] = round(value, 6) if value is not None else None
+        return result
+
+
+class Stats:
+    """Counters kept for one tool or one endpoint template."""
+
+    COUNTERS = (
+        "calls", "errors", "request_bytes", "response_bytes", "transform_seconds",
+        "serialize_seconds", "retries", "rate_limited", "cache_hits", "cache_misses"
+    )
+
+    def __init__(self):
+        for name in self.COUNTERS:
+            setattr(self, name, 0)
+        self.latency = Histogram()
+
+    def snapshot(self) -> dict:
+        data = {name: getattr(self, name) for name in self.COUNTERS}
+        data["transform_seconds"] = round(data["transform_seconds"], 6)
+        data["serialize_seconds"] = round(data["serialize_seconds"], 6)
+        data["latency_seconds"] = {
+            **self.latency.quantiles(),
+            "mean": round(self.latency.sum / self.latency.count, 6) if self.latency.count else None
+        }
+        return data
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.started = time.time()
+        self.tools: dict[str, Stats] = {}
+        self.endpoints: dict[tuple[str, str], Stats] = {}
+        self.caches: dict[str, Stats] = {}
+        self.sessions: dict[str, Stats] = {}
+        self.gauges: dict[str, float] = {}
+        self.loop_lag = Histogram()
+
+    def tool(self, name: Optional[str] = None) -> Optional[Stats]:
+        """Stats of a tool, by default the one whose call is currently running."""
+        name = name or current_tool.get()
+        if name is None:
+            return None
+        return self.tools.setdefault(name, Stats())
+
+    def session(self, session_id: Optional[str] = None) -> Optional[Stats]:
+        """Stats of an MCP session, by default the one whose call is currently running."""
+        session_id = session_id or current_session.get()
+        if session_id is None:
+            return None
+        return self.sessions.setdefault(session_id, Stats())
+
+    def endpoint(self, method: str, path: str) -> Stats:
+        return self.endpoints.setdefault((method, endpoint_template(path)), Stats())
+
+    def record_cache(self, cache: str, hit: bool) -> None:
+        targets = [self.caches.setdefault(cache, Stats()), self.tool()]
+        for stats in filter(None, targets):
+            if hit:
+                stats.cache_hits += 1
+            else:
+                stats.cache_misses += 1
+
+    def snapshot(self, sessions: Optional[list[str]] = None) -> dict:
+        """All metrics; per-session stats only of `sessions` when given."""
+        return {
+            "uptime_seconds": round(time.time() - self.started, 1),
+            "tools": {name: stats.snapshot() for name, stats in sorted(self.tools.items())},
+            "endpoints": {
+                f"{method} {template}": stats.snapshot()
+                for (method, template), stats in sorted(self.endpoints.items())
+            },
+            "caches": {
+                name: {"hits": stats.cache_hits, "misses": stats.cache_misses}
+                for name, stats in sorted(self.caches.items())
+            },
+            "sessions": {name: stats.snapshot() for name, stats in sorted(self._sessions(sessions).items())},
+            "gauges": dict(sorted(self.gauges.items())),
+            "event_loop_lag_seconds": self.loop_lag.quantiles()
+        }
+
+    def prometheus(self, sessions: Optional[list[str]] = None) -> str:
+        """Render all metrics in the Prometheus text exposition format; per-session series only of `sessions` when given."""
+        lines = []
+        groups = [
+            ("tool", {(("tool", name),): stats for name, stats in self.tools.items()}),
+            ("session", {(("session", name),): stats for name, stats in self._sessions(sessions).items()}),
+            ("endpoint", {
+                (("method", method), ("endpoint", template)): stats
+                for (method, template), stats in self.endpoints.items()
+            })
+        ]
+        for prefix, series in groups:
+            for counter in Stats.COUNTERS:
+                metric = f"clickup_{prefix}_{counter}_total"
+                lines.append(f"# TYPE {metric} counter")
+                for labels, stats in sorted(series.items()):
+                    lines.append(f"{metric}{_labels(labels)} {getattr(stats, counter)}")
+            metric = f"clickup_{prefix}_latency_seconds"
+            lines.append(f"# TYPE {metric} summary")
+            for labels, stats in sorted(series.items()):
+                for q, value in zip(QUANTILES, stats.latency.quantiles().values()):
+                    if value is not None:
+                        lines.append(f"{metric}{_labels(labels + (('quantile', str(q)),))} {value}")
+                lines.append(f"{metric}_sum{_labels(labels)} {stats.latency.sum}")
+                lines.append(f"{metric}_count{_labels(labels)} {stats.latency.count}")
+        for kind in ("hits", "misses"):
+            metric = f"clickup_cache_{kind}_total"
+            lines.append(f"# TYPE {metric} counter")
+            for name, stats in sorted(self.caches.items()):
+                lines.append(f"{metric}{_labels((('cache', name),))} {getattr(stats, 'cache_' + kind)}")
+        lines.append("# TYPE clickup_event_loop_lag_seconds summary")
+        for q, value in zip(QUANTILES, self.loop_lag.quantiles().values()):
+            if value is not None:
+                lines.append(f"clickup_event_loop_lag_seconds{_labels((('quantile', str(q)),))} {value}")
+        lines.append(f"clickup_event_loop_lag_seconds_sum {self.loop_lag.sum}")
+        lines.append(f"clickup_event_loop_lag_seconds_count {self.loop_lag.count}")
+        for name, value in sorted(self.gauges.items()):
+            lines.append(f"# TYPE clickup_{name} gauge")
+            lines.append(f"clickup_{name} {value}")
+        return "\n".join(lines) + "\n"
+
+    def _sessions(self, sessions: Optional[list[str]]) -> dict[str, Stats]:
+        if sessions is None:
+            return self.sessions
+        return {name: stats for name, stats in self.sessions.items() if name in sessions}
+
+
+def _labels(pairs: tuple) -> str:
+    escaped = (f'{key}="{str(value).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+               for key, value in pairs)
+    return "{" + ",".join(escaped) + "}"
+
+
+registry = MetricsRegistry()
+
+
+async def monitor_loop_lag(interval: float = 0.1) -> None:
+    """Sample how late the event loop wakes up from a sleep, i.e. how long callbacks blocked it."""
+    loop = asyncio.get_running_loop()
+    while True:
+        started = loop.time()
+        await asyncio.sleep(interval)
+        registry.loop_lag.observe(max(loop.time() - started - interval, 0.0))
+
+
+async def write_metrics_file(path: str, interval: float = 15.0) -> None:
+    """Periodically write the Prometheus exposition to a file, e.g. for node_exporter's textfile collector."""
+    while True:
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(registry.prometheus())
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Could not write metrics file %s: %s", path, e)
+        await asyncio.sleep(interval)
+
+
+async def serve_metrics(host: str = "127.0.0.1", port: int = 9464) -> asyncio.AbstractServer:
+    """Serve GET /metrics in the Prometheus text format on a local port."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = await reader.readline()
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            parts = request_line.decode("latin-1").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?")[0] == "/metrics":
+                status, body = "200 OK", registry.prometheus().encode()
+            else:
+                status, body = "404 Not Found", b"not found\n"
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: text/plain; version=0.0.4\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
@@ -0,0 +1,80 @@
+"""Re-run a trace recorded with CLICKUP_RECORD_FILE against its recorded ClickUp responses.
+
+    python -m clickup.replay trace.jsonl --speed 10
+"""
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from typing import Optional
+
+from .api import ClickUpClient
+from .api.recording import ReplayTransport, load_trace
+from .metrics import registry
+from .server import dispatch_tool
+
+
+async def replay(records: list[dict], speed: float = 1.0, concurrency: Optional[int] = None) -> dict:
+    """Start each recorded call at its original offset divided by `speed` (0: all at once, no delays)."""
+    calls = sorted((r for r in records if r.get("type") == "call"), key=lambda r: r["offset"])
+    transport = ReplayTransport(records, speed)
+    client = ClickUpClient("replay", transport=transport)
+    client.disk_cache = None
+    semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+    registry.reset()
+    mismatches = []
+    started = time.perf_counter()
+
+    async def run(call: dict):
+        if speed > 0:
+            await asyncio.sleep(max(call["offset"] / speed - (time.perf_counter() - started), 0))
+        error = None
+        try:
+            if semaphore:
+                async with semaphore:
+                    await dispatch_tool(client, call["tool"], dict(call["arguments"]))
+            else:
+                await dispatch_tool(client, call["tool"], dict(call["arguments"]))
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        # A call that failed when recorded should fail again, and vice versa
+        if bool(error) != bool(call.get("error")):
+            mismatches.append({"id": call["id"], "tool": call["tool"], "recorded": call.get("error"), "replayed": error})
+
+    try:
+        await asyncio.gather(*(run(call) for call in calls))
+    finally:
+        await client.client.aclose()
+    elapsed = time.perf_counter() - started
+    recorded = (calls[-1]["offset"] + calls[-1].get("duration", 0)) if calls else 0
+    return {
+        "calls": len(calls),
+        "seconds": round(elapsed, 3),
+        "recorded_seconds": round(recorded, 3),
+        "calls_per_second": round(len(calls) / elapsed, 2) if elapsed else None,
+        "unmatched_requests": transport.unmatched,
+        "outcome_mismatches": mismatches,
+        "tools": {
+            name: {key: stats[key] for key in ("calls", "errors", "response_bytes", "latency_seconds")}
+            for name, stats in registry.snapshot()["tools"].items()
+        }
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m clickup.replay", description=__doc__.split("\n")[0])
+    parser.add_argument("trace", help="JSON-lines file written with CLICKUP_RECORD_FILE")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="time compression, e.g. 10 replays ten times faster; 0 sends everything at once")
+    parser.add_argument("--concurrency", type=int, help="cap on tool calls in flight")
+    args = parser.parse_args(argv)
+    logging.getLogger().setLevel(logging.WARNING)
+    result = asyncio.run(replay(load_trace(args.trace), args.speed, args.concurrency))
+    print(json.dumps(result, indent=2))
+    return 1 if result["outcome_mismatches"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
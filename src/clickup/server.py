@@ -1,19 +1,161 @@
 import asyncio
+import json
 import logging
-from typing import Any, Sequence, Optional
+import os
+import time
+from typing import Any, Awaitable, Callable, Sequence, Optional
+from urllib.parse import parse_qs, urlsplit
 from mcp.server import Server
 from mcp.types import TextContent, ImageContent, EmbeddedResource, Tool
 from mcp.server.stdio import stdio_server
 from .tools import get_all_tools, get_tool_handler
-from .api import ClickUpClient
+from .tools.responses import pop_response_budget, apply_response_budget
+from .tools.snapshots import begin_snapshot, current_snapshot, finish_snapshot
+from dotenv import load_dotenv
+from .api import ClickUpClient, ClientManager
+from .api import warmup
+from .api.recording import Recorder, current_call
+from .metrics import current_session, current_tool, current_transport, monitor_loop_lag, registry, serve_metrics, write_metrics_file
+from . import tracing
+from .events import MAX_BODY_BYTES, WEBHOOK_PATH, hub, serve_webhooks
+from .jobs import engine as jobs
+from .deadlines import DeadlineExceeded, deadline, tool_timeout
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("clickup-server")
 
+async def dispatch_tool(client: ClickUpClient, name: str, arguments: Any,
+                        recorder: Optional[Recorder] = None) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+    """Run one tool call with its deadline, response budget, snapshot diff, metrics, tracing and (optionally) recording."""
+    handler = get_tool_handler(name)
+    if not handler:
+        raise ValueError(f"Unknown tool: {name}")
+    arguments = arguments or {}
+    token = current_tool.set(name)
+    call = recorder.begin_call(name, arguments) if recorder else None
+    call_token = current_call.set(call["id"] if call else None)
+    # The call counts towards both the tool and, when served over HTTP/SSE, the session
+    targets = [stats for stats in (registry.tool(name), registry.session()) if stats is not None]
+    request_bytes = len(json.dumps(arguments, default=str).encode("utf-8"))
+    for stats in targets:
+        stats.calls += 1
+        stats.request_bytes += request_bytes
+    started = time.perf_counter()
+    error = None
+    response_bytes = 0
+    try:
+        with tracing.span("tool.call", tool=name), deadline(tool_timeout(name, arguments)) as remaining:
+            limit = pop_response_budget(arguments)
+            snapshot = begin_snapshot(client.cache, name, arguments)
+            snapshot_token = current_snapshot.set(snapshot)
+            try:
+                # MCP cancellation arrives as CancelledError and tears down the handler and its requests alike
+                contents = await asyncio.wait_for(handler(client, arguments), remaining)
+            except asyncio.TimeoutError:
+                raise DeadlineExceeded(f"{name} did not finish within its deadline") from None
+            finally:
+                current_snapshot.reset(snapshot_token)
+            if snapshot is not None:
+                finish_snapshot(snapshot)
+            contents = apply_response_budget(client.cache, contents, limit)
+        response_bytes = sum(
+            len(content.text.encode("utf-8")) for content in contents if isinstance(content, TextContent)
+        )
+        for stats in targets:
+            stats.response_bytes += response_bytes
+        return contents
+    except Exception as e:
+        for stats in targets:
+            stats.errors += 1
+        error = e
+        raise
+    finally:
+        for stats in targets:
+            stats.latency.observe(time.perf_counter() - started)
+        current_tool.reset(token)
+        current_call.reset(call_token)
+        if call:
+            recorder.end_call(call, error, response_bytes)
+
+class SessionTracker:
+    """Live MCP sessions of the HTTP transports: enforces the session limit and expires idle sessions."""
+
+    def __init__(self, max_sessions: int = 32, idle_timeout: float = 3600.0,
+                 on_expire: Optional[Callable[[str], Awaitable[None]]] = None):
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        # Ends an expired session in the transport that serves it
+        self.on_expire = on_expire
+        self.sessions: dict[str, dict] = {}
+        # Sessions being initialized; they count towards the limit before their id is known
+        self.pending = 0
+        self._terminating: set[asyncio.Task] = set()
+
+    def reserve(self) -> bool:
+        self._expire()
+        if len(self.sessions) + self.pending >= self.max_sessions:
+            return False
+        self.pending += 1
+        return True
+
+    def cancel_reservation(self) -> None:
+        self.pending = max(self.pending - 1, 0)
+
+    def open(self, session_id: str, transport: str) -> None:
+        self.cancel_reservation()
+        now = time.monotonic()
+        self.sessions[session_id] = {"transport": transport, "opened": now, "last_seen": now}
+        self._update_gauge()
+        logger.info("Opened %s session %s (%d active)", transport, session_id, len(self.sessions))
+
+    def touch(self, session_id: str) -> bool:
+        """Mark a session as used; False when it is unknown or has expired."""
+        self._expire()
+        session = self.sessions.get(session_id)
+        if session is None:
+            return False
+        session["last_seen"] = time.monotonic()
+        return True
+
+    def close(self, session_id: str) -> None:
+        if self.sessions.pop(session_id, None) is not None:
+            registry.sessions.pop(session_id, None)
+            self._update_gauge()
+            logger.info("Closed session %s (%d active)", session_id, len(self.sessions))
+
+    def _expire(self) -> None:
+        # SSE sessions end with their stream, only request/response sessions can go idle
+        cutoff = time.monotonic() - self.idle_timeout
+        for session_id, session in list(self.sessions.items()):
+            if session["transport"] != "sse" and session["last_seen"] < cutoff:
+                self.close(session_id)
+                logger.info("Session %s expired after %.0fs idle", session_id, self.idle_timeout)
+                if self.on_expire is not None:
+                    task = asyncio.ensure_future(self.on_expire(session_id))
+                    self._terminating.add(task)
+                    task.add_done_callback(self._terminating.discard)
+
+    async def sweep(self, interval: Optional[float] = None) -> None:
+        """Expire idle sessions even when no request arrives to notice them."""
+        interval = interval or min(max(self.idle_timeout / 2, 1.0), 60.0)
+        while True:
+            await asyncio.sleep(interval)
+            self._expire()
+
+    def _update_gauge(self) -> None:
+        registry.gauges["active_sessions"] = len(self.sessions)
+
 class ClickUpServer:
     def __init__(self):
         self.client = None
+        self.clients = None
+        self.default_token = None
+        self.recorder = None
+        self.sessions = SessionTracker(
+            max_sessions=int(os.getenv("CLICKUP_MAX_SESSIONS", "32")),
+            idle_timeout=float(os.getenv("CLICKUP_SESSION_IDLE_TIMEOUT", "3600"))
+        )
         self.app = Server("clickup-server")
         self.setup_handlers()
 
@@ -24,18 +166,93 @@ class ClickUpServer:
 
         @self.app.call_tool() 
         async def call_tool(name: str, arguments: Any) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-            handler = get_tool_handler(name)
-            if not handler:
-                raise ValueError(f"Unknown tool: {name}")
-            return await handler(self.client, arguments)
+            api_key = self.request_token() or self.default_token
+            if not api_key:
+                raise ValueError("No ClickUp token: set CLICKUP_API_TOKEN or send an X-ClickUp-Token header")
+            token = current_session.set(self.current_session_id())
+            transport_token = current_transport.set("http" if self._request() is not None else "stdio")
+            try:
+                async with self.clients.lease(api_key) as client:
+                    return await dispatch_tool(client, name, arguments, self.recorder)
+            finally:
+                current_transport.reset(transport_token)
+                current_session.reset(token)
+
+    def _request(self):
+        try:
+            return getattr(self.app.request_context, "request", None)
+        except LookupError:
+            return None
+
+    def request_token(self) -> Optional[str]:
+        """ClickUp token sent with an HTTP request, letting one server act for many users."""
+        request = self._request()
+        return request.headers.get("x-clickup-token") if request is not None else None
+
+    def current_session_id(self) -> Optional[str]:
+        """Session of the request being handled: the streamable HTTP header or the SSE query parameter."""
+        request = self._request()
+        if request is None:
+            return None
+        return request.headers.get("mcp-session-id") or request.query_params.get("session_id")
 
     async def initialize(self):
-        """Initialize the ClickUp client."""
-        self.client = await ClickUpClient.create()
+        """Initialize the ClickUp clients."""
+        tracing.configure_from_env()
+        record_file = os.getenv("CLICKUP_RECORD_FILE")
+        if record_file:
+            self.recorder = Recorder(record_file)
+            logger.info("Recording tool calls and ClickUp exchanges to %s", record_file)
+        self.clients = ClientManager.from_env(recorder=self.recorder)
+        load_dotenv()
+        self.default_token = os.getenv("CLICKUP_API_TOKEN")
+        if self.default_token:
+            self.client = self.clients.get(self.default_token)
+            resumed = jobs.resume(self.client)
+            if resumed:
+                logger.info("Resumed %d interrupted job(s)", len(resumed))
+            if os.getenv("CLICKUP_WARMUP", "").lower() in ("1", "true", "yes"):
+                self.start_warm_up(self.client)
+        elif os.getenv("CLICKUP_TRANSPORT", "stdio") == "stdio":
+            raise ValueError("CLICKUP_API_TOKEN environment variable not set")
+
+    def start_warm_up(self, client: ClickUpClient):
+        """Open connections and prefetch teams and spaces in the background, then keep the connections alive."""
+        connections = int(os.getenv("CLICKUP_WARMUP_CONNECTIONS", str(warmup.DEFAULT_CONNECTIONS)))
+        teams = os.getenv("CLICKUP_WARMUP_TEAMS")
+        team_ids = [team.strip() for team in teams.split(",") if team.strip()] if teams else None
+        self._warmup_task = asyncio.create_task(warmup.warm_up(client, connections, team_ids))
+        interval = float(os.getenv("CLICKUP_KEEPALIVE_INTERVAL", str(warmup.DEFAULT_KEEPALIVE_INTERVAL)))
+        if interval > 0:
+            self._keepalive_task = asyncio.create_task(warmup.keep_alive(client, interval, connections))
+
+    async def start_metrics_exporters(self):
+        """Sample the event loop lag, and export metrics to a textfile and/or a local /metrics endpoint when configured."""
+        self._lag_task = asyncio.create_task(monitor_loop_lag())
+        metrics_file = os.getenv("CLICKUP_METRICS_FILE")
+        if metrics_file:
+            interval = float(os.getenv("CLICKUP_METRICS_INTERVAL", "15"))
+            self._metrics_task = asyncio.create_task(write_metrics_file(metrics_file, interval))
+        metrics_port = os.getenv("CLICKUP_METRICS_PORT")
+        if metrics_port:
+            self._metrics_server = await serve_metrics(port=int(metrics_port))
+            logger.info("Serving metrics on http://127.0.0.1:%s/metrics", metrics_port)
 
     async def run(self):
         """Run the server."""
         await self.initialize()
+        await self.start_metrics_exporters()
+        transport = os.getenv("CLICKUP_TRANSPORT", "stdio")
+        webhook_port = os.getenv("CLICKUP_WEBHOOK_PORT")
+        if webhook_port:
+            host = os.getenv("CLICKUP_WEBHOOK_HOST", "127.0.0.1")
+            self._webhook_server = await serve_webhooks(host, int(webhook_port))
+            logger.info("Receiving ClickUp webhooks on http://%s:%s%s", host, webhook_port, WEBHOOK_PATH)
+        if transport == "http":
+            await self.run_http(os.getenv("CLICKUP_HOST", "127.0.0.1"), int(os.getenv("CLICKUP_PORT", "8000")))
+            return
+        if transport != "stdio":
+            raise ValueError(f"Unknown transport: {transport}")
         async with stdio_server() as (read_stream, write_stream):
             await self.app.run(
                 read_stream,
@@ -43,10 +260,207 @@ class ClickUpServer:
                 self.app.create_initialization_options()
             )
 
+    async def run_http(self, host: str, port: int):
+        """Serve many MCP sessions from this process: streamable HTTP on /mcp and SSE on /sse.
+
+        Sessions using the same token share its ClickUp client, so its caches,
+        rate limiter and scheduler see their combined load; all tokens share the
+        connection pool.
+        """
+        import uvicorn
+        logger.info("Serving MCP on http://%s:%d/mcp (streamable HTTP) and /sse", host, port)
+        await uvicorn.Server(uvicorn.Config(self.http_app(), host=host, port=port, log_level="info")).serve()
+
+    def http_app(self, worker: bool = False):
+        """Starlette app of the HTTP transports.
+
+        A `worker` is one of several processes behind the same port. Any of them may receive
+        a client's next request, so it serves stateless streamable HTTP only (no SSE) and
+        initializes itself on startup.
+        """
+        import contextlib
+        from starlette.applications import Starlette
+        from starlette.responses import JSONResponse, Response
+        from starlette.routing import Mount, Route
+        from mcp.server.sse import SseServerTransport
+        from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+
+        manager = StreamableHTTPSessionManager(app=self.app, stateless=worker)
+        sse = SseServerTransport("/messages/")
+        sessions = self.sessions
+
+        def error(status: int, message: str) -> JSONResponse:
+            return JSONResponse({"error": message}, status_code=status)
+
+        async def terminate(session_id: str) -> None:
+            """End an expired session in the session manager, as if its client had sent DELETE."""
+            scope = {
+                "type": "http", "http_version": "1.1", "scheme": "http", "method": "DELETE",
+                "path": "/mcp", "raw_path": b"/mcp", "root_path": "", "query_string": b"",
+                "headers": [(b"mcp-session-id", session_id.encode())], "client": None, "server": None
+            }
+
+            async def receive():
+                return {"type": "http.request", "body": b"", "more_body": False}
+
+            async def discard(message):
+                pass
+
+            try:
+                await manager.handle_request(scope, receive, discard)
+            except Exception as e:
+                logger.warning("Could not terminate session %s: %s", session_id, e)
+
+        if not worker:
+            sessions.on_expire = terminate
+
+        async def handle_streamable(scope, receive, send):
+            if worker:
+                await manager.handle_request(scope, receive, send)
+                return
+            headers = dict(scope["headers"])
+            session_id = headers.get(b"mcp-session-id", b"").decode() or None
+            if session_id is not None:
+                if not sessions.touch(session_id):
+                    await error(404, "Unknown or expired session")(scope, receive, send)
+                    return
+                try:
+                    await manager.handle_request(scope, receive, send)
+                finally:
+                    if scope["method"] == "DELETE":
+                        sessions.close(session_id)
+                return
+
+            if not sessions.reserve():
+                await error(503, f"Session limit of {sessions.max_sessions} reached")(scope, receive, send)
+                return
+            opened = False
+
+            async def send_and_register(message):
+                nonlocal opened
+                if not opened and message["type"] == "http.response.start":
+                    new_id = dict(message.get("headers", [])).get(b"mcp-session-id")
+                    if new_id:
+                        sessions.open(new_id.decode(), "streamable-http")
+                        opened = True
+                await send(message)
+
+            try:
+                await manager.handle_request(scope, receive, send_and_register)
+            finally:
+                if not opened:
+                    sessions.cancel_reservation()
+
+        async def handle_sse(scope, receive, send):
+            if not sessions.reserve():
+                await error(503, f"Session limit of {sessions.max_sessions} reached")(scope, receive, send)
+                return
+            session_id = None
+
+            async def send_and_register(message):
+                nonlocal session_id
+                if session_id is None and message["type"] == "http.response.body":
+                    session_id = _endpoint_session_id(message.get("body", b""))
+                    if session_id is not None:
+                        sessions.open(session_id, "sse")
+                await send(message)
+
+            try:
+                async with sse.connect_sse(scope, receive, send_and_register) as (read, write):
+                    await self.app.run(read, write, self.app.create_initialization_options())
+            finally:
+                if session_id is None:
+                    sessions.cancel_reservation()
+                else:
+                    sessions.close(session_id)
+
+        async def handle_webhook(request):
+            body = b""
+            async for chunk in request.stream():
+                body += chunk
+                if len(body) > MAX_BODY_BYTES:
+                    return Response(status_code=413)
+            return Response(status_code=hub.ingest(body, request.headers.get("x-signature", "")))
+
+        async def handle_message(scope, receive, send):
+            session_id = parse_qs(scope.get("query_string", b"").decode()).get("session_id")
+            if session_id:
+                sessions.touch(session_id[0])
+            await sse.handle_post_message(scope, receive, send)
+
+        @contextlib.asynccontextmanager
+        async def lifespan(app):
+            if worker:
+                await self.initialize()
+                self._lag_task = asyncio.create_task(monitor_loop_lag())
+            async with manager.run():
+                sweeper = None if worker else asyncio.create_task(sessions.sweep())
+                try:
+                    yield
+                finally:
+                    if sweeper is not None:
+                        sweeper.cancel()
+
+        routes = [Mount("/mcp", app=handle_streamable)]
+        if not worker:
+            # Waiting calls live in one process, so workers do not take webhook deliveries and poll instead
+            routes += [
+                Route("/sse", endpoint=_ASGIEndpoint(handle_sse), methods=["GET"]),
+                Mount("/messages/", app=handle_message),
+                Route(WEBHOOK_PATH, endpoint=handle_webhook, methods=["POST"])
+            ]
+            hub.listening = True
+        return Starlette(routes=routes, lifespan=lifespan)
+
+class _ASGIEndpoint:
+    """Route serves any non-function endpoint as a raw ASGI app, with the original send."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        await self.app(scope, receive, send)
+
+def _endpoint_session_id(body: bytes) -> Optional[str]:
+    """Session id from the SSE `endpoint` event, whose data is the URL the client posts messages to."""
+    event, data = None, None
+    for line in body.decode("utf-8", "replace").splitlines():
+        name, _, value = line.partition(":")
+        if name == "event":
+            event = value.strip()
+        elif name == "data":
+            data = value.strip()
+    if event != "endpoint" or not data:
+        return None
+    session_id = parse_qs(urlsplit(data).query).get("session_id")
+    return session_id[0] if session_id else None
+
+def create_worker_app():
+    """App factory of one worker process in multi-process mode."""
+    return ClickUpServer().http_app(worker=True)
+
+def run_workers(workers: int, host: str, port: int):
+    """Serve the HTTP transport from several processes, so JSON work of one session no longer stalls the others.
+
+    The workers share the cache and each token's rate limit through one SQLite database.
+    Metrics are kept per worker and the file/port exporters are not started.
+    """
+    import uvicorn
+    if not os.getenv("CLICKUP_SHARED_STATE"):
+        cache_dir = os.path.expanduser(os.getenv("CLICKUP_CACHE_DIR") or "~/.cache/clickup-mcp")
+        os.environ["CLICKUP_SHARED_STATE"] = os.path.join(cache_dir, "shared.sqlite3")
+    logger.info("Serving MCP on http://%s:%d/mcp from %d workers", host, port, workers)
+    uvicorn.run("clickup.server:create_worker_app", factory=True, host=host, port=port, workers=workers,
+                log_level="info")
+
 async def main():
     """Main entry point."""
     server = ClickUpServer()
     await server.run()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    workers = int(os.getenv("CLICKUP_WORKERS", "1"))
+    if os.getenv("CLICKUP_TRANSPORT") == "http" and workers > 1:
+        run_workers(workers, os.getenv("CLICKUP_HOST", "127.0.0.1"), int(os.getenv("CLICKUP_PORT", "8000")))
+    else:
+        asyncio.run(main())
\ No newline at end of file
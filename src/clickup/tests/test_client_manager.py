@@ -0,0 +1,59 @@
+import unittest
+
+import httpx
+
+from clickup.api import ClientManager
+from clickup.metrics import registry
+
+
+class TestClientManager(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        registry.reset()
+        self.seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.seen.append(request.headers["Authorization"])
+            return httpx.Response(200, json={"teams": []})
+
+        self.manager = ClientManager(max_clients=2, transport=httpx.MockTransport(handler))
+
+    async def asyncTearDown(self):
+        await self.manager.aclose()
+
+    async def test_tenants_are_isolated(self):
+        a, b = self.manager.get("token-a"), self.manager.get("token-b")
+        self.assertIs(self.manager.get("token-a"), a)
+        self.assertIsNot(a.rate_limiter, b.rate_limiter)
+        self.assertIsNot(a.cache, b.cache)
+        self.assertNotEqual(a.cache_namespace, b.cache_namespace)
+        self.assertIs(a.disk_cache, b.disk_cache)
+
+        await a.get_teams()
+        await b.get_teams()
+        self.assertEqual(self.seen, ["token-a", "token-b"])
+
+    async def test_least_recently_used_idle_tenant_is_evicted(self):
+        async with self.manager.lease("token-a") as a:
+            self.manager.get("token-b")
+            self.manager.get("token-c")
+            # token-a has a call in flight, so token-b goes instead
+            self.assertIs(self.manager.get("token-a"), a)
+            self.assertNotIn("token-b", self.manager._clients)
+        self.assertEqual(registry.gauges["tenants"], 2)
+
+        # Eviction leaves the shared pool usable for everyone else
+        await self.manager.get("token-c").get_teams()
+        self.assertEqual(self.seen, ["token-c"])
+
+    async def test_pinned_client_outlives_eviction(self):
+        with self.manager.get("token-a").pinned() as a:
+            self.manager.get("token-b")
+            self.manager.get("token-c")
+            self.assertIn("token-a", self.manager._clients)
+            await a.get_teams()
+        self.manager.get("token-d")
+        self.assertNotIn("token-a", self.manager._clients)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import asyncio
+import json
+import unittest
+
+import httpx
+
+from clickup.api import ClickUpClient
+from clickup.server import dispatch_tool
+from clickup.tools.comments import COMMENT_PAGE_SIZE
+
+
+def thread(task_id: str, count: int) -> list[dict]:
+    # Newest first, one comment per second
+    return [{"id": f"{task_id}-{i}", "comment_text": f"#{i}", "date": str(1_000_000 - i * 1000)}
+            for i in range(count)]
+
+
+class TestCommentsBatch(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.requests = []
+        self.threads = {"t1": thread("t1", COMMENT_PAGE_SIZE + 5), "t2": thread("t2", 3)}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            task_id = request.url.path.split("/")[-2]
+            start_id = request.url.params.get("start_id")
+            self.requests.append((task_id, start_id))
+            if task_id not in self.threads:
+                return httpx.Response(404, json={"err": "Task not found"})
+            comments = self.threads[task_id]
+            offset = next((i + 1 for i, c in enumerate(comments) if c["id"] == start_id), 0)
+            return httpx.Response(200, json={"comments": comments[offset:offset + COMMENT_PAGE_SIZE]})
+
+        self.client = ClickUpClient("token", transport=httpx.MockTransport(handler))
+        self.client.disk_cache = None
+
+    async def asyncTearDown(self):
+        await self.client.client.aclose()
+
+    async def test_pagination_follows_the_thread_to_its_start(self):
+        comments = await self.client.get_all_comments("t1")
+        self.assertEqual([c["id"] for c in comments], [c["id"] for c in self.threads["t1"]])
+        self.assertEqual(self.requests, [("t1", None), ("t1", f"t1-{COMMENT_PAGE_SIZE - 1}")])
+
+    async def test_since_stops_at_older_comments(self):
+        comments = await self.client.get_all_comments("t1", since=1_000_000 - 2000)
+        self.assertEqual([c["id"] for c in comments], ["t1-0", "t1-1", "t1-2"])
+        self.assertEqual(len(self.requests), 1)
+
+    async def test_failed_threads_are_reported_per_task(self):
+        contents = await dispatch_tool(self.client, "get-comments-batch",
+                                       {"task_ids": ["t2", "missing", "t2"], "return_mode": "minimal"})
+        threads = json.loads(contents[0].text)
+        self.assertEqual(list(threads), ["t2", "missing"])
+        self.assertEqual([c["id"] for c in threads["t2"]], ["t2-0", "t2-1", "t2-2"])
+        self.assertIn("404", threads["missing"]["error"])
+
+    async def test_cancellation_is_not_reported_as_an_error(self):
+        async def cancelled(task_id, since=None):
+            raise asyncio.CancelledError()
+
+        self.client.get_all_comments = cancelled
+        with self.assertRaises(asyncio.CancelledError):
+            await self.client.get_comments_batch(["t1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import asyncio
+import unittest
+
+import httpx
+
+from clickup.api import ClickUpClient
+from clickup.deadlines import DeadlineExceeded, deadline, tool_timeout
+from clickup.server import dispatch_tool
+from clickup.tools.base import gather_all
+
+
+class TestDeadlines(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.started = 0
+        self.finished = 0
+        self.timeouts = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            self.started += 1
+            self.timeouts.append(request.extensions.get("timeout"))
+            await asyncio.sleep(0.5)
+            self.finished += 1
+            return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[-1]})
+
+        self.client = ClickUpClient("token", transport=httpx.MockTransport(handler))
+        self.client.disk_cache = None
+
+    async def asyncTearDown(self):
+        await self.client.client.aclose()
+
+    def assertSlotsReleased(self):
+        snapshot = self.client.scheduler.snapshot()
+        self.assertEqual(snapshot["active"], 0)
+        self.assertEqual(sum(c["queued"] for c in snapshot["classes"].values()), 0)
+
+    def test_tool_timeout_defaults(self):
+        self.assertEqual(tool_timeout("get-task-details", {}), 60.0)
+        self.assertEqual(tool_timeout("get-workspace-tree", {}), 300.0)
+        arguments = {"timeout_seconds": 0}
+        self.assertIsNone(tool_timeout("get-task-details", arguments))
+        self.assertEqual(arguments, {})
+
+    async def test_deadline_aborts_call_and_caps_request_timeouts(self):
+        with self.assertRaises(DeadlineExceeded):
+            await dispatch_tool(self.client, "get-task-details", {"task_id": "abc1", "timeout_seconds": 0.05})
+        self.assertEqual(self.finished, 0)
+        self.assertLessEqual(self.timeouts[0]["read"], 0.05)
+        self.assertSlotsReleased()
+
+    async def test_nested_deadline_cannot_extend_outer_one(self):
+        with deadline(0.05):
+            with deadline(10) as remaining:
+                self.assertLessEqual(remaining, 0.05)
+
+    async def test_cancellation_stops_fan_out_children(self):
+        task_ids = [f"t{i}" for i in range(30)]
+        call = asyncio.create_task(dispatch_tool(self.client, "get-tasks-by-id", {"task_ids": task_ids, "concurrency": 10}))
+        await asyncio.sleep(0.1)
+        call.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await call
+        started = self.started
+        await asyncio.sleep(0.6)
+        self.assertEqual(self.started, started)
+        self.assertEqual(self.finished, 0)
+        self.assertSlotsReleased()
+
+    async def test_gather_all_cancels_siblings_on_failure(self):
+        sibling = asyncio.create_task(asyncio.sleep(10))
+
+        async def fail():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            await gather_all(sibling, fail())
+        self.assertTrue(sibling.cancelled())
+
+
+if __name__ == '__main__':
+    unittest.main()
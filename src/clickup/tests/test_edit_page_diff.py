@@ -0,0 +1,74 @@
+import unittest
+import json
+
+import httpx
+
+from clickup.api import ClickUpClient
+
+
+class TestEditPageDiff(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.page = {
+            "id": "page1",
+            "name": "Notes",
+            "sub_title": "Weekly",
+            "content": "# Notes\n\nFirst paragraph.\n"
+        }
+        self.requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            if request.method == "GET":
+                return httpx.Response(200, json=self.page)
+            return httpx.Response(200, json={})
+
+        self.client = ClickUpClient("token", transport=httpx.MockTransport(handler))
+
+    async def asyncTearDown(self):
+        await self.client.client.aclose()
+
+    def _put_bodies(self):
+        return [json.loads(r.content) for r in self.requests if r.method == "PUT"]
+
+    async def test_unchanged_content_skips_request(self):
+        result = await self.client.edit_page_diff("ws", "doc", "page1", self.page["content"])
+        self.assertTrue(result["skipped"])
+        self.assertEqual(result["bytes_sent"], 0)
+        self.assertEqual(self._put_bodies(), [])
+
+    async def test_appended_content_uses_append_mode(self):
+        new_content = self.page["content"] + "Second paragraph.\n"
+        result = await self.client.edit_page_diff("ws", "doc", "page1", new_content)
+        self.assertEqual(result["content_edit_mode"], "append")
+        self.assertGreater(result["bytes_saved"], 0)
+        body = self._put_bodies()[0]
+        self.assertEqual(body["content"], "Second paragraph.\n")
+        self.assertNotIn("name", body)
+
+    async def test_diff_is_taken_against_the_page_as_it_is_now(self):
+        await self.client.get_page("ws", "doc", "page1")
+        # Edited elsewhere after it was read
+        self.page["content"] += "Added by someone else.\n"
+        result = await self.client.edit_page_diff("ws", "doc", "page1", self.page["content"] + "Mine.\n")
+        self.assertEqual(result["content_edit_mode"], "append")
+        self.assertEqual(self._put_bodies()[0]["content"], "Mine.\n")
+
+        self.page["content"] = "Rewritten elsewhere.\n"
+        result = await self.client.edit_page_diff("ws", "doc", "page1", "# Notes\n\nFirst paragraph.\n")
+        self.assertFalse(result["skipped"])
+        self.assertEqual(result["content_edit_mode"], "replace")
+
+    async def test_prepended_and_replaced_content(self):
+        result = await self.client.edit_page_diff("ws", "doc", "page1", "Intro\n" + self.page["content"])
+        self.assertEqual(result["content_edit_mode"], "prepend")
+        self.assertEqual(self._put_bodies()[0]["content"], "Intro\n")
+
+        result = await self.client.edit_page_diff("ws", "doc", "page1", "Rewritten", name="Renamed")
+        self.assertEqual(result["content_edit_mode"], "replace")
+        body = self._put_bodies()[1]
+        self.assertEqual(body["content"], "Rewritten")
+        self.assertEqual(body["name"], "Renamed")
+
+
+if __name__ == '__main__':
+    unittest.main()
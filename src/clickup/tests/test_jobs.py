@@ -0,0 +1,164 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import httpx
+
+from clickup.api import ClickUpClient
+from clickup.jobs import INTERRUPTED, JobEngine, RUNNING
+from clickup.server import dispatch_tool
+from clickup.tools import jobs as job_tools
+
+
+class TestJobs(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.requests = []
+        self.gate = None
+        self.created = []
+        self.held, self.release = set(), asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "POST":
+                name = json.loads(request.content)["name"]
+                if name in self.held:
+                    await self.release.wait()
+                self.created.append(name)
+                return httpx.Response(200, json={"id": f"id-{name}"})
+            if self.gate is not None:
+                await self.gate.wait()
+            list_id = request.url.path.split("/")[-2]
+            page = int(request.url.params.get("page", "0"))
+            self.requests.append((list_id, page))
+            tasks = [{"id": f"{list_id}-{page}-{i}"} for i in range(2)]
+            return httpx.Response(200, json={"tasks": tasks, "last_page": page == 1})
+
+        self.client = ClickUpClient("token", transport=httpx.MockTransport(handler))
+        self.client.disk_cache = None
+        self.directory = tempfile.TemporaryDirectory()
+        self.engine = self.new_engine()
+
+    def new_engine(self) -> JobEngine:
+        engine = JobEngine(self.directory.name, max_jobs=1)
+        engine.runners = dict(job_tools.engine.runners)
+        patcher = mock.patch.object(job_tools, "engine", engine)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return engine
+
+    async def asyncTearDown(self):
+        for task in list(self.engine._tasks.values()):
+            task.cancel()
+        await self.client.client.aclose()
+        self.directory.cleanup()
+
+    async def finish(self, job_id: str):
+        task = self.engine._tasks.get(job_id)
+        if task is not None:
+            await task
+
+    async def call(self, name: str, **arguments):
+        contents = await dispatch_tool(self.client, name, arguments)
+        return json.loads(contents[0].text)
+
+    async def test_export_pages_all_lists_into_the_output(self):
+        started = await self.call("job-start", kind="export-tasks", params={"list_ids": ["a", "b"]})
+        await self.finish(started["id"])
+
+        status = await self.call("job-status", job_id=started["id"], results_limit=3, results_offset=2)
+        self.assertEqual((status["state"], status["percent"]), ("done", 100.0))
+        self.assertEqual(status["summary"], {"tasks": 8})
+        self.assertEqual([task["id"] for task in status["results"]], ["a-1-0", "a-1-1", "b-0-0"])
+        self.assertEqual(self.requests, [("a", 0), ("a", 1), ("b", 0), ("b", 1)])
+
+    async def test_interrupted_job_resumes_from_its_checkpoint(self):
+        job = self.engine.start(self.client, "export-tasks", {"list_ids": ["a", "b"]})
+        self.engine._tasks.pop(job.id).cancel()
+        self.engine._release(job.id)
+        # As left behind by a server that stopped after the first list
+        job.state = RUNNING
+        job.checkpoint.update(list_index=1, page=0)
+        job.summary["tasks"] = 4
+        self.engine.save(job)
+
+        self.engine = self.new_engine()
+        self.assertEqual(self.engine.get(self.client, job.id).state, INTERRUPTED)
+        await self.call("job-status")
+        await self.finish(job.id)
+        status = await self.call("job-status", job_id=job.id)
+        self.assertEqual((status["state"], status["summary"]), ("done", {"tasks": 8}))
+        self.assertEqual(self.requests, [("b", 0), ("b", 1)])
+
+    async def test_bulk_create_resumes_without_creating_finished_tasks_again(self):
+        self.held = {"c", "d"}
+        job = self.engine.start(self.client, "bulk-create-tasks",
+                                {"list_id": "l", "tasks": [{"name": name} for name in "abcd"], "concurrency": 4})
+        while len(self.created) < 2:
+            await asyncio.sleep(0.01)
+        # The server stops while c and d are still being created
+        task = self.engine._tasks[job.id]
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        self.assertEqual(self.engine.get(self.client, job.id).checkpoint["done"], [0, 1])
+
+        self.release.set()
+        self.engine = self.new_engine()
+        await self.call("job-status")
+        await self.finish(job.id)
+        status = await self.call("job-status", job_id=job.id, results_limit=10)
+        self.assertEqual(self.created, ["a", "b", "c", "d"])
+        self.assertEqual((status["state"], status["summary"]), ("done", {"created": 4}))
+        self.assertEqual(sorted(line["index"] for line in status["results"]), [0, 1, 2, 3])
+
+    async def test_cancel_stops_a_running_job_and_other_tokens_cannot_see_it(self):
+        self.gate = asyncio.Event()
+        started = await self.call("job-start", kind="export-tasks", params={"list_ids": ["a"]})
+        await asyncio.sleep(0.01)
+        self.assertEqual((await self.call("job-status", job_id=started["id"]))["state"], "running")
+
+        other = ClickUpClient("other-token", transport=httpx.MockTransport(lambda request: httpx.Response(200)))
+        with self.assertRaises(ValueError):
+            self.engine.get(other, started["id"])
+        await other.client.aclose()
+
+        cancelled = await self.call("job-cancel", job_id=started["id"])
+        self.assertEqual(cancelled["state"], "cancelled")
+        self.assertEqual(self.requests, [])
+
+    async def test_worker_processes_share_jobs_without_running_them_twice(self):
+        self.gate = asyncio.Event()
+        started = await self.call("job-start", kind="export-tasks", params={"list_ids": ["a", "b"]})
+        await asyncio.sleep(0.01)
+        # Another worker sees the job but cannot claim it, and cancels it through the job directory
+        worker = JobEngine(self.directory.name)
+        worker.runners = dict(self.engine.runners)
+        self.assertEqual(worker.resume(self.client), [])
+        self.assertEqual(worker.get(self.client, started["id"]).state, "running")
+
+        cancelling = asyncio.create_task(worker.cancel(self.client, started["id"]))
+        await asyncio.sleep(0.01)
+        self.gate.set()
+        self.assertEqual((await cancelling).state, "cancelled")
+        self.assertEqual(self.requests, [("a", 0)])
+
+    async def test_job_ids_cannot_reach_outside_the_job_directory(self):
+        outside = os.path.dirname(self.directory.name)
+        with open(os.path.join(outside, "victim.json"), "w") as f:
+            json.dump({"id": "victim", "kind": "export-tasks", "params": {},
+                       "namespace": self.client.cache_namespace}, f)
+        self.addCleanup(os.remove, os.path.join(outside, "victim.json"))
+        for name in ("job-status", "job-cancel"):
+            with self.assertRaisesRegex(ValueError, "Unknown job"):
+                await dispatch_tool(self.client, name, {"job_id": "../victim"})
+        self.assertFalse(os.path.exists(os.path.join(outside, "victim.lock")))
+        self.assertFalse(os.path.exists(os.path.join(outside, "victim.cancel")))
+
+    async def test_start_validates_params(self):
+        with self.assertRaises(ValueError):
+            await dispatch_tool(self.client, "job-start", {"kind": "bulk-create-tasks", "params": {"list_id": "a"}})
+
+
+if __name__ == "__main__":
+    unittest.main()
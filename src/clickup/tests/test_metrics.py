@@ -0,0 +1,79 @@
+import json
+import os
+import unittest
+from unittest import mock
+
+import httpx
+
+from clickup.api import ClickUpClient
+from clickup.metrics import current_session, current_tool, current_transport, endpoint_template, registry
+from clickup.server import dispatch_tool
+from clickup.tools.base import render
+
+
+class TestMetrics(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        registry.reset()
+        self.responses = [httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(200, json={"id": "abc1"})]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return self.responses.pop(0) if self.responses else httpx.Response(404, json={"err": "missing"})
+
+        self.client = ClickUpClient("token", transport=httpx.MockTransport(handler))
+
+    async def asyncTearDown(self):
+        await self.client.client.aclose()
+
+    def test_endpoint_template_collapses_ids(self):
+        self.assertEqual(endpoint_template("/api/v2/task/86b33a921/comment"), "/api/v2/task/{id}/comment")
+        self.assertEqual(endpoint_template("/api/v3/workspaces/123/docs"), "/api/v3/workspaces/{id}/docs")
+
+    async def test_requests_are_recorded_per_endpoint_and_tool(self):
+        token = current_tool.set("get-task-details")
+        try:
+            await self.client.get_task_details("abc1")
+            await self.client.get_tasks_by_id(["abc1"])
+            with self.assertRaises(httpx.HTTPStatusError):
+                await self.client.get_task_details("zzz9")
+            await render({"id": "abc1"})
+        finally:
+            current_tool.reset(token)
+
+        snapshot = registry.snapshot()
+        endpoint = snapshot["endpoints"]["GET /api/v2/task/{id}"]
+        self.assertEqual(endpoint["calls"], 2)
+        self.assertEqual(endpoint["retries"], 1)
+        self.assertEqual(endpoint["rate_limited"], 1)
+        self.assertEqual(endpoint["errors"], 1)
+        self.assertGreater(endpoint["response_bytes"], 0)
+        tool = snapshot["tools"]["get-task-details"]
+        self.assertEqual((tool["cache_hits"], tool["cache_misses"]), (1, 0))
+        self.assertGreater(tool["serialize_seconds"], 0)
+        self.assertIn('clickup_endpoint_calls_total{method="GET",endpoint="/api/v2/task/{id}"} 2', registry.prometheus())
+
+    async def test_http_callers_only_see_their_own_session_and_cannot_reset(self):
+        registry.session("a").calls += 1
+        registry.session("b").calls += 1
+        tokens = current_transport.set("http"), current_session.set("a")
+        try:
+            contents = await dispatch_tool(self.client, "server-metrics", {})
+            self.assertEqual(list(json.loads(contents[0].text)["sessions"]), ["a"])
+            contents = await dispatch_tool(self.client, "server-metrics", {"format": "prometheus"})
+            self.assertNotIn('session="b"', contents[0].text)
+            with self.assertRaises(ValueError):
+                await dispatch_tool(self.client, "server-metrics", {"reset": True})
+            self.assertIn("b", registry.sessions)
+            with mock.patch.dict(os.environ, {"CLICKUP_METRICS_RESET": "true"}):
+                await dispatch_tool(self.client, "server-metrics", {"reset": True})
+            self.assertEqual(registry.sessions, {})
+        finally:
+            current_session.reset(tokens[1])
+            current_transport.reset(tokens[0])
+
+        registry.session("b").calls += 1
+        contents = await dispatch_tool(self.client, "server-metrics", {})
+        self.assertIn("b", json.loads(contents[0].text)["sessions"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import asyncio
+import time
+import unittest
+
+from clickup.api.ratelimit import PRIORITIES, RateLimiter
+from clickup.api.scheduler import BULK, INTERACTIVE
+
+
+class TestRateLimiter(unittest.IsolatedAsyncioTestCase):
+    async def test_pause_during_the_wait_for_a_token_is_honoured(self):
+        limiter = RateLimiter(rate=10, per=1, burst=1)
+        await limiter.acquire()
+        started = time.monotonic()
+        acquiring = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0.01)
+        # A 429 arrives while the next request waits for its token
+        await limiter.pause_until(time.time() + 0.3)
+        await acquiring
+        self.assertGreater(time.monotonic() - started, 0.25)
+
+    async def test_interactive_requests_get_tokens_before_queued_bulk_ones(self):
+        limiter = RateLimiter(rate=50, per=1, burst=1)
+        await limiter.acquire()
+        order = []
+
+        async def request(name, cls):
+            await limiter.acquire(PRIORITIES[cls])
+            order.append(name)
+
+        bulk = [asyncio.create_task(request(f"bulk-{i}", BULK)) for i in range(3)]
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(request("interactive", INTERACTIVE))
+        await asyncio.gather(*bulk, interactive)
+        # bulk-0 was already waiting for the token when the interactive request arrived
+        self.assertEqual(order, ["bulk-0", "interactive", "bulk-1", "bulk-2"])
+
+    async def test_cancelled_waiters_do_not_hold_up_the_queue(self):
+        limiter = RateLimiter(rate=50, per=1, burst=1)
+        await limiter.acquire()
+        first = asyncio.create_task(limiter.acquire())
+        second = asyncio.create_task(limiter.acquire(PRIORITIES[BULK]))
+        await asyncio.sleep(0)
+        second.cancel()
+        await first
+        await asyncio.wait_for(limiter.acquire(), 1)
+        self.assertFalse(limiter._lock.locked)
+
+
+if __name__ == '__main__':
+    unittest.main()
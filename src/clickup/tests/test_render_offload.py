@@ -0,0 +1,41 @@
+import os
+import unittest
+from unittest import mock
+
+from clickup.metrics import current_tool, registry
+from clickup.tools.base import estimate_size, render
+from clickup.tools.tasks import TaskTransformer
+
+
+class TestRenderOffload(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        registry.reset()
+        self.tasks = {"tasks": [
+            {"id": f"t{i}", "name": f"Task {i}", "status": {"status": "open"}, "assignees": [{"username": "ann"}]}
+            for i in range(50)
+        ]}
+
+    def test_estimate_extrapolates_lists(self):
+        self.assertGreater(estimate_size(self.tasks), 50 * estimate_size(self.tasks["tasks"][0]))
+        self.assertEqual(estimate_size([]), 2)
+
+    async def test_offloaded_render_matches_inline(self):
+        with mock.patch.dict(os.environ, {"CLICKUP_OFFLOAD": "inline"}):
+            inline = await render(self.tasks, TaskTransformer, "minimal")
+        token = current_tool.set("get-tasks")
+        try:
+            with mock.patch.dict(os.environ, {"CLICKUP_OFFLOAD": "thread", "CLICKUP_OFFLOAD_THRESHOLD": "100"}):
+                offloaded = await render(self.tasks, TaskTransformer, "minimal")
+        finally:
+            current_tool.reset(token)
+        self.assertEqual(offloaded[0].text, inline[0].text)
+        self.assertGreater(registry.tools["get-tasks"].serialize_seconds, 0)
+
+    async def test_invalid_policy(self):
+        with mock.patch.dict(os.environ, {"CLICKUP_OFFLOAD": "gpu"}):
+            with self.assertRaises(ValueError):
+                await render({})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import json
+import os
+import tempfile
+import unittest
+
+import httpx
+
+from clickup.api import ClickUpClient
+from clickup.api.recording import Recorder, ReplayTransport, load_trace
+from clickup.replay import replay
+from clickup.server import dispatch_tool
+
+
+class TestRecordReplay(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "trace.jsonl")
+        self.requests = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests += 1
+            if request.url.path.endswith("/missing"):
+                return httpx.Response(404, json={"err": "Task not found"})
+            return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[-1], "name": "Ship it"})
+
+        self.recorder = Recorder(self.path)
+        self.client = ClickUpClient("pk_secret", transport=httpx.MockTransport(handler), recorder=self.recorder)
+        self.client.disk_cache = None
+
+    async def asyncTearDown(self):
+        await self.client.client.aclose()
+        self.recorder.close()
+        self.tmpdir.cleanup()
+
+    async def record_session(self):
+        await dispatch_tool(self.client, "get-task-details", {"task_id": "abc1"}, self.recorder)
+        with self.assertRaises(httpx.HTTPStatusError):
+            await dispatch_tool(self.client, "get-task-details", {"task_id": "missing"}, self.recorder)
+        self.recorder.close()
+        return load_trace(self.path)
+
+    async def test_calls_and_exchanges_are_recorded_without_credentials(self):
+        records = await self.record_session()
+        calls = [r for r in records if r["type"] == "call"]
+        exchanges = [r for r in records if r["type"] == "http"]
+        self.assertEqual([(c["tool"], c["arguments"]) for c in calls], [
+            ("get-task-details", {"task_id": "abc1"}), ("get-task-details", {"task_id": "missing"})
+        ])
+        self.assertIsNone(calls[0]["error"])
+        self.assertIn("HTTPStatusError", calls[1]["error"])
+        self.assertEqual([e["call"] for e in exchanges], [1, 2])
+        self.assertEqual(exchanges[0]["request_headers"]["authorization"], "REDACTED")
+        self.assertNotIn("pk_secret", open(self.path).read())
+
+    async def test_replay_serves_recorded_responses(self):
+        records = await self.record_session()
+        requests_while_recording = self.requests
+
+        result = await replay(records, speed=0)
+        self.assertEqual(self.requests, requests_while_recording)
+        self.assertEqual(result["calls"], 2)
+        self.assertEqual(result["unmatched_requests"], [])
+        self.assertEqual(result["outcome_mismatches"], [])
+        self.assertEqual(result["tools"]["get-task-details"]["errors"], 1)
+
+    async def test_unrecorded_requests_get_404(self):
+        transport = ReplayTransport(await self.record_session(), speed=0)
+        async with httpx.AsyncClient(transport=transport) as client:
+            response = await client.get("https://api.clickup.com/api/v2/task/other")
+            self.assertEqual(response.status_code, 404)
+            response = await client.get("https://api.clickup.com/api/v2/task/abc1")
+            self.assertEqual(json.loads(response.content)["name"], "Ship it")
+        self.assertEqual(transport.unmatched, ["GET https://api.clickup.com/api/v2/task/other"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+
+import httpx
+
+from clickup.api import ClickUpClient
+from clickup.tools.resolver import resolve_task_arguments
+
+
+class TestResolver(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        routes = {
+            "/api/v2/team": {"teams": [{"id": "1", "name": "Acme", "members": [
+                {"user": {"id": 11, "username": "Jane Doe", "email": "jane@acme.io"}},
+                {"user": {"id": 12, "username": "John Smith", "email": "john@acme.io"}}
+            ]}]},
+            "/api/v2/team/1/space": {"spaces": [
+                {"id": "s1", "name": "Eng", "statuses": [{"status": "to do"}, {"status": "in progress"}]},
+                {"id": "s2", "name": "Ops", "statuses": [{"status": "in progress"}]}
+            ]},
+            "/api/v2/space/s1/folder": {"folders": [{"id": "f1", "name": "Sprints", "lists": [
+                {"id": "901", "name": "Sprint 42"}, {"id": "902", "name": "Sprint 43"}
+            ]}]},
+            "/api/v2/space/s1/list": {"lists": [{"id": "903", "name": "Backlog"}]},
+            "/api/v2/space/s2/folder": {"folders": []},
+            "/api/v2/space/s2/list": {"lists": []},
+        }
+        self.calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.calls.append(request.url.path)
+            return httpx.Response(200, json=routes[request.url.path])
+
+        self.client = ClickUpClient("token", transport=httpx.MockTransport(handler))
+
+    async def asyncTearDown(self):
+        await self.client.client.aclose()
+
+    async def test_task_arguments_are_resolved_inline(self):
+        arguments = {"name": "Task", "list": "sprint 42", "assignees": ["jane@acme.io", 12, "john"], "status": "In Progress"}
+        await resolve_task_arguments(self.client, arguments)
+        self.assertEqual(arguments, {"name": "Task", "list_id": "901", "assignees": [11, 12, 12], "status": "in progress"})
+
+        # The index is cached, so further resolutions cost no requests
+        calls = len(self.calls)
+        await resolve_task_arguments(self.client, {"list": "Backlog"})
+        self.assertEqual(len(self.calls), calls)
+
+    async def test_ids_skip_the_index(self):
+        arguments = {"list_id": "901", "assignees": [11]}
+        await resolve_task_arguments(self.client, arguments)
+        self.assertEqual(self.calls, [])
+
+    async def test_ambiguous_and_unknown_names(self):
+        with self.assertRaisesRegex(ValueError, "ambiguous"):
+            await self.client.resolve_id("list", "sprint 4")
+        with self.assertRaisesRegex(ValueError, "No user"):
+            await self.client.resolve_id("user", "nobody at all")
+        arguments = {"list_id": "901", "status": "QA review"}
+        await resolve_task_arguments(self.client, arguments)
+        self.assertEqual(arguments["status"], "QA review")
+
+    async def test_statuses_are_never_fuzzy_matched(self):
+        arguments = {"list_id": "901", "statuses": ["In Prog", "TO DO"]}
+        await resolve_task_arguments(self.client, arguments)
+        self.assertEqual(arguments["statuses"], ["In Prog", "to do"])
+
+        # Lowercase statuses are sent as they are, without walking the workspace
+        self.calls.clear()
+        arguments = {"task_id": "t1", "status": "to d"}
+        await resolve_task_arguments(self.client, arguments)
+        self.assertEqual((arguments["status"], self.calls), ("to d", []))
+
+
+if __name__ == '__main__':
+    unittest.main()
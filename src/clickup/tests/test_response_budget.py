@@ -0,0 +1,80 @@
+import unittest
+import json
+from types import SimpleNamespace
+
+from mcp.types import TextContent
+
+from clickup.api import TTLCache
+from clickup.tools.responses import apply_response_budget, handle_get_continuation, pop_response_budget
+
+
+class TestResponseBudget(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.client = SimpleNamespace(cache=TTLCache())
+        self.tasks = [{"id": str(i), "name": f"Task {i}", "text_content": "x" * 200} for i in range(20)]
+
+    def _contents(self, data):
+        return [TextContent(type="text", text=json.dumps(data, indent=2))]
+
+    async def _collect(self, contents):
+        """Follow continuation tokens until the whole response has been served."""
+        slices = [contents[0].text]
+        while len(contents) > 1:
+            token = json.loads(contents[1].text)["continuation_token"]
+            contents = await handle_get_continuation(self.client, {"continuation_token": token})
+            slices.append(contents[0].text)
+        return slices
+
+    def test_pop_response_budget(self):
+        arguments = {"list_id": "1", "max_bytes": 5000, "max_tokens": 1000}
+        self.assertEqual(pop_response_budget(arguments), 4000)
+        self.assertEqual(arguments, {"list_id": "1"})
+        self.assertIsNone(pop_response_budget({}))
+        for budget in ({"max_bytes": -5}, {"max_bytes": 0}, {"max_tokens": 0}):
+            with self.assertRaises(ValueError):
+                pop_response_budget(budget)
+
+    def test_tool_schemas_are_built_once(self):
+        from clickup.tools import get_all_tools
+        from clickup.tools.tasks import TASK_TOOLS
+        tools = get_all_tools()
+        self.assertEqual(tools, get_all_tools())
+        self.assertEqual(tools[0].inputSchema["properties"]["max_bytes"]["minimum"], 1)
+        self.assertNotIn("max_bytes", TASK_TOOLS[0].inputSchema["properties"])
+        continuation = next(tool for tool in tools if tool.name == "get-continuation")
+        self.assertNotIn("max_bytes", continuation.inputSchema["properties"])
+
+    def test_small_response_is_untouched(self):
+        contents = self._contents(self.tasks[:1])
+        self.assertIs(apply_response_budget(self.client.cache, contents, 10000), contents)
+
+    async def test_list_is_sliced_at_entity_boundaries(self):
+        contents = apply_response_budget(self.client.cache, self._contents(self.tasks), 1500)
+        slices = await self._collect(contents)
+        self.assertGreater(len(slices), 1)
+        for text in slices:
+            self.assertLessEqual(len(text.encode()), 1500)
+        served = [task for text in slices for task in json.loads(text)]
+        self.assertEqual(served, self.tasks)
+
+    async def test_wrapped_list_keeps_other_fields_in_first_slice(self):
+        data = {"tasks": self.tasks, "last_page": True}
+        contents = apply_response_budget(self.client.cache, self._contents(data), 2000)
+        slices = [json.loads(text) for text in await self._collect(contents)]
+        self.assertTrue(slices[0]["last_page"])
+        self.assertEqual([t for s in slices for t in s["tasks"]], self.tasks)
+
+    async def test_oversized_entity_is_split_into_text_chunks(self):
+        page = {"id": "p1", "content": "\n".join(f"line {i}" for i in range(500))}
+        text = json.dumps(page, indent=2)
+        contents = apply_response_budget(self.client.cache, self._contents(page), 1000)
+        slices = await self._collect(contents)
+        self.assertEqual("".join(slices), text)
+
+    async def test_expired_token_is_rejected(self):
+        with self.assertRaises(ValueError):
+            await handle_get_continuation(self.client, {"continuation_token": "missing"})
+
+
+if __name__ == '__main__':
+    unittest.main()
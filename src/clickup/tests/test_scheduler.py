@@ -0,0 +1,73 @@
+import asyncio
+import unittest
+
+from clickup.api.scheduler import BULK, INTERACTIVE, Scheduler, request_class
+
+
+class TestScheduler(unittest.IsolatedAsyncioTestCase):
+    async def test_interactive_waiters_are_served_before_bulk(self):
+        scheduler = Scheduler(max_concurrency=1, class_limits={BULK: 1}, weights={INTERACTIVE: 2, BULK: 1})
+        first = await scheduler.acquire("get-tasks-by-id")
+        order = []
+
+        async def request(tool):
+            slot = await scheduler.acquire(tool)
+            order.append(tool)
+            scheduler.release(*slot)
+
+        tasks = [asyncio.create_task(request(tool)) for tool in ("time-report", "get-task-tree", "get-task", "get-list")]
+        await asyncio.sleep(0)
+        scheduler.release(*first)
+        await asyncio.gather(*tasks)
+        # Two interactive grants per bulk grant, FIFO within a class
+        self.assertEqual(order, ["get-task", "get-list", "time-report", "get-task-tree"])
+
+    async def test_bulk_cap_keeps_slots_free_for_interactive(self):
+        scheduler = Scheduler(max_concurrency=4, class_limits={BULK: 2})
+        bulk = [asyncio.create_task(scheduler.acquire("get-comments-batch")) for _ in range(3)]
+        await asyncio.sleep(0)
+        self.assertEqual(sum(task.done() for task in bulk), 2)
+        self.assertEqual(await scheduler.acquire("get-task"), (INTERACTIVE, "get-task"))
+        token = request_class.set(BULK)
+        try:
+            self.assertEqual(scheduler.classify("get-task"), BULK)
+        finally:
+            request_class.reset(token)
+        bulk[2].cancel()
+
+    async def test_tool_limit_does_not_block_other_tools(self):
+        scheduler = Scheduler(max_concurrency=4, tool_limits={"get-workspace-tree": 1})
+        await scheduler.acquire("get-workspace-tree")
+        blocked = asyncio.create_task(scheduler.acquire("get-workspace-tree"))
+        await asyncio.sleep(0)
+        self.assertFalse(blocked.done())
+        await asyncio.wait_for(scheduler.acquire("get-workspace-tree-other"), 1)
+        blocked.cancel()
+
+    async def test_cancelled_waiters_leave_no_trace(self):
+        scheduler = Scheduler(max_concurrency=1)
+        slot = await scheduler.acquire("get-task")
+        waiter = asyncio.create_task(scheduler.acquire("get-task"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+        self.assertEqual(scheduler.snapshot()["classes"][INTERACTIVE]["queued"], 0)
+        scheduler.release(*slot)
+        self.assertEqual(scheduler.active, 0)
+        await asyncio.wait_for(scheduler.acquire("get-task"), 1)
+
+    async def test_slot_granted_to_a_cancelled_waiter_is_handed_back(self):
+        scheduler = Scheduler(max_concurrency=1)
+        slot = await scheduler.acquire("get-task")
+        waiter = asyncio.create_task(scheduler.acquire("get-task"))
+        await asyncio.sleep(0)
+        scheduler.release(*slot)
+        waiter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+        self.assertEqual(scheduler.active, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
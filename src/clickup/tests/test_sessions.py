@@ -0,0 +1,93 @@
+import asyncio
+import unittest
+from unittest import mock
+
+import httpx
+
+from clickup.events import hub
+from clickup.metrics import current_session, registry
+from clickup.server import ClickUpServer, SessionTracker, _endpoint_session_id
+
+
+class TestSessionTracker(unittest.TestCase):
+    def setUp(self):
+        registry.reset()
+
+    def test_limit_counts_sessions_being_initialized(self):
+        tracker = SessionTracker(max_sessions=2)
+        self.assertTrue(tracker.reserve())
+        self.assertTrue(tracker.reserve())
+        self.assertFalse(tracker.reserve())
+        tracker.open("a", "streamable-http")
+        tracker.cancel_reservation()
+        self.assertTrue(tracker.reserve())
+        self.assertEqual(registry.gauges["active_sessions"], 1)
+
+    def test_idle_sessions_expire_with_their_stats(self):
+        tracker = SessionTracker(idle_timeout=10)
+        with mock.patch("clickup.server.time.monotonic", return_value=100.0):
+            tracker.open("a", "streamable-http")
+            tracker.open("b", "sse")
+        token = current_session.set("a")
+        try:
+            registry.session().calls += 1
+        finally:
+            current_session.reset(token)
+        self.assertIn("a", registry.snapshot()["sessions"])
+
+        with mock.patch("clickup.server.time.monotonic", return_value=111.0):
+            self.assertFalse(tracker.touch("a"))
+            self.assertTrue(tracker.touch("b"))
+        self.assertNotIn("a", registry.snapshot()["sessions"])
+        self.assertEqual(registry.gauges["active_sessions"], 1)
+
+    def test_sse_session_id_comes_from_the_endpoint_event(self):
+        body = b"event: endpoint\r\ndata: /messages/?session_id=4f2a9c\r\n\r\n"
+        self.assertEqual(_endpoint_session_id(body), "4f2a9c")
+        self.assertIsNone(_endpoint_session_id(b"event: message\r\ndata: {\"session_id=1\"}\r\n\r\n"))
+
+
+class TestHttpSessions(unittest.IsolatedAsyncioTestCase):
+    async def post(self, http: httpx.AsyncClient, message: dict, session_id: str = None) -> httpx.Response:
+        headers = {"accept": "application/json, text/event-stream"}
+        if session_id:
+            headers["mcp-session-id"] = session_id
+        return await http.post("/mcp/", json=message, headers=headers)
+
+    async def test_expired_session_is_terminated_in_the_transport(self):
+        registry.reset()
+        server = ClickUpServer()
+        app = server.http_app()
+        self.addCleanup(setattr, hub, "listening", False)
+        initialized = {"jsonrpc": "2.0", "method": "notifications/initialized"}
+        async with app.router.lifespan_context(app), \
+                httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as http:
+            response = await self.post(http, {
+                "jsonrpc": "2.0", "id": 1, "method": "initialize",
+                "params": {"protocolVersion": "2025-03-26", "capabilities": {},
+                           "clientInfo": {"name": "test", "version": "1"}}
+            })
+            session_id = response.headers["mcp-session-id"]
+            self.assertEqual(registry.gauges["active_sessions"], 1)
+            self.assertEqual((await self.post(http, initialized, session_id)).status_code, 202)
+
+            terminated = asyncio.Event()
+            terminate = server.sessions.on_expire
+
+            async def on_expire(expired_id):
+                await terminate(expired_id)
+                terminated.set()
+
+            server.sessions.on_expire = on_expire
+            server.sessions.idle_timeout = 0
+            self.assertEqual((await self.post(http, initialized, session_id)).status_code, 404)
+            await asyncio.wait_for(terminated.wait(), 5)
+            self.assertEqual(registry.gauges["active_sessions"], 0)
+
+            # The session manager no longer knows the session either
+            server.sessions.idle_timeout = 3600
+            server.sessions.open(session_id, "streamable-http")
+            self.assertEqual((await self.post(http, initialized, session_id)).status_code, 404)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import asyncio
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+
+from clickup.api.shared import SharedCache, SharedRateLimiter
+
+
+class TestSharedState(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "shared.sqlite3")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_cache_is_shared_per_namespace(self):
+        a, b = SharedCache(self.path, "tenant-a"), SharedCache(self.path, "tenant-a")
+        other = SharedCache(self.path, "tenant-b")
+        a.set(("task", "abc1", False, None), {"id": "abc1"})
+        self.assertEqual(b.get(("task", "abc1", False, None)), {"id": "abc1"})
+        self.assertIsNone(other.get(("task", "abc1", False, None)))
+
+        a.set(("continuation", "t1"), {"pending": [1]}, ttl=-1)
+        self.assertNotIn(("continuation", "t1"), b)
+        a.set(("continuation", "t2"), {"pending": [2]})
+        self.assertEqual(b.pop(("continuation", "t2")), {"pending": [2]})
+        self.assertIsNone(a.pop(("continuation", "t2")))
+
+    async def test_rate_limit_is_spent_across_limiters(self):
+        a = SharedRateLimiter(self.path, "tenant-a", rate=2, burst=2)
+        b = SharedRateLimiter(self.path, "tenant-a", rate=2, burst=2)
+        await a.acquire()
+        await a.acquire()
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(b.acquire(), 0.05)
+        # The cancelled reservation was handed back
+        self.assertGreater(b._update(lambda tokens: tokens), -0.5)
+        await SharedRateLimiter(self.path, "tenant-b", rate=2, burst=2).acquire()
+
+    async def test_locked_database_never_stalls_the_event_loop(self):
+        cache = SharedCache(self.path, "tenant-a")
+        limiter = SharedRateLimiter(self.path, "tenant-a", rate=10)
+        cache.set(("continuation", "t1"), {"pending": [("entity", {"id": 1})]})
+        # Another process holds the write lock
+        other = sqlite3.connect(self.path, isolation_level=None)
+        other.execute("BEGIN IMMEDIATE")
+        started = time.perf_counter()
+        cache.set(("task", "abc1"), {"id": "abc1"})
+        acquiring = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0.1)
+        self.assertFalse(acquiring.done())
+        self.assertLess(time.perf_counter() - started, 0.5)
+
+        other.execute("COMMIT")
+        other.close()
+        await asyncio.wait_for(acquiring, 1)
+        self.assertIsNone(cache.get(("task", "abc1")))
+        self.assertEqual(cache.pop(("continuation", "t1")), {"pending": [["entity", {"id": 1}]]})
+
+
+if __name__ == "__main__":
+    unittest.main()
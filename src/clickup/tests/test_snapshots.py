@@ -0,0 +1,57 @@
+import json
+import unittest
+
+import httpx
+
+from clickup.api import ClickUpClient
+from clickup.metrics import current_session
+from clickup.server import dispatch_tool
+
+
+class TestSnapshots(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tasks = [{"id": "a1", "name": "One"}, {"id": "b2", "name": "Two"}]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"tasks": self.tasks})
+
+        self.client = ClickUpClient("token", transport=httpx.MockTransport(handler))
+        self.client.disk_cache = None
+
+    async def asyncTearDown(self):
+        await self.client.client.aclose()
+
+    async def call(self, **arguments) -> dict:
+        contents = await dispatch_tool(self.client, "get-tasks", {"list_id": "123", **arguments})
+        return json.loads(contents[0].text)
+
+    async def test_polls_return_only_changes(self):
+        first = await self.call(since_token="")
+        self.assertEqual([task["id"] for task in first["entities"]], ["a1", "b2"])
+
+        self.tasks = [{"id": "a1", "name": "One, renamed"}, {"id": "c3", "name": "Three"}]
+        second = await self.call(since_token=first["snapshot_token"])
+        self.assertEqual([task["id"] for task in second["added"]], ["c3"])
+        self.assertEqual([task["name"] for task in second["changed"]], ["One, renamed"])
+        self.assertEqual(second["removed"], ["b2"])
+        self.assertEqual(second["unchanged"], 0)
+
+        third = await self.call(since_token=second["snapshot_token"])
+        self.assertEqual((third["added"], third["changed"], third["removed"], third["unchanged"]), ([], [], [], 2))
+
+    async def test_tokens_belong_to_their_session_and_query(self):
+        token = current_session.set("session-1")
+        try:
+            first = await self.call(since_token="")
+        finally:
+            current_session.reset(token)
+        with self.assertRaisesRegex(ValueError, "since_token"):
+            await self.call(since_token=first["snapshot_token"])
+
+        first = await self.call(since_token="")
+        with self.assertRaisesRegex(ValueError, "since_token"):
+            await self.call(since_token=first["snapshot_token"], archived=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import unittest
+import os
+import tempfile
+from unittest import mock
+
+import httpx
+
+from clickup.api import ClickUpClient
+from clickup.metrics import current_transport
+
+
+class TestTaskAttachmentUpload(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.bodies = {}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            task_id = request.url.path.split("/")[-2]
+            self.bodies[task_id] = (request.headers["Content-Type"], await request.aread())
+            return httpx.Response(200, json={"id": f"att-{task_id}"})
+
+        self.client = ClickUpClient("token", transport=httpx.MockTransport(handler))
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.paths = []
+        for i, size in enumerate([200 * 1024, 10]):
+            path = os.path.join(self.tmpdir.name, f"file{i}.bin")
+            with open(path, "wb") as f:
+                f.write(bytes([i + 65]) * size)
+            self.paths.append(path)
+        patcher = mock.patch.dict(os.environ, {"CLICKUP_UPLOAD_DIR": self.tmpdir.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def asyncTearDown(self):
+        await self.client.client.aclose()
+        self.tmpdir.cleanup()
+
+    async def test_file_is_streamed_in_chunks_as_multipart(self):
+        chunks = []
+        result = await self.client.upload_task_attachment_file(
+            "t1", self.paths[0], progress=lambda n, size: chunks.append(n)
+        )
+        content_type, body = self.bodies["t1"]
+        self.assertTrue(content_type.startswith("multipart/form-data; boundary="))
+        self.assertIn(b'filename="file0.bin"', body)
+        self.assertEqual(sum(chunks), 200 * 1024)
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(result["bytes"], 200 * 1024)
+        self.assertEqual(result["attachment"], {"id": "att-t1"})
+
+    async def test_multiple_uploads_report_failures_per_file(self):
+        report = await self.client.upload_task_attachments([
+            {"task_id": "t1", "file_path": self.paths[0]},
+            {"task_id": "t2", "file_path": self.paths[1]},
+        ], concurrency=2)
+        self.assertEqual(report["files"], 2)
+        self.assertEqual(report["failed"], 0)
+        self.assertEqual(report["bytes"], 200 * 1024 + 10)
+        self.assertEqual([u["task_id"] for u in report["uploads"]], ["t1", "t2"])
+
+        report = await self.client.upload_task_attachments([
+            {"task_id": "t3", "file_path": "/missing"},
+            {"task_id": "t4", "file_path": self.paths[1]},
+        ])
+        self.assertEqual(report["failed"], 1)
+        self.assertIn("error", report["uploads"][0])
+        self.assertEqual(report["uploads"][1]["attachment"], {"id": "att-t4"})
+        self.assertEqual(report["bytes"], 10)
+
+    async def test_retried_upload_counts_its_progress_once(self):
+        attempts = []
+
+        class StreamingTransport(httpx.AsyncBaseTransport):
+            # Iterates the body like a network transport (MockTransport buffers it), so a retry reads the file again
+            async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+                attempts.append(sum([len(chunk) async for chunk in request.stream]))
+                if len(attempts) == 1:
+                    return httpx.Response(429, headers={"retry-after": "0"})
+                return httpx.Response(200, json={"id": "att-t1"})
+
+        client = ClickUpClient("token", transport=StreamingTransport())
+        report = await client.upload_task_attachments([{"task_id": "t1", "file_path": self.paths[0]}])
+        await client.client.aclose()
+        self.assertEqual(len(attempts), 2)
+        self.assertEqual(report["failed"], 0)
+        self.assertEqual(report["bytes"], 200 * 1024)
+
+    async def test_files_outside_the_upload_directory_are_refused(self):
+        outside = tempfile.NamedTemporaryFile(dir=os.path.dirname(self.tmpdir.name))
+        self.addCleanup(outside.close)
+        link = os.path.join(self.tmpdir.name, "link.bin")
+        os.symlink(outside.name, link)
+        escape = os.path.join(self.tmpdir.name, "..", os.path.basename(outside.name))
+        for file_path in (escape, link, outside.name):
+            with self.assertRaisesRegex(ValueError, "outside the upload directory"):
+                await self.client.upload_task_attachment_file("t1", file_path)
+        self.assertEqual(self.bodies, {})
+
+        report = await self.client.upload_task_attachments([{"task_id": "t1", "file_path": link}])
+        self.assertEqual((report["failed"], report["bytes"]), (1, 0))
+
+    async def test_file_uploads_are_refused_over_http(self):
+        token = current_transport.set("http")
+        try:
+            with self.assertRaisesRegex(ValueError, "stdio"):
+                await self.client.upload_task_attachment_file("t1", self.paths[1])
+        finally:
+            current_transport.reset(token)
+        self.assertEqual(self.bodies, {})
+
+if __name__ == '__main__':
+    unittest.main()
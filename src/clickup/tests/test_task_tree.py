@@ -0,0 +1,82 @@
+import json
+import unittest
+
+import httpx
+
+from clickup.api import ClickUpClient
+from clickup.server import dispatch_tool
+
+
+def subtask(task_id: str, parent: str) -> dict:
+    return {"id": task_id, "name": task_id, "parent": parent}
+
+
+# root -> a -> a1, root -> b; a1 lists root as a subtask again and b also returns a nested grandchild
+TASKS = {
+    "root": {"id": "root", "name": "root", "subtasks": [subtask("a", "root"), subtask("b", "root"),
+                                                        subtask("a1", "a")]},
+    "a": {"id": "a", "name": "a", "subtasks": [subtask("a1", "a")]},
+    "b": {"id": "b", "name": "b", "subtasks": []},
+    "a1": {"id": "a1", "name": "a1", "subtasks": [subtask("root", "a1")]},
+}
+
+
+class TestTaskTree(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            task_id = request.url.path.split("/")[-1]
+            include_subtasks = request.url.params.get("include_subtasks") == "true"
+            self.requests.append((task_id, include_subtasks))
+            task = TASKS[task_id]
+            return httpx.Response(200, json=task if include_subtasks else {k: v for k, v in task.items()
+                                                                          if k != "subtasks"})
+
+        self.client = ClickUpClient("token", transport=httpx.MockTransport(handler))
+        self.client.disk_cache = None
+
+    async def asyncTearDown(self):
+        await self.client.client.aclose()
+
+    async def call(self, **arguments):
+        contents = await dispatch_tool(self.client, "get-task-tree", arguments)
+        return json.loads(contents[0].text)
+
+    async def test_tree_is_assembled_level_by_level(self):
+        result = await self.call(task_id="root", return_mode="minimal")
+        tree = result["tree"]
+        self.assertEqual(tree["id"], "root")
+        self.assertEqual([child["id"] for child in tree["subtasks"]], ["a", "b"])
+        self.assertEqual([child["id"] for child in tree["subtasks"][0]["subtasks"]], ["a1"])
+        self.assertNotIn("subtasks", tree["subtasks"][1])
+        self.assertEqual((result["nodes"], result["depth"], result["truncated"], result["cycles"]),
+                         (4, 3, False, ["root"]))
+
+    async def test_depth_and_node_budgets_truncate_the_tree(self):
+        result = await self.call(task_id="root", max_depth=1)
+        self.assertEqual([child["id"] for child in result["tree"]["subtasks"]], ["a", "b"])
+        self.assertTrue(result["truncated"])
+        self.assertEqual(self.requests, [("root", True)])
+
+        result = await self.call(task_id="root", max_nodes=2)
+        self.assertEqual([child["id"] for child in result["tree"]["subtasks"]], ["a"])
+        self.assertTrue(result["truncated"])
+
+    async def test_plain_details_and_subtask_fetches_are_cached_apart(self):
+        plain = await self.client.get_task_details("a")
+        cached = await self.client.get_tasks_by_id(["a"])
+        self.assertEqual(cached, [plain])
+
+        await self.call(task_id="root")
+        (task,) = await self.client.get_tasks_by_id(["a"])
+        self.assertNotIn("subtasks", task)
+        self.assertEqual(self.requests.count(("a", False)), 1)
+
+        self.client._evict_task("a", TASKS["a"])
+        await self.client.get_tasks_by_id(["a"])
+        self.assertEqual(self.requests.count(("a", False)), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+
+import httpx
+
+from clickup.api import ClickUpClient
+
+
+class TestTasksById(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            task_id = request.url.path.split("/")[-1]
+            self.requests.append((request.method, task_id))
+            if task_id == "missing":
+                return httpx.Response(404, json={"err": "Task not found"})
+            if request.method == "PUT":
+                return httpx.Response(200, json={"id": task_id, "custom_id": "ENG-1", "team_id": "9001", "name": "New"})
+            return httpx.Response(200, json={"id": "abc1" if task_id == "ENG-1" else task_id,
+                                             "custom_id": "ENG-1", "team_id": "9001", "name": "Old"})
+
+        self.client = ClickUpClient("token", transport=httpx.MockTransport(handler))
+        self.client.disk_cache = None
+
+    async def asyncTearDown(self):
+        await self.client.client.aclose()
+
+    async def test_ids_are_deduplicated_and_served_from_cache(self):
+        await self.client.get_task_details("t1")
+        tasks = await self.client.get_tasks_by_id(["t1", "t2", "t2", "t3"])
+        self.assertEqual([task["id"] for task in tasks], ["t1", "t2", "t3"])
+        self.assertEqual(self.requests, [("GET", "t1"), ("GET", "t2"), ("GET", "t3")])
+
+        await self.client.get_tasks_by_id(["t1"], refresh=True)
+        self.assertEqual(self.requests[-1], ("GET", "t1"))
+
+    async def test_failed_lookups_are_reported_per_id(self):
+        tasks = await self.client.get_tasks_by_id(["t1", "missing"])
+        self.assertEqual(tasks[0]["id"], "t1")
+        self.assertEqual(tasks[1]["id"], "missing")
+        self.assertIn("404", tasks[1]["error"])
+        with self.assertRaises(ValueError):
+            await self.client.get_tasks_by_id(["ENG-1"], custom_task_ids=True)
+
+    async def test_update_evicts_the_task_under_both_ids(self):
+        await self.client.get_tasks_by_id(["ENG-1"], custom_task_ids=True, team_id="9001")
+        await self.client.update_task("abc1", name="New")
+        requests = len(self.requests)
+        (by_id,) = await self.client.get_tasks_by_id(["abc1"])
+        (by_custom_id,) = await self.client.get_tasks_by_id(["ENG-1"], custom_task_ids=True, team_id="9001")
+        self.assertEqual(len(self.requests), requests + 2)
+        self.assertEqual((by_custom_id["id"], by_id["id"]), ("abc1", "abc1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
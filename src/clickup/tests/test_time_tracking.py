@@ -0,0 +1,115 @@
+import unittest
+import tempfile
+import time
+
+import httpx
+
+from clickup.api import ClickUpClient, DiskCache
+from clickup.tools.time_tracking import DAY_MS, split_time_range, summarize_time_entries, time_partitions
+
+# 2024-01-01T00:00:00Z, a Monday
+JAN_1 = 1704067200000
+
+
+def make_entry(entry_id, day, hours, user="alice", tags=(), billable=False, task="Build"):
+    start = JAN_1 + day * DAY_MS + 9 * 3_600_000
+    return {
+        "id": entry_id,
+        "task": {"id": f"t-{task}", "name": task},
+        "user": {"id": 1, "username": user},
+        "billable": billable,
+        "start": str(start),
+        "duration": str(int(hours * 3_600_000)),
+        "tags": [{"name": tag} for tag in tags]
+    }
+
+
+class TestTimeReport(unittest.TestCase):
+    def setUp(self):
+        self.entries = [
+            make_entry("1", 0, 2, tags=["dev"], billable=True),
+            make_entry("2", 0, 1, user="bob", tags=["dev", "review"]),
+            make_entry("3", 8, 3, task="Test"),
+        ]
+
+    def test_split_time_range_covers_range_without_overlap(self):
+        windows = split_time_range(JAN_1, JAN_1 + 10 * DAY_MS - 1, 7 * DAY_MS)
+        self.assertEqual(windows, [
+            (JAN_1, JAN_1 + 7 * DAY_MS - 1),
+            (JAN_1 + 7 * DAY_MS, JAN_1 + 10 * DAY_MS - 1)
+        ])
+
+    def test_group_by_user_and_week(self):
+        report = summarize_time_entries(self.entries, ["user", "week"])
+        self.assertEqual(report["total_hours"], 6)
+        groups = {(g["user"], g["week"]): g["hours"] for g in report["groups"]}
+        self.assertEqual(groups, {("alice", "2024-W01"): 2, ("bob", "2024-W01"): 1, ("alice", "2024-W02"): 3})
+
+    def test_entries_count_towards_each_tag(self):
+        report = summarize_time_entries(self.entries, ["tag"])
+        groups = {g["tag"]: g["hours"] for g in report["groups"]}
+        self.assertEqual(groups, {"dev": 3, "review": 1, "(no tag)": 3})
+
+    def test_invalid_group_by(self):
+        with self.assertRaises(ValueError):
+            summarize_time_entries(self.entries, ["project"])
+
+
+class TestWindowedTimeEntries(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.entries = [make_entry(str(day), day, 1) for day in range(14)]
+        self.calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            start = int(request.url.params["start_date"])
+            end = int(request.url.params["end_date"])
+            self.calls.append((start, end))
+            # Return one entry from the previous window too, as overlapping filters would
+            data = [e for e in self.entries if start - DAY_MS <= int(e["start"]) <= end]
+            return httpx.Response(200, json={"data": data})
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.client = ClickUpClient("token", transport=httpx.MockTransport(handler))
+        self.client.disk_cache = DiskCache(self.tmpdir.name)
+
+    async def asyncTearDown(self):
+        await self.client.client.aclose()
+        self.tmpdir.cleanup()
+
+    def test_week_partitions_start_on_monday(self):
+        partitions = time_partitions(JAN_1 + 2 * DAY_MS, JAN_1 + 8 * DAY_MS, "week")
+        self.assertEqual([(label, start) for label, start, _ in partitions], [
+            ("2024-W01", JAN_1),
+            ("2024-W02", JAN_1 + 7 * DAY_MS)
+        ])
+
+    async def test_windows_are_fetched_and_deduplicated(self):
+        result = await self.client.get_time_entries_windowed("team", JAN_1, JAN_1 + 14 * DAY_MS - 1, window_days=3)
+        self.assertEqual(len(self.calls), 5)
+        self.assertEqual([e["id"] for e in result], [str(day) for day in range(14)])
+
+    async def test_closed_partitions_are_served_from_disk(self):
+        await self.client.get_time_entries_windowed("team", JAN_1, JAN_1 + 14 * DAY_MS - 1)
+        self.calls.clear()
+
+        stats = {}
+        result = await self.client.get_time_entries_windowed(
+            "team", JAN_1 + 2 * DAY_MS, JAN_1 + 5 * DAY_MS - 1, fetch_stats=stats
+        )
+        self.assertEqual(self.calls, [])
+        self.assertEqual(stats["cached_partitions"], 3)
+        self.assertEqual([e["id"] for e in result], ["2", "3", "4"])
+
+        # A different filter set is a separate partition namespace
+        await self.client.get_time_entries_windowed("team", JAN_1, JAN_1 + DAY_MS - 1, assignee="7")
+        self.assertEqual(len(self.calls), 1)
+
+    async def test_open_partitions_are_always_refetched(self):
+        today = int(time.time() * 1000) // DAY_MS * DAY_MS
+        for _ in range(2):
+            await self.client.get_time_entries_windowed("team", today - DAY_MS, today + DAY_MS - 1)
+        self.assertEqual(len(self.calls), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
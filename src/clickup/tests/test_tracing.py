@@ -0,0 +1,89 @@
+import json
+import os
+import tempfile
+import unittest
+
+import httpx
+
+from clickup import tracing
+from clickup.api import ClickUpClient
+from clickup.tools.base import render
+from clickup.tools.tasks import TaskTransformer
+
+
+class ListExporter:
+    def __init__(self):
+        self.spans = []
+
+    def export(self, span):
+        self.spans.append(span)
+
+
+class TestTracing(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.exporter = ListExporter()
+        tracing.add_exporter(self.exporter)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[-1], "name": "Task"})
+
+        self.client = ClickUpClient("token", transport=httpx.MockTransport(handler))
+
+    async def asyncTearDown(self):
+        tracing.remove_exporter(self.exporter)
+        await self.client.client.aclose()
+
+    def by_name(self, name):
+        return [span for span in self.exporter.spans if span.name == name]
+
+    async def test_fan_out_and_render_share_the_call_trace(self):
+        with tracing.span("tool.call", tool="get-tasks-by-id") as root:
+            tasks = await self.client.get_tasks_by_id(["a1", "b2"], concurrency=2)
+            await render(tasks, TaskTransformer, "minimal")
+
+        self.assertEqual({span.trace_id for span in self.exporter.spans}, {root.trace_id})
+        requests = self.by_name("http.request")
+        self.assertEqual(len(requests), 2)
+        self.assertTrue(all(span.parent_id == root.span_id for span in requests))
+        request_ids = {span.span_id for span in requests}
+        self.assertTrue(all(span.parent_id in request_ids for span in self.by_name("http.attempt")))
+        self.assertEqual(len(self.by_name("json.decode")), 2)
+        self.assertEqual(tasks[0]["id"], "a1")
+        self.assertEqual([span.parent_id for span in self.by_name("transform")], [root.span_id])
+        self.assertGreater(self.by_name("serialize")[0].attributes["bytes"], 0)
+
+    async def test_request_spans_leave_out_the_query_string(self):
+        await self.client.get_task_details("a1", include_subtasks=True)
+        (request,) = self.by_name("http.request")
+        self.assertEqual(request.attributes["url"], "https://api.clickup.com/api/v2/task/a1")
+
+    def test_errors_are_recorded_and_spans_are_noops_without_exporters(self):
+        with self.assertRaises(ValueError):
+            with tracing.span("tool.call"):
+                raise ValueError("boom")
+        self.assertEqual(self.exporter.spans[0].error, "ValueError: boom")
+
+        tracing.remove_exporter(self.exporter)
+        with tracing.span("tool.call") as span:
+            self.assertIsNone(span)
+
+    def test_json_lines_exporter(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            exporter = tracing.JsonLinesExporter(os.path.join(tmpdir, "trace.jsonl"))
+            tracing.add_exporter(exporter)
+            try:
+                with tracing.span("tool.call", tool="get-teams"):
+                    with tracing.span("serialize"):
+                        pass
+            finally:
+                tracing.remove_exporter(exporter)
+                exporter.close()
+            with open(exporter.path) as f:
+                lines = [json.loads(line) for line in f]
+        self.assertEqual([line["name"] for line in lines], ["serialize", "tool.call"])
+        self.assertEqual(lines[0]["parent_id"], lines[1]["span_id"])
+        self.assertEqual(lines[1]["attributes"], {"tool": "get-teams"})
+
+
+if __name__ == '__main__':
+    unittest.main()
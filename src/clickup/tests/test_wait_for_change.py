@@ -0,0 +1,144 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+import unittest
+from unittest import mock
+
+import httpx
+
+from clickup.api import ClickUpClient
+from clickup.events import MAX_BODY_BYTES, hub, serve_webhooks
+from clickup.server import dispatch_tool
+
+
+def sign(secret: str, body: bytes) -> str:
+    return hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+class TestWaitForTaskChange(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.task = {"id": "t1", "status": {"status": "open"}, "date_updated": "1", "list": {"id": "l1"}}
+        self.requests = []
+        self.webhooks = []
+        self.on_task_fetch = None
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request.url.path)
+            if request.url.path.endswith("/webhook"):
+                if request.method == "GET":
+                    return httpx.Response(200, json={"webhooks": self.webhooks})
+                return httpx.Response(200, json={"id": "w1", "webhook": {"id": "w1", "secret": "s3cret"}})
+            if request.url.path.endswith("/team"):
+                return httpx.Response(200, json={"teams": [{"id": "9001"}]})
+            response = httpx.Response(200, json=self.task)
+            if self.on_task_fetch is not None:
+                self.on_task_fetch()
+            return response
+
+        self.client = ClickUpClient("token", transport=httpx.MockTransport(handler))
+        self.client.disk_cache = None
+        patcher = mock.patch.dict(os.environ, {"CLICKUP_WEBHOOK_URL": "https://example.com/webhooks/clickup"})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def asyncTearDown(self):
+        hub.secrets.clear()
+        hub.listening = False
+        await self.client.client.aclose()
+
+    async def wait(self, **arguments) -> dict:
+        contents = await dispatch_tool(self.client, "wait-for-task-change", arguments)
+        return json.loads(contents[0].text)
+
+    async def test_webhook_delivery_ends_the_wait(self):
+        hub.listening = True
+        await self.client.create_webhook("9001", "https://example.com/webhooks/clickup", ["taskStatusUpdated"])
+        waiting = asyncio.create_task(self.wait(task_id="t1", status="done", wait_seconds=5))
+        await asyncio.sleep(0.01)
+
+        body = json.dumps({"event": "taskStatusUpdated", "task_id": "t1", "webhook_id": "w1"}).encode()
+        self.assertEqual(hub.ingest(body, "forged"), 401)
+        # A change to another status does not end the wait
+        self.assertEqual(hub.ingest(body, sign("s3cret", body)), 200)
+        await asyncio.sleep(0.01)
+        self.assertFalse(waiting.done())
+
+        self.task = {**self.task, "status": {"status": "done"}}
+        hub.ingest(body, sign("s3cret", body))
+        result = await waiting
+        self.assertTrue(result["changed"])
+        self.assertEqual((result["source"], result["event"]), ("webhook", "taskStatusUpdated"))
+
+    async def test_events_arriving_while_a_task_is_fetched_are_not_lost(self):
+        hub.listening = True
+        await self.client.create_webhook("9001", "https://example.com/webhooks/clickup", ["taskStatusUpdated"])
+        body = json.dumps({"event": "taskStatusUpdated", "task_id": "t1", "webhook_id": "w1"}).encode()
+
+        def change_during_fetch():
+            # The task moves on while its previous change is being looked up
+            self.on_task_fetch = None
+            self.task = {**self.task, "status": {"status": "done"}}
+            hub.ingest(body, sign("s3cret", body))
+
+        self.on_task_fetch = change_during_fetch
+        waiting = asyncio.create_task(self.wait(task_id="t1", status="done", wait_seconds=5))
+        await asyncio.sleep(0.01)
+        hub.ingest(body, sign("s3cret", body))
+        result = await asyncio.wait_for(waiting, 1)
+        self.assertTrue(result["changed"])
+        self.assertEqual(result["task"]["status_status"], "done")
+
+    async def test_falls_back_to_polling(self):
+        with mock.patch("clickup.tools.webhooks.POLL_MIN_INTERVAL", 0.01):
+            waiting = asyncio.create_task(self.wait(task_id="t1", wait_seconds=5))
+            await asyncio.sleep(0.05)
+            self.task = {**self.task, "date_updated": "2"}
+            result = await waiting
+        self.assertEqual((result["changed"], result["source"]), (True, "polling"))
+        self.assertEqual(result["tasks"][0]["id"], "t1")
+
+        with mock.patch("clickup.tools.webhooks.POLL_MIN_INTERVAL", 0.01):
+            result = await self.wait(task_id="t1", wait_seconds=0.05)
+        self.assertFalse(result["changed"])
+
+    async def test_webhooks_delivering_elsewhere_do_not_count(self):
+        hub.listening = True
+        self.webhooks = [{"id": "w2", "secret": "other", "endpoint": "https://elsewhere.example.com/hook"}]
+        with mock.patch("clickup.tools.webhooks.POLL_MIN_INTERVAL", 0.01):
+            result = await self.wait(task_id="t1", wait_seconds=0.05)
+            self.assertEqual(result["source"], "polling")
+            await self.wait(task_id="t1", wait_seconds=0.05)
+        # The token's webhooks were listed once, not on every call
+        self.assertEqual(self.requests.count("/api/v2/team/9001/webhook"), 1)
+
+        self.webhooks.append({"id": "w3", "secret": "mine", "endpoint": "https://example.com/webhooks/clickup/"})
+        await self.client.get_webhooks("9001")
+        self.assertTrue(hub.available(self.client.cache_namespace))
+        with mock.patch.dict(os.environ, {"CLICKUP_WEBHOOK_URL": ""}):
+            self.assertFalse(hub.available(self.client.cache_namespace))
+
+    async def test_listener_refuses_oversized_and_stalled_deliveries(self):
+        server = await serve_webhooks(port=0)
+        host, port = server.sockets[0].getsockname()[:2]
+        self.assertEqual(host, "127.0.0.1")
+
+        async def post(head: bytes) -> bytes:
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write(head)
+            response = await reader.readline()
+            writer.close()
+            return response
+
+        try:
+            oversized = f"POST /webhooks/clickup HTTP/1.1\r\nContent-Length: {MAX_BODY_BYTES + 1}\r\n\r\n"
+            self.assertIn(b" 413 ", await post(oversized.encode()))
+            with mock.patch("clickup.events.READ_TIMEOUT", 0.05):
+                self.assertIn(b" 408 ", await post(b"POST /webhooks/clickup HTTP/1.1\r\nContent-Length: 10\r\n\r\n"))
+        finally:
+            server.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
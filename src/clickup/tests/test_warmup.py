@@ -0,0 +1,57 @@
+import asyncio
+import unittest
+
+import httpx
+
+from clickup.api import ClickUpClient
+from clickup.api.warmup import keep_alive, warm_up
+from clickup.metrics import registry
+from clickup.server import dispatch_tool
+
+
+class TestWarmUp(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        registry.reset()
+        self.paths = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.paths.append(request.url.path)
+            if request.url.path.endswith("/team"):
+                return httpx.Response(200, json={"teams": [{"id": "1", "name": "A"}, {"id": "2", "name": "B"}]})
+            if request.url.path.endswith("/space"):
+                return httpx.Response(200, json={"spaces": [{"id": "s1", "name": "Space"}]})
+            return httpx.Response(200, json={"user": {"id": 1}})
+
+        self.client = ClickUpClient("token", transport=httpx.MockTransport(handler))
+
+    async def asyncTearDown(self):
+        await self.client.client.aclose()
+
+    async def test_warm_up_prefetches_configured_teams(self):
+        await warm_up(self.client, connections=3, team_ids=["2"])
+        self.assertEqual(self.paths.count("/api/v2/user"), 3)
+        self.assertEqual(self.paths[3:], ["/api/v2/team", "/api/v2/team/2/space"])
+        self.assertIn("warmup_seconds", registry.gauges)
+
+        # The resolver and workspace tree are served from the cache
+        await self.client.get_teams()
+        await self.client.get_spaces("2")
+        self.assertEqual(len(self.paths), 5)
+        # The tools fetch fresh data unless asked not to
+        await dispatch_tool(self.client, "get-teams", {})
+        await dispatch_tool(self.client, "get-spaces", {"team_id": "2", "refresh": False})
+        self.assertEqual(self.paths[5:], ["/api/v2/team"])
+
+    async def test_keep_alive_pings_until_cancelled(self):
+        task = asyncio.create_task(keep_alive(self.client, interval=0.01, connections=1))
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.client.pins, 1)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertGreaterEqual(self.paths.count("/api/v2/user"), 2)
+        self.assertEqual(self.client.pins, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import json
+import unittest
+
+import httpx
+
+from clickup.api import ClickUpClient
+from clickup.server import dispatch_tool
+
+
+class TestWorkspaceTree(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.requests = []
+        self.teams = [{"id": "1", "name": "Acme"}, {"id": "2", "name": "Side"}]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            path = request.url.path.removeprefix("/api/v2/")
+            self.requests.append(path)
+            parts = path.split("/")
+            if path == "team":
+                return httpx.Response(200, json={"teams": self.teams})
+            if parts[-1] == "view":
+                return httpx.Response(200, json={"views": [{"id": f"v-{parts[1]}", "name": "Board", "type": "board"}]})
+            if parts[0] == "team":
+                return httpx.Response(200, json={"spaces": [{"id": f"s{parts[1]}", "name": "Space",
+                                                             "statuses": [{"status": "open"}]}]})
+            if parts[-1] == "folder":
+                return httpx.Response(200, json={"folders": [{"id": "f1", "name": "Folder",
+                                                              "lists": [{"id": "l1", "name": "In folder"}]}]})
+            return httpx.Response(200, json={"lists": [{"id": "l2", "name": "Folderless"}]})
+
+        self.client = ClickUpClient("token", transport=httpx.MockTransport(handler))
+        self.client.disk_cache = None
+
+    async def asyncTearDown(self):
+        await self.client.client.aclose()
+
+    async def call(self, **arguments):
+        contents = await dispatch_tool(self.client, "get-workspace-tree", arguments)
+        return json.loads(contents[0].text)
+
+    async def test_max_depth_limits_the_walk(self):
+        tree = await self.call(max_depth=1)
+        self.assertEqual(tree, {"teams": [{"id": "1", "name": "Acme"}, {"id": "2", "name": "Side"}]})
+        self.assertEqual(self.requests, ["team"])
+
+        tree = await self.call(team_id="1", max_depth=4)
+        (space,) = tree["teams"][0]["spaces"]
+        self.assertEqual(space["statuses"], ["open"])
+        self.assertEqual(space["views"], [{"id": "v-s1", "name": "Board", "type": "board"}])
+        (folder,) = space["folders"]
+        self.assertEqual(folder["views"][0]["id"], "v-f1")
+        self.assertEqual([(item["id"], item["views"][0]["id"]) for item in folder["lists"]], [("l1", "v-l1")])
+        self.assertEqual([(item["id"], item["views"][0]["id"]) for item in space["lists"]], [("l2", "v-l2")])
+
+    async def test_team_id_filters_the_teams(self):
+        tree = await self.call(team_id="2", max_depth=2)
+        self.assertEqual([team["id"] for team in tree["teams"]], ["2"])
+        self.assertNotIn("team/1/space", self.requests)
+        with self.assertRaises(ValueError):
+            await self.client.get_workspace_tree(team_id="3")
+
+    async def test_refresh_rebuilds_the_cached_tree(self):
+        await self.call(max_depth=1)
+        self.teams.append({"id": "3", "name": "New"})
+        self.assertEqual(len((await self.call(max_depth=1))["teams"]), 2)
+        self.assertEqual(self.requests, ["team"])
+
+        tree = await self.call(max_depth=1, refresh=True)
+        self.assertEqual(len(tree["teams"]), 3)
+        self.assertEqual(self.requests, ["team", "team"])
+
+    async def test_views_are_fetched_per_parent_type(self):
+        views = await self.client.get_views("folder", "f1")
+        self.assertEqual(views[0]["id"], "v-f1")
+        self.assertEqual(self.requests, ["folder/f1/view"])
+        with self.assertRaises(ValueError):
+            await self.client.get_views("task", "t1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Callable, Dict, List, Any, Optional
 from mcp.types import Tool
 
@@ -14,10 +15,18 @@ from .custom_fields import CUSTOM_FIELD_TOOLS, CUSTOM_FIELD_TOOL_HANDLERS
 from .folders import FOLDER_TOOLS, FOLDER_TOOL_HANDLERS
 from .dependencies import DEPENDENCY_TOOLS, DEPENDENCY_TOOL_HANDLERS
 from .docs import DOC_TOOLS, DOC_TOOL_HANDLERS
+from .workspace import WORKSPACE_TOOLS, WORKSPACE_TOOL_HANDLERS
+from .resolver import RESOLVER_TOOLS, RESOLVER_TOOL_HANDLERS
+from .diagnostics import DIAGNOSTIC_TOOLS, DIAGNOSTIC_TOOL_HANDLERS
+from .jobs import JOB_TOOLS, JOB_TOOL_HANDLERS
+from .responses import RESPONSE_TOOLS, RESPONSE_TOOL_HANDLERS, response_budget_schema
+from .snapshots import SNAPSHOT_TOOLS, snapshot_schema
+from ..deadlines import deadline_schema
 
-def get_all_tools() -> List[Tool]:
-    """Get all available tools."""
-    return [
+@lru_cache(maxsize=None)
+def _build_tools() -> tuple[Tool, ...]:
+    tools = []
+    for tool in [
         *TASK_TOOLS,
         *LIST_TOOLS,
         *SPACE_TOOLS,
@@ -30,8 +39,30 @@ def get_all_tools() -> List[Tool]:
         *CUSTOM_FIELD_TOOLS,
         *FOLDER_TOOLS,
         *DEPENDENCY_TOOLS,
-        *DOC_TOOLS
-    ]
+        *DOC_TOOLS,
+        *WORKSPACE_TOOLS,
+        *RESOLVER_TOOLS,
+        *DIAGNOSTIC_TOOLS,
+        *JOB_TOOLS,
+        *RESPONSE_TOOLS
+    ]:
+        properties = dict(tool.inputSchema["properties"])
+        # Every tool accepts a response budget; get-continuation reuses the original one
+        if tool not in RESPONSE_TOOLS:
+            properties.update(response_budget_schema)
+        if tool.name in SNAPSHOT_TOOLS:
+            properties.update(snapshot_schema)
+        properties.update(deadline_schema)
+        tools.append(Tool(
+            name=tool.name,
+            description=tool.description,
+            inputSchema={**tool.inputSchema, "properties": properties}
+        ))
+    return tuple(tools)
+
+def get_all_tools() -> List[Tool]:
+    """Get all available tools."""
+    return list(_build_tools())
 
 def get_tool_handler(name: str) -> Optional[Callable]:
     """Get handler for specific tool."""
@@ -48,6 +79,11 @@ def get_tool_handler(name: str) -> Optional[Callable]:
         **CUSTOM_FIELD_TOOL_HANDLERS,
         **FOLDER_TOOL_HANDLERS,
         **DEPENDENCY_TOOL_HANDLERS,
-        **DOC_TOOL_HANDLERS
+        **DOC_TOOL_HANDLERS,
+        **WORKSPACE_TOOL_HANDLERS,
+        **RESOLVER_TOOL_HANDLERS,
+        **DIAGNOSTIC_TOOL_HANDLERS,
+        **JOB_TOOL_HANDLERS,
+        **RESPONSE_TOOL_HANDLERS
     }
     return handlers.get(name)
\ No newline at end of file
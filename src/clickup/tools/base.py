@@ -1,5 +1,15 @@
+import asyncio
+import functools
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from enum import Enum
-from typing import Any, Dict, TypeVar, Generic, Union, Type
+from typing import Any, Awaitable, Dict, Iterable, Optional, TypeVar, Generic, Union, Type
+from mcp.types import TextContent
+from .. import metrics, tracing
+from .snapshots import current_snapshot, diff_entities
 
 T = TypeVar('T')
 
@@ -75,6 +85,126 @@ class BaseTransformer:
 
         return transformed_entity
                 
+OFFLOAD_POLICIES = ("inline", "thread", "process")
+DEFAULT_OFFLOAD_THRESHOLD = 256 * 1024
+_executors: Dict[str, Executor] = {}
+
+async def render(data: Any, transformer: Optional[Type[BaseTransformer]] = None,
+                 return_mode: Optional[ReturnMode] = None) -> list[TextContent]:
+    """Transform (when a transformer is given) and serialize a handler result, timing both phases.
+
+    Results estimated above CLICKUP_OFFLOAD_THRESHOLD bytes are rendered in a thread or process
+    pool (CLICKUP_OFFLOAD), so the event loop keeps serving other calls in the meantime.
+    """
+    policy = os.getenv("CLICKUP_OFFLOAD", "thread")
+    threshold = int(os.getenv("CLICKUP_OFFLOAD_THRESHOLD", str(DEFAULT_OFFLOAD_THRESHOLD)))
+    if policy not in OFFLOAD_POLICIES:
+        raise ValueError(f"Invalid CLICKUP_OFFLOAD: {policy}")
+    # With a since_token the transformed entities are reduced to a diff before serializing
+    snapshot = current_snapshot.get()
+    diff = (snapshot.previous, snapshot.since, snapshot.token) if snapshot is not None else None
+    hashes = None
+    if policy == "inline" or estimate_size(data) < threshold:
+        started = time.perf_counter()
+        if transformer is not None:
+            with tracing.span("transform", transformer=transformer.__name__):
+                data = transformer.transform(data, return_mode)
+        if diff is not None:
+            data, hashes = diff_entities(data, *diff)
+        transformed = time.perf_counter()
+        with tracing.span("serialize") as span:
+            text = json.dumps(data, indent=2)
+            if span is not None:
+                span.set(bytes=len(text))
+        transform_seconds, serialize_seconds = transformed - started, time.perf_counter() - transformed
+    else:
+        with tracing.span("render.offload", executor=policy) as span:
+            work = functools.partial(_transform_and_serialize, data, transformer, return_mode, diff)
+            loop = asyncio.get_running_loop()
+            encoded, hashes, transform_seconds, serialize_seconds = await loop.run_in_executor(
+                _executor(policy), work
+            )
+            text = encoded.decode("utf-8")
+            if span is not None:
+                span.set(bytes=len(text), transform_seconds=transform_seconds, serialize_seconds=serialize_seconds)
+    if snapshot is not None:
+        snapshot.hashes = hashes
+    stats = metrics.registry.tool()
+    if stats is not None:
+        stats.transform_seconds += transform_seconds
+        stats.serialize_seconds += serialize_seconds
+    return [TextContent(type="text", text=text)]
+
+def _transform_and_serialize(data: Any, transformer: Optional[Type[BaseTransformer]],
+                             return_mode: Optional[ReturnMode],
+                             diff: Optional[tuple]) -> tuple[bytes, Optional[dict], float, float]:
+    """Render work of a pool thread or process; the text comes back as one bytes object."""
+    started = time.perf_counter()
+    hashes = None
+    if transformer is not None:
+        data = transformer.transform(data, return_mode)
+    if diff is not None:
+        data, hashes = diff_entities(data, *diff)
+    transformed = time.perf_counter()
+    encoded = json.dumps(data, indent=2).encode("utf-8")
+    return encoded, hashes, transformed - started, time.perf_counter() - transformed
+
+def _executor(policy: str) -> Executor:
+    executor = _executors.get(policy)
+    if executor is None:
+        workers = int(os.getenv("CLICKUP_OFFLOAD_WORKERS", str(min(4, os.cpu_count() or 1))))
+        if policy == "process":
+            executor = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+        else:
+            executor = ThreadPoolExecutor(workers, thread_name_prefix="clickup-render")
+        _executors[policy] = executor
+    return executor
+
+def estimate_size(data: Any) -> int:
+    """Rough size of the JSON output in bytes; lists are extrapolated from their first item."""
+    if isinstance(data, str):
+        return len(data) + 2
+    if isinstance(data, list):
+        return len(data) * estimate_size(data[0]) if data else 2
+    if isinstance(data, dict):
+        return sum(len(key) + 4 + estimate_size(value) for key, value in data.items())
+    return 8
+
+async def gather_all(*aws: Awaitable, return_exceptions: bool = False) -> list:
+    """asyncio.gather that also cancels the siblings when one fails, so no orphaned requests keep running."""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+async def gather_bounded(aws: Iterable[Awaitable], limit: int, return_exceptions: bool = False) -> list:
+    """Await coroutines concurrently with at most `limit` in flight, keeping input order."""
+    pending = list(enumerate(aws))
+    results = [None] * len(pending)
+    queue = iter(pending)
+
+    async def worker():
+        for index, aw in queue:
+            try:
+                results[index] = await aw
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results[index] = e
+
+    try:
+        await gather_all(*(worker() for _ in range(min(max(int(limit), 1), len(pending)))))
+    finally:
+        # Close what never started when the call failed or was cancelled
+        for _, aw in queue:
+            if asyncio.iscoroutine(aw):
+                aw.close()
+    return results
+
 # Schema parts that are commonly used across tools
 return_mode_schema = {
     "return_mode": {
@@ -1,14 +1,50 @@
 import json
 from typing import Any, Sequence, Optional
 from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
-from .base import ReturnMode, BaseTransformer, return_mode_schema
+from .base import ReturnMode, BaseTransformer, return_mode_schema, gather_bounded, render
+
+# ClickUp returns task comments newest first, 25 per page
+COMMENT_PAGE_SIZE = 25
 
 class CommentAPI:
-    async def get_comments(self, task_id: str) -> list[dict]:
-        """Get comments for a task."""
-        response = await self.client.get(f"{self.base_url}/task/{task_id}/comment")
+    async def get_comments(self, task_id: str, start: Optional[int] = None, start_id: Optional[str] = None) -> list[dict]:
+        """Get comments for a task, optionally the page older than the comment `start`/`start_id`."""
+        params = {}
+        if start is not None:
+            params = {"start": start, "start_id": start_id}
+        response = await self.client.get(f"{self.base_url}/task/{task_id}/comment", params=params)
         response.raise_for_status()
         return response.json()["comments"]
+
+    async def get_all_comments(self, task_id: str, since: Optional[int] = None) -> list[dict]:
+        """Follow comment pagination to the start of the thread, or back to `since` (ms)."""
+        comments = []
+        start = start_id = None
+        while True:
+            page = await self.get_comments(task_id, start, start_id)
+            for comment in page:
+                if since is not None and int(comment.get("date") or 0) < since:
+                    return comments
+                comments.append(comment)
+            if len(page) < COMMENT_PAGE_SIZE or page[-1].get("id") == start_id:
+                return comments
+            start, start_id = page[-1].get("date"), page[-1].get("id")
+
+    async def get_comments_batch(self, task_ids: list[str], since: Optional[int] = None,
+                                 concurrency: int = 5) -> dict[str, Any]:
+        """Fetch complete comment threads for many tasks concurrently, keyed by task id."""
+        task_ids = list(dict.fromkeys(task_ids))
+        results = await gather_bounded(
+            (self.get_all_comments(task_id, since) for task_id in task_ids),
+            concurrency,
+            return_exceptions=True
+        )
+        threads = {}
+        for task_id, result in zip(task_ids, results):
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+            threads[task_id] = {"error": str(result)} if isinstance(result, Exception) else result
+        return threads
     
     async def create_task_comment(self, task_id: str, comment_text: str, **kwargs) -> dict:
         """Create a comment on a task."""
@@ -42,6 +78,24 @@ COMMENT_TOOLS = [
             "required": ["task_id"]
         }
     ),
+    Tool(
+        name="get-comments-batch",
+        description="Get complete comment threads for many tasks at once, grouped per task",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "task_ids": {"type": "array", "items": {"type": "string"}},
+                "since": {
+                    "type": "integer",
+                    "description": "Only return comments posted at or after this Unix time in milliseconds",
+                    "optional": True
+                },
+                "concurrency": {"type": "integer", "minimum": 1, "maximum": 10, "optional": True},
+                **return_mode_schema
+            },
+            "required": ["task_ids"]
+        }
+    ),
     Tool(
         name="create-task-comment",
         description="Create a comment on a task",
@@ -61,22 +115,29 @@ COMMENT_TOOLS = [
 async def handle_get_comments(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     return_mode = ReturnMode(arguments.pop("return_mode", "minimal"))
     comments = await client.get_comments(arguments["task_id"])
-    transformed_data = CommentTransformer.transform(comments, return_mode)
-    return [TextContent(
-        type="text",
-        text=json.dumps(transformed_data, indent=2)
-    )]
+    return await render(comments, CommentTransformer, return_mode)
+
+async def handle_get_comments_batch(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+    return_mode = ReturnMode(arguments.pop("return_mode", "minimal"))
+    threads = await client.get_comments_batch(
+        arguments["task_ids"],
+        since=arguments.get("since"),
+        concurrency=arguments.get("concurrency", 5)
+    )
+    transformed_data = {
+        task_id: comments if isinstance(comments, dict) else CommentTransformer.transform(comments, return_mode)
+        for task_id, comments in threads.items()
+    }
+    return await render(transformed_data)
 
 async def handle_create_task_comment(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     task_id = arguments.pop("task_id")
     comment_text = arguments.pop("comment_text")
     comment = await client.create_task_comment(task_id, comment_text, **arguments)
-    return [TextContent(
-        type="text",
-        text=json.dumps(comment, indent=2)
-    )]
+    return await render(comment)
 
 COMMENT_TOOL_HANDLERS = {
     "get-comments": handle_get_comments,
+    "get-comments-batch": handle_get_comments_batch,
     "create-task-comment": handle_create_task_comment
 }
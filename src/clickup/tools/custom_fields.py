@@ -1,7 +1,7 @@
 import json
 from typing import Any, Sequence, Optional
 from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
-from .base import ReturnMode, BaseTransformer, return_mode_schema
+from .base import ReturnMode, BaseTransformer, return_mode_schema, render
 
 class CustomFieldAPI:
     async def get_accessible_custom_fields(self, list_id: str) -> list[dict]:
@@ -79,11 +79,7 @@ CUSTOM_FIELD_TOOLS = [
 async def handle_get_accessible_custom_fields(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     return_mode = ReturnMode(arguments.pop("return_mode", "minimal"))
     fields = await client.get_accessible_custom_fields(arguments["list_id"])
-    transformed_data = CustomFieldTransformer.transform(fields, return_mode)
-    return [TextContent(
-        type="text",
-        text=json.dumps(transformed_data, indent=2)
-    )]
+    return await render(fields, CustomFieldTransformer, return_mode)
 
 async def handle_set_custom_field_value(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     result = await client.set_custom_field_value(
@@ -91,20 +87,14 @@ async def handle_set_custom_field_value(client, arguments: dict) -> Sequence[Tex
         field_id=arguments["field_id"],
         value=arguments["value"]
     )
-    return [TextContent(
-        type="text",
-        text=json.dumps(result, indent=2)
-    )]
+    return await render(result)
 
 async def handle_remove_custom_field_value(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     result = await client.remove_custom_field_value(
         task_id=arguments["task_id"],
         field_id=arguments["field_id"]
     )
-    return [TextContent(
-        type="text",
-        text=json.dumps(result, indent=2)
-    )]
+    return await render(result)
 
 CUSTOM_FIELD_TOOL_HANDLERS = {
     "get-accessible-custom-fields": handle_get_accessible_custom_fields,
@@ -1,7 +1,7 @@
 import json
 from typing import Any, Sequence, Optional
 from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
-from .base import ReturnMode, BaseTransformer, return_mode_schema
+from .base import ReturnMode, BaseTransformer, return_mode_schema, render
 
 class DependencyAPI:
     async def add_task_dependency(self, task_id: str, depends_on: str, dependency_type: str = "waiting_on") -> dict:
@@ -103,40 +103,28 @@ async def handle_add_task_dependency(client, arguments: dict) -> Sequence[TextCo
         depends_on=arguments["depends_on"],
         dependency_type=arguments.get("dependency_type", "waiting_on")
     )
-    return [TextContent(
-        type="text",
-        text=json.dumps(result, indent=2)
-    )]
+    return await render(result)
 
 async def handle_remove_task_dependency(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     result = await client.remove_task_dependency(
         task_id=arguments["task_id"],
         dependency_id=arguments["dependency_id"]
     )
-    return [TextContent(
-        type="text",
-        text=json.dumps(result, indent=2)
-    )]
+    return await render(result)
 
 async def handle_add_task_link(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     result = await client.add_task_link(
         task_id=arguments["task_id"],
         links_to=arguments["links_to"]
     )
-    return [TextContent(
-        type="text",
-        text=json.dumps(result, indent=2)
-    )]
+    return await render(result)
 
 async def handle_delete_task_link(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     result = await client.delete_task_link(
         task_id=arguments["task_id"],
         links_to=arguments["links_to"]
     )
-    return [TextContent(
-        type="text",
-        text=json.dumps(result, indent=2)
-    )]
+    return await render(result)
 
 DEPENDENCY_TOOL_HANDLERS = {
     "add-task-dependency": handle_add_task_dependency,
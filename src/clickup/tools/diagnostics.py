@@ -0,0 +1,43 @@
+import os
+from typing import Sequence
+from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
+from .base import render
+from .. import metrics
+
+DIAGNOSTIC_TOOLS = [
+    Tool(
+        name="server-metrics",
+        description="Get per-tool and per-endpoint call counts, latency percentiles, payload sizes, errors, retries and cache hit rates",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "format": {"type": "string", "enum": ["json", "prometheus"], "optional": True},
+                "reset": {
+                    "type": "boolean",
+                    "description": "Reset all metrics after reading them (stdio transport, or CLICKUP_METRICS_RESET over HTTP)",
+                    "optional": True
+                }
+            },
+            "required": []
+        }
+    )
+]
+
+async def handle_server_metrics(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+    # Over HTTP the server may serve other tenants: a caller only sees its own session and cannot wipe the metrics
+    remote = metrics.current_transport.get() != "stdio"
+    if arguments.get("reset") and remote and os.getenv("CLICKUP_METRICS_RESET", "").lower() not in ("1", "true", "yes"):
+        raise ValueError("Resetting metrics over HTTP requires CLICKUP_METRICS_RESET on the server")
+    session = metrics.current_session.get()
+    sessions = ([session] if session else []) if remote else None
+    if arguments.get("format") == "prometheus":
+        result = [TextContent(type="text", text=metrics.registry.prometheus(sessions))]
+    else:
+        result = await render({**metrics.registry.snapshot(sessions), "scheduler": client.scheduler.snapshot()})
+    if arguments.get("reset"):
+        metrics.registry.reset()
+    return result
+
+DIAGNOSTIC_TOOL_HANDLERS = {
+    "server-metrics": handle_server_metrics
+}
@@ -1,7 +1,7 @@
 import json
 from typing import Any, Sequence, Optional
 from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
-from .base import ReturnMode, BaseTransformer, return_mode_schema
+from .base import ReturnMode, BaseTransformer, return_mode_schema, render
 
 class DocAPI:
     async def search_docs(self, workspace_id: str, **kwargs) -> dict:
@@ -90,10 +90,10 @@ class DocAPI:
         return response.json()
     
     async def edit_page(self, workspace_id: str, doc_id: str, page_id: str,
-                       name: str, content: str, sub_title: str,
+                       name: Optional[str], content: Optional[str], sub_title: Optional[str],
                        content_edit_mode: str = "replace",
                        content_format: str = "text/md") -> dict:
-        """Edit a page in a doc."""
+        """Edit a page in a doc. Fields left as None are not sent."""
         data = {
             "name": name,
             "content": content,
@@ -101,6 +101,7 @@ class DocAPI:
             "content_edit_mode": content_edit_mode,
             "content_format": content_format
         }
+        data = {k: v for k, v in data.items() if v is not None}
         response = await self.client.put(
             f"{self.base_url_v3}/workspaces/{workspace_id}/docs/{doc_id}/pages/{page_id}",
             json=data
@@ -108,6 +109,69 @@ class DocAPI:
         response.raise_for_status()
         return response.json()
 
+    async def edit_page_diff(self, workspace_id: str, doc_id: str, page_id: str, content: str,
+                             name: Optional[str] = None, sub_title: Optional[str] = None,
+                             content_format: str = "text/md") -> dict:
+        """Edit a page by sending only what changed against its current content.
+
+        Uses the append/prepend edit modes when the new content extends the
+        current one, and skips the request entirely when nothing changed. The
+        page is always fetched fresh, since a copy edited elsewhere in the
+        meantime would produce a wrong append/prepend or a false skip.
+        """
+        current = await self.get_page(workspace_id, doc_id, page_id, content_format)
+        old_content = current.get("content") or ""
+
+        full_payload = {
+            "name": name if name is not None else current.get("name"),
+            "content": content,
+            "sub_title": sub_title if sub_title is not None else current.get("sub_title"),
+            "content_edit_mode": "replace",
+            "content_format": content_format
+        }
+        bytes_full = _payload_size(full_payload)
+
+        changed = {}
+        if name is not None and name != current.get("name"):
+            changed["name"] = name
+        if sub_title is not None and sub_title != current.get("sub_title"):
+            changed["sub_title"] = sub_title
+
+        content_edit_mode = None
+        if content != old_content:
+            if old_content and content.startswith(old_content):
+                content_edit_mode = "append"
+                changed["content"] = content[len(old_content):]
+            elif old_content and content.endswith(old_content):
+                content_edit_mode = "prepend"
+                changed["content"] = content[:len(content) - len(old_content)]
+            else:
+                content_edit_mode = "replace"
+                changed["content"] = content
+
+        result = {"id": page_id, "content_edit_mode": content_edit_mode, "skipped": not changed}
+        if not changed:
+            result.update({"bytes_sent": 0, "bytes_full": bytes_full, "bytes_saved": bytes_full})
+            return result
+
+        payload = {**changed, "content_edit_mode": content_edit_mode or "replace", "content_format": content_format}
+        await self.edit_page(
+            workspace_id, doc_id, page_id,
+            payload.get("name"), payload.get("content"), payload.get("sub_title"),
+            payload["content_edit_mode"], content_format
+        )
+        bytes_sent = _payload_size({k: v for k, v in payload.items() if v is not None})
+        result.update({
+            "bytes_sent": bytes_sent,
+            "bytes_full": bytes_full,
+            "bytes_saved": max(bytes_full - bytes_sent, 0)
+        })
+        return result
+
+def _payload_size(payload: dict) -> int:
+    """Size in bytes of a JSON request body as httpx would send it."""
+    return len(json.dumps(payload).encode("utf-8"))
+
 class DocTransformer(BaseTransformer):
     @classmethod
     def get_fields(cls, mode: ReturnMode) -> list[str]:
@@ -240,14 +304,19 @@ DOC_TOOLS = [
                 "workspace_id": {"type": "string"},
                 "doc_id": {"type": "string"},
                 "page_id": {"type": "string"},
-                "name": {"type": "string"},
+                "name": {"type": "string", "optional": True},
                 "content": {"type": "string"},
-                "sub_title": {"type": "string"},
-                "content_edit_mode": {"type": "string", "optional": True},
+                "sub_title": {"type": "string", "optional": True},
+                "content_edit_mode": {
+                    "type": "string",
+                    "enum": ["replace", "append", "prepend", "auto"],
+                    "description": "auto diffs content against the current page and sends only the change",
+                    "optional": True
+                },
                 "content_format": {"type": "string", "optional": True},
                 **return_mode_schema
             },
-            "required": ["workspace_id", "doc_id", "page_id", "name", "content", "sub_title"]
+            "required": ["workspace_id", "doc_id", "page_id", "content"]
         }
     )
 ]
@@ -257,11 +326,7 @@ async def handle_search_docs(client, arguments: dict) -> Sequence[TextContent |
     return_mode = ReturnMode(arguments.pop("return_mode", "minimal"))
     workspace_id = arguments.pop("workspace_id")
     docs = await client.search_docs(workspace_id, **arguments)
-    transformed_data = DocTransformer.transform(docs, return_mode)
-    return [TextContent(
-        type="text",
-        text=json.dumps(transformed_data, indent=2)
-    )]
+    return await render(docs, DocTransformer, return_mode)
 
 async def handle_create_doc(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     return_mode = ReturnMode(arguments.pop("return_mode", "minimal"))
@@ -272,20 +337,12 @@ async def handle_create_doc(client, arguments: dict) -> Sequence[TextContent | I
     create_page = arguments.pop("create_page", True)
     
     doc = await client.create_doc(workspace_id, name, parent, visibility, create_page)
-    transformed_data = DocTransformer.transform(doc, return_mode)
-    return [TextContent(
-        type="text",
-        text=json.dumps(transformed_data, indent=2)
-    )]
+    return await render(doc, DocTransformer, return_mode)
 
 async def handle_get_doc(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     return_mode = ReturnMode(arguments.pop("return_mode", "minimal"))
     doc = await client.get_doc(arguments["workspace_id"], arguments["doc_id"])
-    transformed_data = DocTransformer.transform(doc, return_mode)
-    return [TextContent(
-        type="text",
-        text=json.dumps(transformed_data, indent=2)
-    )]
+    return await render(doc, DocTransformer, return_mode)
 
 async def handle_get_doc_pages(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     return_mode = ReturnMode(arguments.pop("return_mode", "minimal"))
@@ -295,11 +352,7 @@ async def handle_get_doc_pages(client, arguments: dict) -> Sequence[TextContent
         arguments.get("max_page_depth", -1),
         arguments.get("content_format", "text/md")
     )
-    transformed_data = PageTransformer.transform(pages, return_mode)
-    return [TextContent(
-        type="text",
-        text=json.dumps(transformed_data, indent=2)
-    )]
+    return await render(pages, PageTransformer, return_mode)
 
 async def handle_create_page(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     return_mode = ReturnMode(arguments.pop("return_mode", "minimal"))
@@ -312,11 +365,7 @@ async def handle_create_page(client, arguments: dict) -> Sequence[TextContent |
         arguments.get("sub_title"),
         arguments.get("content_format", "text/md")
     )
-    transformed_data = PageTransformer.transform(page, return_mode)
-    return [TextContent(
-        type="text",
-        text=json.dumps(transformed_data, indent=2)
-    )]
+    return await render(page, PageTransformer, return_mode)
 
 async def handle_get_page(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     return_mode = ReturnMode(arguments.pop("return_mode", "minimal"))
@@ -326,29 +375,33 @@ async def handle_get_page(client, arguments: dict) -> Sequence[TextContent | Ima
         arguments["page_id"],
         arguments.get("content_format", "text/md")
     )
-    transformed_data = PageTransformer.transform(page, return_mode)
-    return [TextContent(
-        type="text",
-        text=json.dumps(transformed_data, indent=2)
-    )]
+    return await render(page, PageTransformer, return_mode)
 
 async def handle_edit_page(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     return_mode = ReturnMode(arguments.pop("return_mode", "minimal"))
+    content_edit_mode = arguments.get("content_edit_mode", "replace")
+    if content_edit_mode == "auto":
+        result = await client.edit_page_diff(
+            arguments["workspace_id"],
+            arguments["doc_id"],
+            arguments["page_id"],
+            arguments["content"],
+            arguments.get("name"),
+            arguments.get("sub_title"),
+            arguments.get("content_format", "text/md")
+        )
+        return await render(result)
     page = await client.edit_page(
         arguments["workspace_id"],
         arguments["doc_id"],
         arguments["page_id"],
-        arguments["name"],
+        arguments.get("name"),
         arguments["content"],
-        arguments["sub_title"],
-        arguments.get("content_edit_mode", "replace"),
+        arguments.get("sub_title"),
+        content_edit_mode,
         arguments.get("content_format", "text/md")
     )
-    transformed_data = PageTransformer.transform(page, return_mode)
-    return [TextContent(
-        type="text",
-        text=json.dumps(transformed_data, indent=2)
-    )]
+    return await render(page, PageTransformer, return_mode)
 
 DOC_TOOL_HANDLERS = {
     "search-docs": handle_search_docs,
@@ -1,7 +1,7 @@
 import json
 from typing import Any, Sequence, Optional
 from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
-from .base import ReturnMode, BaseTransformer, return_mode_schema
+from .base import ReturnMode, BaseTransformer, return_mode_schema, render
 
 class FolderAPI:
     async def update_folder(self, folder_id: str, **kwargs) -> dict:
@@ -78,29 +78,17 @@ async def handle_update_folder(client, arguments: dict) -> Sequence[TextContent
     folder_id = arguments.pop("folder_id")
     return_mode = ReturnMode(arguments.pop("return_mode", "minimal"))
     folder = await client.update_folder(folder_id, **arguments)
-    transformed_data = FolderTransformer.transform(folder, return_mode)
-    return [TextContent(
-        type="text",
-        text=json.dumps(transformed_data, indent=2)
-    )]
+    return await render(folder, FolderTransformer, return_mode)
 
 async def handle_get_folders(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     return_mode = ReturnMode(arguments.pop("return_mode", "minimal"))
     folders = await client.get_folders(arguments["space_id"])
-    transformed_data = FolderTransformer.transform(folders, return_mode)
-    return [TextContent(
-        type="text",
-        text=json.dumps(transformed_data, indent=2)
-    )]
+    return await render(folders, FolderTransformer, return_mode)
 
 async def handle_get_folder(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     return_mode = ReturnMode(arguments.pop("return_mode", "minimal"))
     folder = await client.get_folder(arguments["folder_id"])
-    transformed_data = FolderTransformer.transform(folder, return_mode)
-    return [TextContent(
-        type="text",
-        text=json.dumps(transformed_data, indent=2)
-    )]
+    return await render(folder, FolderTransformer, return_mode)
 
 FOLDER_TOOL_HANDLERS = {
     "update-folder": handle_update_folder,
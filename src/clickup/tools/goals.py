@@ -1,7 +1,7 @@
 import json
 from typing import Any, Sequence, Optional
 from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
-from .base import ReturnMode, BaseTransformer, return_mode_schema
+from .base import ReturnMode, BaseTransformer, return_mode_schema, render
 
 class GoalAPI:
     async def get_goals(self, team_id: str) -> list[dict]:
@@ -65,19 +65,12 @@ async def handle_create_goal(client, arguments: dict) -> Sequence[TextContent |
     team_id = arguments.pop("team_id")
     name = arguments.pop("name")
     goal = await client.create_goal(team_id, name, **arguments)
-    return [TextContent(
-        type="text",
-        text=json.dumps(goal, indent=2)
-    )]
+    return await render(goal)
 
 async def handle_get_goals(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     return_mode = ReturnMode(arguments.pop("return_mode", "minimal"))
     goals = await client.get_goals(arguments["team_id"])
-    transformed_data = GoalTransformer.transform(goals, return_mode)
-    return [TextContent(
-        type="text",
-        text=json.dumps(transformed_data, indent=2)
-    )]
+    return await render(goals, GoalTransformer, return_mode)
 
 GOAL_TOOL_HANDLERS = {
     "create-goal": handle_create_goal,
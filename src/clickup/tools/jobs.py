@@ -0,0 +1,177 @@
+from typing import Sequence
+from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
+from .base import gather_bounded, render
+from ..jobs import engine
+
+JOB_KINDS = ["export-tasks", "bulk-create-tasks", "workspace-scan"]
+DEFAULT_JOB_CONCURRENCY = 4
+
+async def _list_tasks(client, list_id: str, page: int, params: dict) -> dict:
+    return await client.get_tasks(list_id=list_id, page=page, **params)
+
+async def run_export_tasks(client, job, engine) -> None:
+    """Page through every task of the given lists into the job output; resumes at the last finished page."""
+    list_ids = job.params["list_ids"]
+    params = {k: v for k, v in job.params.items() if k in ("include_closed", "subtasks", "archived")}
+    position = job.checkpoint.setdefault("list_index", 0)
+    page = job.checkpoint.setdefault("page", 0)
+    exported = job.summary.setdefault("tasks", 0)
+    job.progress(position, len(list_ids))
+    while position < len(list_ids):
+        result = await _list_tasks(client, list_ids[position], page, params)
+        tasks = result.get("tasks", [])
+        engine.write_output(job, tasks)
+        exported += len(tasks)
+        if result.get("last_page", True) or not tasks:
+            position, page = position + 1, 0
+        else:
+            page += 1
+        job.checkpoint.update(list_index=position, page=page)
+        job.summary["tasks"] = exported
+        job.progress(position)
+        engine.save(job)
+
+async def run_bulk_create_tasks(client, job, engine) -> None:
+    """Create tasks `concurrency` at a time, checkpointing each one as soon as ClickUp answers.
+
+    A resumed job skips every index already recorded, so only a task whose creation was
+    in flight when the server stopped can be created twice.
+    """
+    list_id = job.params["list_id"]
+    tasks = job.params["tasks"]
+    concurrency = int(job.params.get("concurrency", DEFAULT_JOB_CONCURRENCY))
+    done = set(job.checkpoint.setdefault("done", []))
+    job.progress(len(done), len(tasks))
+
+    async def create(index: int) -> None:
+        try:
+            task = await client.create_task(list_id, **tasks[index])
+            line, outcome = {"index": index, "id": task.get("id")}, "created"
+        except Exception as e:
+            line, outcome = {"index": index, "error": str(e)}, "failed"
+        engine.write_output(job, [line])
+        job.summary[outcome] = job.summary.get(outcome, 0) + 1
+        done.add(index)
+        job.checkpoint["done"] = sorted(done)
+        job.progress(len(done))
+        engine.save(job)
+
+    await gather_bounded((create(index) for index in range(len(tasks)) if index not in done), concurrency)
+
+async def run_workspace_scan(client, job, engine) -> None:
+    """Count the tasks and statuses of every list in the workspace, one output line per list."""
+    if "lists" not in job.checkpoint:
+        tree = await client.get_workspace_tree(team_id=job.params.get("team_id"), refresh=True)
+        lists = []
+        for team in tree["teams"]:
+            for space in team.get("spaces", []):
+                folder_lists = [item for folder in space.get("folders", []) for item in folder.get("lists", [])]
+                for item in [*space.get("lists", []), *folder_lists]:
+                    lists.append({"id": item["id"], "name": item["name"], "space": space["name"]})
+        job.checkpoint["lists"] = lists
+        job.checkpoint["next"] = 0
+        engine.save(job)
+    lists = job.checkpoint["lists"]
+    concurrency = int(job.params.get("concurrency", DEFAULT_JOB_CONCURRENCY))
+
+    async def scan(item: dict) -> dict:
+        statuses, page = {}, 0
+        while True:
+            result = await _list_tasks(client, item["id"], page, {"include_closed": "true"})
+            for task in result.get("tasks", []):
+                status = (task.get("status") or {}).get("status")
+                statuses[status] = statuses.get(status, 0) + 1
+            if result.get("last_page", True) or not result.get("tasks"):
+                return {**item, "tasks": sum(statuses.values()), "statuses": statuses}
+            page += 1
+
+    position = job.checkpoint["next"]
+    job.progress(position, len(lists))
+    while position < len(lists):
+        chunk = lists[position:position + concurrency]
+        engine.write_output(job, await gather_bounded((scan(item) for item in chunk), concurrency))
+        position += len(chunk)
+        job.checkpoint["next"] = position
+        job.summary["lists"] = position
+        job.progress(position)
+        engine.save(job)
+
+engine.register("export-tasks", run_export_tasks)
+engine.register("bulk-create-tasks", run_bulk_create_tasks)
+engine.register("workspace-scan", run_workspace_scan)
+
+JOB_TOOLS = [
+    Tool(
+        name="job-start",
+        description="Start a long-running operation in the background and return its job id: export-tasks "
+                    "(params: list_ids, include_closed, subtasks), bulk-create-tasks (params: list_id, tasks, "
+                    "concurrency; each task is checkpointed once created, but one still in flight when the "
+                    "server stops is created again on resume) or workspace-scan (params: team_id, concurrency)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "kind": {"type": "string", "enum": JOB_KINDS},
+                "params": {"type": "object"}
+            },
+            "required": ["kind", "params"]
+        }
+    ),
+    Tool(
+        name="job-status",
+        description="Get progress, throughput and results of a job, or list all jobs",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "job_id": {"type": "string", "optional": True},
+                "results_offset": {"type": "integer", "description": "First result line to return", "optional": True},
+                "results_limit": {"type": "integer", "description": "Result lines to return (default 0)", "optional": True}
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="job-cancel",
+        description="Cancel a queued or running job",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "job_id": {"type": "string"}
+            },
+            "required": ["job_id"]
+        }
+    )
+]
+
+def _validate(kind: str, params: dict) -> None:
+    required = {"export-tasks": ["list_ids"], "bulk-create-tasks": ["list_id", "tasks"], "workspace-scan": []}
+    missing = [name for name in required.get(kind, []) if name not in params]
+    if missing:
+        raise ValueError(f"{kind} requires params: {', '.join(missing)}")
+
+async def handle_job_start(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+    kind, params = arguments["kind"], dict(arguments.get("params") or {})
+    _validate(kind, params)
+    engine.resume(client)
+    job = engine.start(client, kind, params)
+    return await render(job.status())
+
+async def handle_job_status(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+    engine.resume(client)
+    if not arguments.get("job_id"):
+        return await render([job.status() for job in engine.list_jobs(client)])
+    job = engine.get(client, arguments["job_id"])
+    status = job.status()
+    limit = int(arguments.get("results_limit", 0))
+    if limit:
+        status["results"] = engine.read_output(job, int(arguments.get("results_offset", 0)), limit)
+    return await render(status)
+
+async def handle_job_cancel(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+    job = await engine.cancel(client, arguments["job_id"])
+    return await render(job.status())
+
+JOB_TOOL_HANDLERS = {
+    "job-start": handle_job_start,
+    "job-status": handle_job_status,
+    "job-cancel": handle_job_cancel
+}
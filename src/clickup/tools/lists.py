@@ -1,7 +1,7 @@
 import json
 from typing import Any, Sequence, Optional
 from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
-from .base import ReturnMode, BaseTransformer, return_mode_schema
+from .base import ReturnMode, BaseTransformer, return_mode_schema, render
 
 class ListAPI:
     async def get_lists(self, space_id: str) -> list[dict]:
@@ -64,20 +64,13 @@ LIST_TOOLS = [
 async def handle_get_lists(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     return_mode = ReturnMode(arguments.pop("return_mode", "minimal"))
     lists = await client.get_lists(arguments["space_id"])
-    transformed_data = ListTransformer.transform(lists, return_mode)
-    return [TextContent(
-        type="text",
-        text=json.dumps(transformed_data, indent=2)
-    )]
+    return await render(lists, ListTransformer, return_mode)
 
 async def handle_create_folderless_list(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     space_id = arguments.pop("space_id")
     name = arguments.pop("name")
     list_data = await client.create_folderless_list(space_id, name, **arguments)
-    return [TextContent(
-        type="text",
-        text=json.dumps(list_data, indent=2)  # Always return full data for create operations
-    )]
+    return await render(list_data)  # Always return full data for create operations
 
 LIST_TOOL_HANDLERS = {
     "get-lists": handle_get_lists,
@@ -0,0 +1,192 @@
+from difflib import SequenceMatcher
+from typing import Any, Sequence, Optional
+from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
+from .base import render
+
+RESOLVER_INDEX_TTL = 600
+RESOLVE_KINDS = ["team", "space", "folder", "list", "user", "status"]
+MIN_SCORE = 0.6
+# Two candidates closer than this are reported as ambiguous instead of guessed
+AMBIGUITY_MARGIN = 0.05
+
+class ResolverAPI:
+    async def get_resolver_index(self, refresh: bool = False) -> list[dict]:
+        """Build (or reuse) the name index of teams, spaces, folders, lists, users and statuses."""
+        key = ("resolver_index",)
+        if not refresh:
+            index = self.cache.get(key)
+            if index is not None:
+                return index
+
+        tree = await self.get_workspace_tree(refresh=refresh)
+        # The tree walk has just cached the teams, members included
+        teams = await self.get_teams()
+        index = []
+
+        def add(kind: str, entity: dict, path: str, *aliases, **context):
+            names = [a for a in (entity.get("name"), *aliases) if a]
+            index.append({
+                "kind": kind,
+                "id": entity.get("id"),
+                "name": entity.get("name"),
+                "path": path,
+                "aliases": sorted({_normalize(a) for a in names}),
+                **context
+            })
+
+        for team in tree["teams"]:
+            add("team", team, team["name"])
+            for space in team.get("spaces", []):
+                space_path = f"{team['name']} / {space['name']}"
+                add("space", space, space_path, team_id=team["id"])
+                for status in space.get("statuses", []):
+                    add("status", {"id": status, "name": status}, space_path, space_id=space["id"])
+                for item in space.get("lists", []):
+                    add("list", item, f"{space_path} / {item['name']}", space_id=space["id"])
+                for folder in space.get("folders", []):
+                    folder_path = f"{space_path} / {folder['name']}"
+                    add("folder", folder, folder_path, space_id=space["id"])
+                    for item in folder.get("lists", []):
+                        add("list", item, f"{folder_path} / {item['name']}", space_id=space["id"])
+
+        seen_users = set()
+        for team in teams:
+            for member in team.get("members", []):
+                user = member.get("user") or {}
+                if not user.get("id") or user["id"] in seen_users:
+                    continue
+                seen_users.add(user["id"])
+                email = user.get("email") or ""
+                add("user", {"id": user["id"], "name": user.get("username") or email},
+                    team["name"], email, email.split("@")[0])
+
+        self.cache.set(key, index, RESOLVER_INDEX_TTL)
+        return index
+
+    async def resolve(self, query: str, kind: Optional[str] = None, limit: int = 5,
+                      space_id: Optional[str] = None) -> list[dict]:
+        """Return the best matching index entries for a name, email or status."""
+        if kind is not None and kind not in RESOLVE_KINDS:
+            raise ValueError(f"Invalid kind: {kind}")
+        needle = _normalize(str(query))
+        candidates = []
+        for entry in await self.get_resolver_index():
+            if kind and entry["kind"] != kind:
+                continue
+            if space_id and entry.get("space_id") not in (None, space_id):
+                continue
+            if str(entry["id"]) == str(query):
+                score = 1.0
+            else:
+                score = max(_score(needle, alias) for alias in entry["aliases"])
+            if score >= MIN_SCORE:
+                candidates.append({**{k: v for k, v in entry.items() if k != "aliases"}, "score": round(score, 3)})
+        candidates.sort(key=lambda c: c["score"], reverse=True)
+        return candidates[:limit]
+
+    async def resolve_id(self, kind: str, value: Any, space_id: Optional[str] = None) -> Any:
+        """Turn a name into an id, passing through values that already are ids."""
+        if _looks_like_id(kind, value):
+            return value
+        candidates = await self.resolve(value, kind, limit=10, space_id=space_id)
+        if not candidates:
+            raise ValueError(f"No {kind} matches '{value}'")
+        best = candidates[0]
+        # The same status name appears in many spaces; only distinct ids are ambiguous
+        runner_up = next((c for c in candidates if c["id"] != best["id"]), None)
+        if best["score"] < 1.0 and runner_up and best["score"] - runner_up["score"] < AMBIGUITY_MARGIN:
+            options = ", ".join(f"{c['path']} ({c['id']})" for c in (best, runner_up))
+            raise ValueError(f"'{value}' is ambiguous between {options}")
+        return best["id"]
+
+async def resolve_task_arguments(client, arguments: dict) -> dict:
+    """Replace list names, assignee names/emails and the case of status names with what the API expects."""
+    statuses = None
+    if "list" in arguments:
+        name = arguments.pop("list")
+        if "list_id" not in arguments:
+            arguments["list_id"] = str(await client.resolve_id("list", name))
+    if arguments.get("list_id") and _needs_status_resolution(arguments):
+        statuses = await _list_statuses(client, arguments["list_id"])
+
+    if isinstance(arguments.get("assignees"), list):
+        arguments["assignees"] = [
+            await client.resolve_id("user", a) if not _looks_like_id("user", a) else a
+            for a in arguments["assignees"]
+        ]
+    if isinstance(arguments.get("status"), str):
+        arguments["status"] = _match_status(arguments["status"], statuses)
+    if isinstance(arguments.get("statuses"), list):
+        arguments["statuses"] = [_match_status(s, statuses) for s in arguments["statuses"]]
+    return arguments
+
+async def _list_statuses(client, list_id: str) -> Optional[list[str]]:
+    """Statuses of the list's space, or None when the list is not in the index."""
+    index = await client.get_resolver_index()
+    space_id = next((entry.get("space_id") for entry in index
+                     if entry["kind"] == "list" and str(entry["id"]) == str(list_id)), None)
+    if space_id is None:
+        return None
+    return [entry["name"] for entry in index if entry["kind"] == "status" and entry.get("space_id") == space_id]
+
+def _match_status(status: Any, statuses: Optional[list[str]]) -> Any:
+    """Fix the case of a status of the list; anything else is passed through unchanged."""
+    if not isinstance(status, str) or not statuses:
+        return status
+    return next((s for s in statuses if s.casefold() == status.casefold()), status)
+
+def _needs_status_resolution(arguments: dict) -> bool:
+    """Only statuses that differ from their lowercase form can need another spelling."""
+    values = [arguments.get("status")]
+    if isinstance(arguments.get("statuses"), list):
+        values.extend(arguments["statuses"])
+    return any(isinstance(value, str) and value != value.casefold() for value in values)
+
+def _looks_like_id(kind: str, value: Any) -> bool:
+    if kind == "status":
+        return False
+    if isinstance(value, int):
+        return True
+    return isinstance(value, str) and value.isdigit()
+
+def _normalize(text: str) -> str:
+    return " ".join(text.casefold().split())
+
+def _score(needle: str, alias: str) -> float:
+    if needle == alias:
+        return 1.0
+    if needle and needle in alias:
+        # Substring matches rank above fuzzy ones, longer overlaps first
+        return 0.85 + 0.14 * len(needle) / len(alias)
+    return SequenceMatcher(None, needle, alias).ratio()
+
+RESOLVER_TOOLS = [
+    Tool(
+        name="resolve",
+        description="Find ids of teams, spaces, folders, lists, users or statuses by (fuzzy) name or email",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string"},
+                "kind": {"type": "string", "enum": RESOLVE_KINDS, "optional": True},
+                "limit": {"type": "integer", "minimum": 1, "maximum": 20, "optional": True},
+                "refresh": {"type": "boolean", "description": "Rebuild the index from ClickUp", "optional": True}
+            },
+            "required": ["query"]
+        }
+    )
+]
+
+async def handle_resolve(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+    if arguments.get("refresh"):
+        await client.get_resolver_index(refresh=True)
+    candidates = await client.resolve(
+        arguments["query"],
+        arguments.get("kind"),
+        arguments.get("limit", 5)
+    )
+    return await render(candidates)
+
+RESOLVER_TOOL_HANDLERS = {
+    "resolve": handle_resolve
+}
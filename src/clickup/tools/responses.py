@@ -0,0 +1,170 @@
+import json
+import uuid
+from typing import Any, Sequence, Optional
+from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
+
+# Rough estimate for JSON-heavy English text; good enough to size slices.
+BYTES_PER_TOKEN = 4
+CONTINUATION_TTL = 900
+
+# Schema part added to every tool that can return a large payload
+response_budget_schema = {
+    "max_bytes": {
+        "type": "integer",
+        "description": "Truncate the response at an entity boundary above this size and return a continuation token",
+        "minimum": 1,
+        "optional": True
+    },
+    "max_tokens": {
+        "type": "integer",
+        "description": "Same as max_bytes, expressed as an estimated token count",
+        "minimum": 1,
+        "optional": True
+    }
+}
+
+def pop_response_budget(arguments: dict) -> Optional[int]:
+    """Remove budget arguments before they reach a handler and return the byte limit."""
+    max_bytes = arguments.pop("max_bytes", None)
+    max_tokens = arguments.pop("max_tokens", None)
+    limits = []
+    for name, value, scale in (("max_bytes", max_bytes, 1), ("max_tokens", max_tokens, BYTES_PER_TOKEN)):
+        if value is None:
+            continue
+        if int(value) < 1:
+            raise ValueError(f"{name} must be at least 1")
+        limits.append(int(value) * scale)
+    return min(limits) if limits else None
+
+def apply_response_budget(cache, contents: Sequence, limit: Optional[int]) -> Sequence:
+    """Cut a handler response down to `limit` bytes, caching the rest for get-continuation."""
+    if not limit or len(contents) != 1 or not isinstance(contents[0], TextContent):
+        return contents
+    text = contents[0].text
+    if _size(text) <= limit:
+        return contents
+
+    try:
+        data = json.loads(text)
+    except ValueError:
+        data = None
+
+    state = {"limit": limit, "key": None, "extra": {}, "pending": []}
+    if isinstance(data, list):
+        state["pending"] = [("entity", item) for item in data]
+    elif isinstance(data, dict) and _largest_list_key(data):
+        key = _largest_list_key(data)
+        state["key"] = key
+        state["extra"] = {k: v for k, v in data.items() if k != key}
+        state["pending"] = [("entity", item) for item in data[key]]
+    else:
+        state["pending"] = [("text", chunk) for chunk in _split_text(text, limit)]
+    return _serve_slice(cache, state)
+
+def _serve_slice(cache, state: dict) -> list:
+    """Render the next slice of a budgeted response and store the remainder."""
+    limit = state["limit"]
+    pending = state["pending"]
+
+    if pending[0][0] == "text":
+        text = pending[0][1]
+        returned = 1
+    else:
+        items = []
+        estimate = 0
+        for kind, value in pending:
+            if kind != "entity":
+                break
+            estimate += _entity_size(value, 2 if state["key"] else 1)
+            if items and estimate > limit:
+                break
+            items.append(value)
+        text = _render(state, items)
+        while len(items) > 1 and _size(text) > limit:
+            items.pop()
+            text = _render(state, items)
+        returned = len(items)
+        if _size(text) > limit:
+            # A single entity is larger than the budget; hand it out as text chunks.
+            chunks = _split_text(json.dumps(items[0], indent=2), limit)
+            pending = [("text", chunk) for chunk in chunks] + pending[1:]
+            text = chunks[0]
+        state["extra"] = {}
+
+    remaining = pending[returned:]
+    contents = [TextContent(type="text", text=text)]
+    if remaining:
+        token = uuid.uuid4().hex
+        cache.set(("continuation", token), {**state, "pending": remaining}, CONTINUATION_TTL)
+        contents.append(TextContent(
+            type="text",
+            text=json.dumps({
+                "truncated": True,
+                "continuation_token": token,
+                "returned": returned,
+                "remaining": len(remaining)
+            }, indent=2)
+        ))
+    return contents
+
+def _render(state: dict, items: list) -> str:
+    if state["key"] is None:
+        return json.dumps(items, indent=2)
+    return json.dumps({**state["extra"], state["key"]: items}, indent=2)
+
+def _entity_size(value: Any, depth: int) -> int:
+    """Upper estimate of an entity's size once nested `depth` levels deep in the output."""
+    text = json.dumps(value, indent=2)
+    return _size(text) + (text.count("\n") + 1) * 2 * depth + 2
+
+def _largest_list_key(data: dict) -> Optional[str]:
+    lists = [(len(v), k) for k, v in data.items() if isinstance(v, list) and v]
+    return max(lists)[1] if lists else None
+
+def _split_text(text: str, limit: int) -> list[str]:
+    """Split text at line boundaries into chunks of at most `limit` bytes."""
+    chunks, current = [], ""
+    for line in text.splitlines(keepends=True):
+        while _size(line) > limit:
+            cut = limit
+            while _size(line[:cut]) > limit:
+                cut = max(cut // 2, 1)
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(line[:cut])
+            line = line[cut:]
+        if current and _size(current) + _size(line) > limit:
+            chunks.append(current)
+            current = ""
+        current += line
+    if current:
+        chunks.append(current)
+    return chunks
+
+def _size(text: str) -> int:
+    return len(text.encode("utf-8"))
+
+RESPONSE_TOOLS = [
+    Tool(
+        name="get-continuation",
+        description="Get the next slice of a response that was truncated by max_bytes/max_tokens",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "continuation_token": {"type": "string"}
+            },
+            "required": ["continuation_token"]
+        }
+    )
+]
+
+async def handle_get_continuation(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+    state = client.cache.pop(("continuation", arguments["continuation_token"]))
+    if state is None:
+        raise ValueError("Unknown or expired continuation token")
+    return _serve_slice(client.cache, state)
+
+RESPONSE_TOOL_HANDLERS = {
+    "get-continuation": handle_get_continuation
+}
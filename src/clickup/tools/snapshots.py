@@ -0,0 +1,106 @@
+import contextvars
+import hashlib
+import json
+import uuid
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from ..metrics import current_session
+
+SNAPSHOT_TTL = 3600
+# Read tools returning a list of entities with ids, the ones agents poll for changes
+SNAPSHOT_TOOLS = {
+    "get-tasks", "get-view-tasks", "get-tasks-by-id", "get-comments", "get-time-entries", "get-doc-pages",
+    "get-lists", "get-folders", "get-spaces", "get-teams", "get-goals", "get-webhooks"
+}
+
+# Schema part added to the read tools
+snapshot_schema = {
+    "since_token": {
+        "type": "string",
+        "description": "Return only entities added, changed or removed since the call that returned this "
+                       "snapshot_token; pass an empty string to start tracking",
+        "optional": True
+    }
+}
+
+@dataclass
+class SnapshotRequest:
+    """Diff state of one tool call, read by render() and stored afterwards by finish_snapshot()."""
+    cache: Any
+    since: Optional[str]
+    query: str
+    previous: Optional[dict]
+    token: str
+    hashes: Optional[dict] = None
+
+# Set while a tool call with a since_token runs
+current_snapshot: contextvars.ContextVar[Optional[SnapshotRequest]] = contextvars.ContextVar(
+    "current_snapshot", default=None
+)
+
+def begin_snapshot(cache, tool: str, arguments: dict) -> Optional[SnapshotRequest]:
+    """Remove since_token before it reaches a handler and load the snapshot it refers to."""
+    if "since_token" not in arguments:
+        return None
+    since = arguments.pop("since_token") or None
+    if tool not in SNAPSHOT_TOOLS:
+        return None
+    query = _hash([tool, arguments])
+    previous = None
+    if since is not None:
+        state = cache.get(("snapshot", since))
+        # Tokens are scoped to the session and the exact query that produced them
+        if state is None or state["session"] != current_session.get() or state["query"] != query:
+            raise ValueError("Unknown or expired since_token; call again with an empty since_token")
+        previous = state["hashes"]
+    return SnapshotRequest(cache, since, query, previous, uuid.uuid4().hex)
+
+def finish_snapshot(request: SnapshotRequest) -> None:
+    if request.hashes is not None:
+        request.cache.set(
+            ("snapshot", request.token),
+            {"session": current_session.get(), "query": request.query, "hashes": request.hashes},
+            SNAPSHOT_TTL
+        )
+
+def diff_entities(data: Any, previous: Optional[dict], since: Optional[str],
+                  token: str) -> tuple[Any, Optional[dict]]:
+    """Reduce a list of entities to what changed against `previous` (id -> content hash).
+
+    Returns the output and the hashes to keep for the next call; data without a list of
+    entities that have ids is returned unchanged, without a snapshot.
+    """
+    key = None
+    entities = data
+    if isinstance(data, dict):
+        lists = [(len(v), k) for k, v in data.items() if isinstance(v, list)]
+        key = max(lists)[1] if lists else None
+        entities = data.get(key)
+    if not isinstance(entities, list) or not all(isinstance(e, dict) and "id" in e for e in entities):
+        return data, None
+
+    hashes = {str(entity["id"]): _hash(entity) for entity in entities}
+    extra = {k: v for k, v in data.items() if k != key} if key else {}
+    if previous is None:
+        return {**extra, "snapshot_token": token, key or "entities": entities}, hashes
+    added, changed = [], []
+    for entity in entities:
+        digest = previous.get(str(entity["id"]))
+        if digest is None:
+            added.append(entity)
+        elif digest != hashes[str(entity["id"])]:
+            changed.append(entity)
+    return {
+        **extra,
+        "snapshot_token": token,
+        "changes_since": since,
+        "added": added,
+        "changed": changed,
+        "removed": [entity_id for entity_id in previous if entity_id not in hashes],
+        "unchanged": len(entities) - len(added) - len(changed)
+    }, hashes
+
+def _hash(value: Any) -> str:
+    text = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
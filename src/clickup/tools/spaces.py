@@ -1,14 +1,23 @@
 import json
 from typing import Any, Sequence, Optional
 from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
-from .base import ReturnMode, BaseTransformer, return_mode_schema
+from .base import ReturnMode, BaseTransformer, return_mode_schema, render
+
+SPACES_TTL = 300
 
 class SpaceAPI:
-    async def get_spaces(self, team_id: str) -> list[dict]:
-        """Get spaces in a team."""
+    async def get_spaces(self, team_id: str, refresh: bool = False) -> list[dict]:
+        """Get spaces in a team, cached for SPACES_TTL seconds."""
+        key = ("spaces", str(team_id))
+        if not refresh:
+            spaces = self.cache.get(key)
+            if spaces is not None:
+                return spaces
         response = await self.client.get(f"{self.base_url}/team/{team_id}/space")
         response.raise_for_status()
-        return response.json()["spaces"]
+        spaces = response.json()["spaces"]
+        self.cache.set(key, spaces, SPACES_TTL)
+        return spaces
     
     async def create_space(self, team_id: str, name: str, **kwargs) -> dict:
         """Create a space."""
@@ -18,6 +27,7 @@ class SpaceAPI:
             json=data
         )
         response.raise_for_status()
+        self.cache.pop(("spaces", str(team_id)))
         return response.json()
 
 class SpaceTransformer(BaseTransformer):
@@ -37,6 +47,11 @@ SPACE_TOOLS = [
             "type": "object",
             "properties": {
                 "team_id": {"type": "string"},
+                "refresh": {
+                    "type": "boolean",
+                    "description": "Fetch from ClickUp (default); false allows a copy cached for up to 5 minutes",
+                    "optional": True
+                },
                 **return_mode_schema
             },
             "required": ["team_id"]
@@ -60,21 +75,14 @@ SPACE_TOOLS = [
 
 async def handle_get_spaces(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     return_mode = ReturnMode(arguments.pop("return_mode", "minimal"))
-    spaces = await client.get_spaces(arguments["team_id"])
-    transformed_data = SpaceTransformer.transform(spaces, return_mode)
-    return [TextContent(
-        type="text",
-        text=json.dumps(transformed_data, indent=2)
-    )]
+    spaces = await client.get_spaces(arguments["team_id"], refresh=arguments.get("refresh", True))
+    return await render(spaces, SpaceTransformer, return_mode)
 
 async def handle_create_space(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     team_id = arguments.pop("team_id")
     name = arguments.pop("name")
     space = await client.create_space(team_id, name, **arguments)
-    return [TextContent(
-        type="text",
-        text=json.dumps(space, indent=2)
-    )]
+    return await render(space)
 
 SPACE_TOOL_HANDLERS = {
     "get-spaces": handle_get_spaces,
@@ -1,7 +1,16 @@
 import json
-from typing import Any, Sequence, Optional
+import logging
+import os
+import time
+from typing import Any, Callable, Sequence, Optional
 from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
-from .base import ReturnMode, BaseTransformer, return_mode_schema
+from .base import ReturnMode, BaseTransformer, return_mode_schema, gather_bounded, render
+from .resolver import resolve_task_arguments
+from ..metrics import current_transport
+
+logger = logging.getLogger(__name__)
+
+TASK_CACHE_TTL = 60
 
 # API client methods for tasks
 class TaskAPI:
@@ -16,9 +25,12 @@ class TaskAPI:
         response.raise_for_status()
         return response.json()
     
-    async def get_task_details(self, task_id: str, custom_task_ids: bool = False, team_id: Optional[str] = None) -> dict:
+    async def get_task_details(self, task_id: str, custom_task_ids: bool = False, team_id: Optional[str] = None,
+                               include_subtasks: bool = False) -> dict:
         """Get detailed information about a specific task."""
         params = {}
+        if include_subtasks:
+            params["include_subtasks"] = "true"
         if custom_task_ids:
             if not team_id:
                 raise ValueError("team_id is required when using custom_task_ids")
@@ -30,7 +42,40 @@ class TaskAPI:
             params=params
         )
         response.raise_for_status()
-        return response.json()
+        task = response.json()
+        self.cache.set(_task_cache_key(task_id, custom_task_ids, team_id, include_subtasks), task, TASK_CACHE_TTL)
+        if custom_task_ids and task.get("id"):
+            self.cache.set(_task_cache_key(task["id"], include_subtasks=include_subtasks), task, TASK_CACHE_TTL)
+        return task
+
+    async def get_tasks_by_id(self, task_ids: list[str], custom_task_ids: bool = False,
+                              team_id: Optional[str] = None, concurrency: int = 5,
+                              refresh: bool = False) -> list[dict]:
+        """Get many tasks by id: deduplicated, served from cache where possible, in input order.
+
+        Failed lookups are returned as {"id": ..., "error": ...} entries.
+        """
+        if custom_task_ids and not team_id:
+            raise ValueError("team_id is required when using custom_task_ids")
+        task_ids = list(dict.fromkeys(str(task_id) for task_id in task_ids))
+        results = {}
+        misses = []
+        for task_id in task_ids:
+            cached = None if refresh else self.cache.get(_task_cache_key(task_id, custom_task_ids, team_id))
+            if cached is None:
+                misses.append(task_id)
+            else:
+                results[task_id] = cached
+        fetched = await gather_bounded(
+            (self.get_task_details(task_id, custom_task_ids, team_id) for task_id in misses),
+            concurrency,
+            return_exceptions=True
+        )
+        for task_id, task in zip(misses, fetched):
+            if isinstance(task, BaseException) and not isinstance(task, Exception):
+                raise task
+            results[task_id] = {"id": task_id, "error": str(task)} if isinstance(task, Exception) else task
+        return [results[task_id] for task_id in task_ids]
 
     async def get_tasks(self, list_id: str, **kwargs) -> list[dict]:
         """Get tasks from a list."""
@@ -41,6 +86,65 @@ class TaskAPI:
         response.raise_for_status()
         return response.json()
 
+    async def get_task_tree(self, task_id: str, max_depth: int = 3, max_nodes: int = 200, concurrency: int = 5,
+                            custom_task_ids: bool = False, team_id: Optional[str] = None) -> dict:
+        """Expand a task's subtasks breadth-first, one concurrent fetch per level.
+
+        Returns the fetched tasks by id, the child ids of each expanded task and
+        stats on truncation and cycles; tasks past `max_depth` are subtask summaries.
+        """
+        root = await self.get_task_details(task_id, custom_task_ids, team_id, include_subtasks=True)
+        nodes = {root["id"]: root}
+        children = {}
+        visited = {root["id"]}
+        cycles = []
+        truncated = False
+        frontier = [root]
+        depth = 0
+        while frontier and depth < max_depth:
+            next_ids = []
+            for task in frontier:
+                child_ids = []
+                for subtask in task.get("subtasks") or []:
+                    # Some responses list nested subtasks too; only keep direct children here
+                    if subtask.get("parent") not in (None, task["id"]):
+                        continue
+                    if subtask["id"] in visited:
+                        cycles.append(subtask["id"])
+                        continue
+                    if len(visited) >= max_nodes:
+                        truncated = True
+                        break
+                    visited.add(subtask["id"])
+                    nodes[subtask["id"]] = subtask
+                    child_ids.append(subtask["id"])
+                children[task["id"]] = child_ids
+                next_ids.extend(child_ids)
+            depth += 1
+            if depth >= max_depth or not next_ids:
+                truncated = truncated or bool(next_ids)
+                break
+            fetched = await gather_bounded(
+                (self.get_task_details(child_id, include_subtasks=True) for child_id in next_ids),
+                concurrency,
+                return_exceptions=True
+            )
+            frontier = []
+            for child_id, task in zip(next_ids, fetched):
+                if isinstance(task, BaseException) and not isinstance(task, Exception):
+                    raise task
+                if isinstance(task, Exception):
+                    nodes[child_id] = {**nodes[child_id], "error": str(task)}
+                else:
+                    nodes[child_id] = task
+                    frontier.append(task)
+        return {
+            "root": root["id"],
+            "nodes": nodes,
+            "children": children,
+            "stats": {"nodes": len(visited), "depth": depth, "truncated": truncated, "cycles": cycles}
+        }
+
     async def update_task(self, task_id: str, **kwargs) -> dict:
         """Update a task."""
         response = await self.client.put(
@@ -48,7 +152,19 @@ class TaskAPI:
             json=kwargs
         )
         response.raise_for_status()
-        return response.json()
+        task = response.json()
+        self._evict_task(task_id, task)
+        return task
+
+    def _evict_task(self, task_id: str, task: dict) -> None:
+        """Drop a task's cached details, under its id and under the custom id get_task_details also used."""
+        key = _task_cache_key(task_id)
+        for known in (self.cache.get(key), self.cache.get(_task_cache_key(task_id, include_subtasks=True)), task):
+            if isinstance(known, dict) and known.get("custom_id") and known.get("team_id"):
+                for include_subtasks in (False, True):
+                    self.cache.pop(_task_cache_key(known["custom_id"], True, known["team_id"], include_subtasks))
+        self.cache.pop(key)
+        self.cache.pop(_task_cache_key(task_id, include_subtasks=True))
     
     async def get_task_watchers(self, task_id: str) -> list[dict]:
         """Get task watchers."""
@@ -68,12 +184,133 @@ class TaskAPI:
     async def create_task_attachment(self, task_id: str, file) -> dict:
         """Create a task attachment."""
         files = {"attachment": file}
-        response = await self.client.post(
-            f"{self.base_url}/task/{task_id}/attachment",
-            files=files
+        return await self._post_multipart(f"{self.base_url}/task/{task_id}/attachment", files)
+
+    async def upload_task_attachment_file(self, task_id: str, file_path: str,
+                                          progress: Optional[Callable[[int, int], None]] = None) -> dict:
+        """Stream a local file to a task as a multipart attachment without reading it into memory."""
+        path = _upload_path(file_path)
+        size = os.path.getsize(path)
+        started = time.monotonic()
+        with open(path, "rb") as file:
+            reader = _ProgressReader(file, size, progress)
+            attachment = await self._post_multipart(
+                f"{self.base_url}/task/{task_id}/attachment",
+                {"attachment": (os.path.basename(path), reader)}
+            )
+        seconds = time.monotonic() - started
+        return {
+            "task_id": task_id,
+            "file_path": file_path,
+            "bytes": size,
+            "seconds": round(seconds, 3),
+            "bytes_per_second": round(size / seconds) if seconds > 0 else None,
+            "attachment": attachment
+        }
+
+    async def upload_task_attachments(self, uploads: list[dict], concurrency: int = 3) -> dict:
+        """Upload several local files to one or more tasks concurrently; failures are reported per file."""
+        total_bytes = sum(_file_size(u["file_path"]) for u in uploads)
+        sent = {"bytes": 0}
+
+        def on_progress(chunk: int, _size: int):
+            previous = sent["bytes"] * 10 // max(total_bytes, 1)
+            sent["bytes"] += chunk
+            if sent["bytes"] * 10 // max(total_bytes, 1) > previous:
+                logger.info("Attachment upload progress: %d/%d bytes", sent["bytes"], total_bytes)
+
+        started = time.monotonic()
+        results = await gather_bounded(
+            (self.upload_task_attachment_file(u["task_id"], u["file_path"], on_progress) for u in uploads),
+            concurrency,
+            return_exceptions=True
         )
+        seconds = time.monotonic() - started
+        uploaded = []
+        for upload, result in zip(uploads, results):
+            if isinstance(result, BaseException):
+                uploaded.append({**upload, "error": str(result)})
+            else:
+                uploaded.append(result)
+        return {
+            "uploads": uploaded,
+            "files": len(uploads),
+            "failed": sum(1 for r in uploaded if "error" in r),
+            "bytes": sent["bytes"],
+            "seconds": round(seconds, 3),
+            "bytes_per_second": round(sent["bytes"] / seconds) if seconds > 0 else None
+        }
+
+    async def _post_multipart(self, url: str, files: dict) -> dict:
+        request = self.client.build_request("POST", url, files=files)
+        # The client-wide JSON content type would otherwise hide the multipart boundary
+        request.headers["Content-Type"] = request.stream.content_type
+        response = await self.client.send(request)
         response.raise_for_status()
         return response.json()
+
+def _upload_path(file_path: str) -> str:
+    """Resolve a local file to upload, which must lie under CLICKUP_UPLOAD_DIR (the home directory by default).
+
+    Over HTTP the caller is remote and could attach any server file to a task and then
+    download it, so local files are refused there altogether.
+    """
+    if current_transport.get() != "stdio":
+        raise ValueError("file_path uploads are only available over the stdio transport")
+    root = os.path.realpath(os.path.expanduser(os.getenv("CLICKUP_UPLOAD_DIR") or "~"))
+    path = os.path.realpath(os.path.expanduser(file_path))
+    if os.path.commonpath([root, path]) != root:
+        raise ValueError(f"{file_path} is outside the upload directory {root}")
+    return path
+
+def _file_size(file_path: str) -> int:
+    """Size for progress reporting; a missing or refused file fails its own upload later."""
+    try:
+        return os.path.getsize(_upload_path(file_path))
+    except (OSError, ValueError):
+        return 0
+
+def _task_cache_key(task_id: str, custom_task_ids: bool = False, team_id: Optional[str] = None,
+                    include_subtasks: bool = False) -> tuple:
+    key = ("task", "custom", str(team_id), str(task_id)) if custom_task_ids else ("task", str(task_id))
+    # A task fetched with its subtasks is a different response from the plain details
+    return key + ("subtasks",) if include_subtasks else key
+
+class _ProgressReader:
+    """File wrapper that reports every chunk httpx reads while streaming a multipart body.
+
+    A retried request rewinds the file; the bytes already reported are then taken back
+    with a negative chunk, so progress is not counted twice.
+    """
+
+    def __init__(self, file, size: int, progress: Optional[Callable[[int, int], None]] = None):
+        self.file = file
+        self.size = size
+        self.progress = progress
+        self.name = file.name
+        self.sent = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self.file.read(size)
+        if chunk:
+            self.sent += len(chunk)
+            if self.progress:
+                self.progress(len(chunk), self.size)
+        return chunk
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        position = self.file.seek(offset, whence)
+        if position == 0 and self.sent:
+            if self.progress:
+                self.progress(-self.sent, self.size)
+            self.sent = 0
+        return position
+
+    def tell(self) -> int:
+        return self.file.tell()
+
+    def fileno(self) -> int:
+        return self.file.fileno()
         
 # Data transformer for tasks
 class TaskTransformer(BaseTransformer):
@@ -96,10 +333,16 @@ TASK_TOOLS = [
         inputSchema={
             "type": "object",
             "properties": {
-                "list_id": {"type": "string"},
+                "list_id": {"type": "string", "optional": True},
+                "list": {"type": "string", "description": "List name, resolved to list_id", "optional": True},
                 "name": {"type": "string"},
                 "markdown_description": {"type": "string", "optional": True},
-                "assignees": {"type": "array", "items": {"type": "integer"}, "optional": True},
+                "assignees": {
+                    "type": "array",
+                    "items": {"type": ["integer", "string"]},
+                    "description": "User ids, usernames or emails",
+                    "optional": True
+                },
                 "tags": {"type": "array", "items": {"type": "string"}, "optional": True},
                 "status": {"type": "string", "optional": True},
                 "priority": {"type": "integer", "optional": True},
@@ -108,7 +351,7 @@ TASK_TOOLS = [
                 "notify_all": {"type": "boolean", "optional": True},
                 **return_mode_schema
             },
-            "required": ["list_id", "name"]
+            "required": ["name"]
         }
     ),
     Tool(
@@ -124,7 +367,12 @@ TASK_TOOLS = [
                 "priority": {"type": "integer", "optional": True},
                 "due_date": {"type": "integer", "optional": True},
                 "time_estimate": {"type": "integer", "optional": True},
-                "assignees": {"type": "array", "items": {"type": "integer"}, "optional": True},
+                "assignees": {
+                    "type": "array",
+                    "items": {"type": ["integer", "string"]},
+                    "description": "User ids, usernames or emails",
+                    "optional": True
+                },
                 "archived": {"type": "boolean", "optional": True},
                 **return_mode_schema
             },
@@ -180,13 +428,63 @@ TASK_TOOLS = [
             "required": ["task_id"]
         }
     ),
+    Tool(
+        name="get-tasks-by-id",
+        description="Get many tasks by id in one call, in input order",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "task_ids": {"type": "array", "items": {"type": "string"}},
+                "custom_task_ids": {
+                    "type": "boolean",
+                    "description": "Use custom task IDs",
+                    "optional": True
+                },
+                "team_id": {
+                    "type": "string",
+                    "description": "Team ID (required for custom task IDs)",
+                    "optional": True
+                },
+                "concurrency": {"type": "integer", "minimum": 1, "maximum": 10, "optional": True},
+                "refresh": {"type": "boolean", "description": "Bypass cached tasks", "optional": True},
+                **return_mode_schema
+            },
+            "required": ["task_ids"]
+        }
+    ),
+    Tool(
+        name="get-task-tree",
+        description="Get a task with its nested subtasks expanded to a depth or node budget",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "task_id": {"type": "string"},
+                "max_depth": {"type": "integer", "minimum": 1, "maximum": 10, "optional": True},
+                "max_nodes": {"type": "integer", "minimum": 1, "maximum": 2000, "optional": True},
+                "concurrency": {"type": "integer", "minimum": 1, "maximum": 10, "optional": True},
+                "custom_task_ids": {
+                    "type": "boolean",
+                    "description": "Use custom task IDs",
+                    "optional": True
+                },
+                "team_id": {
+                    "type": "string",
+                    "description": "Team ID (required for custom task IDs)",
+                    "optional": True
+                },
+                **return_mode_schema
+            },
+            "required": ["task_id"]
+        }
+    ),
     Tool(
         name="get-tasks",
         description="Get tasks from a list",
         inputSchema={
             "type": "object",
             "properties": {
-                "list_id": {"type": "string"},
+                "list_id": {"type": "string", "optional": True},
+                "list": {"type": "string", "description": "List name, resolved to list_id", "optional": True},
                 "archived": {"type": "boolean", "optional": True},
                 "page": {"type": "integer", "optional": True},
                 "order_by": {"type": "string", "optional": True},
@@ -194,22 +492,56 @@ TASK_TOOLS = [
                 "subtasks": {"type": "boolean", "optional": True},
                 "statuses": {"type": "array", "items": {"type": "string"}, "optional": True},
                 "include_closed": {"type": "boolean", "optional": True},
-                "assignees": {"type": "array", "items": {"type": "string"}, "optional": True},
+                "assignees": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "User ids, usernames or emails",
+                    "optional": True
+                },
                 **return_mode_schema
             },
-            "required": ["list_id"]
+            "required": []
         }
     ),
     Tool(
         name="create-task-attachment",
-        description="Create a task attachment",
+        description="Create a task attachment from inline content or by streaming a local file",
         inputSchema={
             "type": "object",
             "properties": {
                 "task_id": {"type": "string"},
-                "attachment": {"type": "string", "format": "binary"}
+                "attachment": {"type": "string", "format": "binary", "optional": True},
+                "file_path": {
+                    "type": "string",
+                    "description": "Local file under CLICKUP_UPLOAD_DIR streamed from disk instead of passing "
+                                   "its content inline (stdio transport only)",
+                    "optional": True
+                }
             },
-            "required": ["task_id", "attachment"]
+            "required": ["task_id"]
+        }
+    ),
+    Tool(
+        name="upload-task-attachments",
+        description="Stream several local files under CLICKUP_UPLOAD_DIR to one or more tasks concurrently "
+                    "(stdio transport only)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "uploads": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "task_id": {"type": "string"},
+                            "file_path": {"type": "string"}
+                        },
+                        "required": ["task_id", "file_path"]
+                    }
+                },
+                "concurrency": {"type": "integer", "minimum": 1, "maximum": 10, "optional": True}
+            },
+            "required": ["uploads"]
         }
     )
 ]
@@ -217,14 +549,13 @@ TASK_TOOLS = [
 # Tool handlers
 async def handle_create_task(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     return_mode = ReturnMode(arguments.pop("return_mode", "minimal"))
+    await resolve_task_arguments(client, arguments)
+    if "list_id" not in arguments:
+        raise ValueError("Either list_id or list is required")
     list_id = arguments.pop("list_id")
     name = arguments.pop("name")
     task = await client.create_task(list_id, name, **arguments)
-    transformed_data = TaskTransformer.transform(task, return_mode)
-    return [TextContent(
-        type="text",
-        text=json.dumps(transformed_data, indent=2)
-    )]
+    return await render(task, TaskTransformer, return_mode)
 
 async def handle_get_task_details(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     return_mode = ReturnMode(arguments.pop("return_mode", "minimal"))
@@ -233,70 +564,110 @@ async def handle_get_task_details(client, arguments: dict) -> Sequence[TextConte
         custom_task_ids=arguments.get("custom_task_ids", False),
         team_id=arguments.get("team_id")
     )
-    transformed_data = TaskTransformer.transform(task, return_mode)
-    return [TextContent(
-        type="text",
-        text=json.dumps(transformed_data, indent=2)
-    )]
+    return await render(task, TaskTransformer, return_mode)
+
+async def handle_get_tasks_by_id(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+    return_mode = ReturnMode(arguments.pop("return_mode", "minimal"))
+    tasks = await client.get_tasks_by_id(
+        arguments["task_ids"],
+        custom_task_ids=arguments.get("custom_task_ids", False),
+        team_id=arguments.get("team_id"),
+        concurrency=arguments.get("concurrency", 5),
+        refresh=arguments.get("refresh", False)
+    )
+    transformed_data = [
+        task if "error" in task else TaskTransformer.transform(task, return_mode)
+        for task in tasks
+    ]
+    return await render(transformed_data)
+
+async def handle_get_task_tree(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+    return_mode = ReturnMode(arguments.pop("return_mode", "minimal"))
+    tree = await client.get_task_tree(
+        arguments["task_id"],
+        max_depth=arguments.get("max_depth", 3),
+        max_nodes=arguments.get("max_nodes", 200),
+        concurrency=arguments.get("concurrency", 5),
+        custom_task_ids=arguments.get("custom_task_ids", False),
+        team_id=arguments.get("team_id")
+    )
+
+    def build(task_id: str) -> dict:
+        task = tree["nodes"][task_id]
+        node = TaskTransformer.transform(task, return_mode)
+        if return_mode == ReturnMode.FULL:
+            node = {k: v for k, v in task.items() if k != "subtasks"}
+        if "error" in task:
+            node["error"] = task["error"]
+        child_ids = tree["children"].get(task_id)
+        if child_ids:
+            node["subtasks"] = [build(child_id) for child_id in child_ids]
+        return node
+
+    return await render({"tree": build(tree["root"]), **tree["stats"]})
 
 async def handle_get_tasks(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     return_mode = ReturnMode(arguments.pop("return_mode", "minimal"))
+    await resolve_task_arguments(client, arguments)
+    if "list_id" not in arguments:
+        raise ValueError("Either list_id or list is required")
     tasks = await client.get_tasks(
         list_id=arguments["list_id"],
         **{k: v for k, v in arguments.items() if k != "list_id"}
     )
-    transformed_data = TaskTransformer.transform(tasks, return_mode)
-    return [TextContent(
-        type="text",
-        text=json.dumps(transformed_data, indent=2)
-    )]
+    return await render(tasks, TaskTransformer, return_mode)
     
 async def handle_update_task(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     task_id = arguments.pop("task_id")
     return_mode = ReturnMode(arguments.pop("return_mode", "minimal"))
+    await resolve_task_arguments(client, arguments)
     task = await client.update_task(task_id, **arguments)
-    transformed_data = TaskTransformer.transform(task, return_mode)
-    return [TextContent(
-        type="text",
-        text=json.dumps(transformed_data, indent=2)
-    )]
+    return await render(task, TaskTransformer, return_mode)
 
 async def handle_get_task_watchers(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     return_mode = ReturnMode(arguments.pop("return_mode", "minimal"))
     watchers = await client.get_task_watchers(arguments["task_id"])
-    transformed_data = TaskTransformer.transform(watchers, return_mode)
-    return [TextContent(
-        type="text",
-        text=json.dumps(transformed_data, indent=2)
-    )]
+    return await render(watchers, TaskTransformer, return_mode)
 
 async def handle_add_task_watcher(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     result = await client.add_task_watcher(
         task_id=arguments["task_id"],
         watcher_id=arguments["watcher_id"]
     )
-    return [TextContent(
-        type="text",
-        text=json.dumps(result, indent=2)
-    )]
+    return await render(result)
 
 async def handle_create_task_attachment(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-    attachment = await client.create_task_attachment(
-        task_id=arguments["task_id"],
-        file=arguments["attachment"]
+    if arguments.get("file_path"):
+        attachment = await client.upload_task_attachment_file(
+            task_id=arguments["task_id"],
+            file_path=arguments["file_path"]
+        )
+    elif "attachment" in arguments:
+        attachment = await client.create_task_attachment(
+            task_id=arguments["task_id"],
+            file=arguments["attachment"]
+        )
+    else:
+        raise ValueError("Either attachment or file_path is required")
+    return await render(attachment)
+
+async def handle_upload_task_attachments(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+    report = await client.upload_task_attachments(
+        uploads=arguments["uploads"],
+        concurrency=arguments.get("concurrency", 3)
     )
-    return [TextContent(
-        type="text",
-        text=json.dumps(attachment, indent=2)
-    )]
+    return await render(report)
 
 # Tool registry
 TASK_TOOL_HANDLERS = {
     "get-task-details": handle_get_task_details,
     "get-tasks": handle_get_tasks,
+    "get-tasks-by-id": handle_get_tasks_by_id,
+    "get-task-tree": handle_get_task_tree,
     "update-task": handle_update_task,
     "get-task-watchers": handle_get_task_watchers,
     "add-task-watcher": handle_add_task_watcher,
     "create-task-attachment": handle_create_task_attachment,
+    "upload-task-attachments": handle_upload_task_attachments,
     "create-task": handle_create_task
 }
\ No newline at end of file
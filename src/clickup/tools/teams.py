@@ -1,14 +1,23 @@
 import json
 from typing import Any, Sequence, Optional
 from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
-from .base import ReturnMode, BaseTransformer, return_mode_schema
+from .base import ReturnMode, BaseTransformer, return_mode_schema, render
+
+TEAMS_TTL = 300
 
 class TeamAPI:
-    async def get_teams(self) -> list[dict]:
-        """Get all accessible teams/workspaces."""
+    async def get_teams(self, refresh: bool = False) -> list[dict]:
+        """Get all accessible teams/workspaces, cached for TEAMS_TTL seconds."""
+        key = ("teams",)
+        if not refresh:
+            teams = self.cache.get(key)
+            if teams is not None:
+                return teams
         response = await self.client.get(f"{self.base_url}/team")
         response.raise_for_status()
-        return response.json()["teams"]
+        teams = response.json()["teams"]
+        self.cache.set(key, teams, TEAMS_TTL)
+        return teams
 
     async def create_team_group(self, team_id: str, name: str, member_ids: list[int]) -> dict:
         """Create a team (user group)."""
@@ -39,6 +48,11 @@ TEAM_TOOLS = [
         inputSchema={
             "type": "object",
             "properties": {
+                "refresh": {
+                    "type": "boolean",
+                    "description": "Fetch from ClickUp (default); false allows a copy cached for up to 5 minutes",
+                    "optional": True
+                },
                 **return_mode_schema
             }
         }
@@ -60,22 +74,15 @@ TEAM_TOOLS = [
 
 async def handle_get_teams(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     return_mode = ReturnMode(arguments.pop("return_mode", "minimal"))
-    teams = await client.get_teams()
-    transformed_data = TeamTransformer.transform(teams, return_mode)
-    return [TextContent(
-        type="text",
-        text=json.dumps(transformed_data, indent=2)
-    )]
+    teams = await client.get_teams(refresh=arguments.get("refresh", True))
+    return await render(teams, TeamTransformer, return_mode)
 
 async def handle_create_team_group(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     team_id = arguments.pop("team_id")
     name = arguments.pop("name")
     member_ids = arguments.pop("member_ids")
     team = await client.create_team_group(team_id, name, member_ids)
-    return [TextContent(
-        type="text",
-        text=json.dumps(team, indent=2)  # Full response for creation
-    )]
+    return await render(team)  # Full response for creation
 
 TEAM_TOOL_HANDLERS = {
     "get-teams": handle_get_teams,
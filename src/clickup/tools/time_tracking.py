@@ -1,7 +1,14 @@
+import hashlib
 import json
+import time
+from datetime import datetime, timezone
 from typing import Any, Sequence, Optional
+from zoneinfo import ZoneInfo
 from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
-from .base import ReturnMode, BaseTransformer, return_mode_schema
+from .base import ReturnMode, BaseTransformer, return_mode_schema, gather_bounded, render
+
+DAY_MS = 24 * 60 * 60 * 1000
+GROUP_BY_KEYS = ["user", "task", "tag", "billable", "day", "week"]
 
 class TimeTrackingAPI:
     async def get_time_entries(self, team_id: str, **kwargs) -> list[dict]:
@@ -12,6 +19,53 @@ class TimeTrackingAPI:
         )
         response.raise_for_status()
         return response.json()["data"]
+
+    async def get_time_entries_windowed(self, team_id: str, start_date: int, end_date: int,
+                                        window_days: int = 7, concurrency: int = 4,
+                                        fetch_stats: Optional[dict] = None, **kwargs) -> list[dict]:
+        """Fetch a date range as concurrent windows, merged and deduplicated by entry id.
+
+        Day/week partitions that ended more than `time_entry_horizon_days` ago are
+        treated as immutable: they are served from the disk cache once stored and
+        never requested again. Only open partitions are refreshed.
+        """
+        start_date, end_date = int(start_date), int(end_date)
+        disk_cache = self.disk_cache
+        partitions = time_partitions(start_date, end_date, self.time_entry_partition)
+        closed_before = int(time.time() * 1000) - self.time_entry_horizon_days * DAY_MS
+        namespace = _time_entry_namespace(self, team_id, kwargs)
+
+        cached, missing = [], []
+        for label, start, end in partitions:
+            entries = disk_cache.get(namespace, label) if disk_cache and end < closed_before else None
+            if entries is None:
+                missing.append((label, start, end))
+            else:
+                cached.append(entries)
+
+        windows = []
+        for start, end in _contiguous_ranges(missing):
+            windows.extend(split_time_range(start, end, window_days * DAY_MS))
+        results = await gather_bounded(
+            (self.get_time_entries(team_id, start_date=start, end_date=end, **kwargs) for start, end in windows),
+            concurrency
+        )
+        fetched = merge_time_entries(results)
+
+        if disk_cache:
+            for label, start, end in missing:
+                if end < closed_before:
+                    disk_cache.set(namespace, label, [e for e in fetched if start <= int(e.get("start") or 0) <= end])
+
+        if fetch_stats is not None:
+            fetch_stats.update({
+                "partitions": len(partitions),
+                "cached_partitions": len(cached),
+                "fetched_partitions": len(missing),
+                "requests": len(windows)
+            })
+        merged = merge_time_entries([*cached, fetched])
+        return [e for e in merged if start_date <= int(e.get("start") or 0) <= end_date]
     
     async def start_time_entry(self, task_id: str, **kwargs) -> dict:
         """Start time tracking for a task."""
@@ -31,6 +85,114 @@ class TimeEntryTransformer(BaseTransformer):
             return ["id", "task", "wid", "user", "duration", "billable", "description", "tags"]
         return []
 
+def split_time_range(start_date: int, end_date: int, window_ms: int) -> list[tuple[int, int]]:
+    """Split an inclusive millisecond range into consecutive non-overlapping windows."""
+    windows = []
+    start = int(start_date)
+    while start <= end_date:
+        end = min(start + window_ms - 1, int(end_date))
+        windows.append((start, end))
+        start = end + 1
+    return windows
+
+def time_partitions(start_date: int, end_date: int, unit: str = "day") -> list[tuple[str, int, int]]:
+    """UTC day or ISO week partitions (label, start, end) covering a millisecond range."""
+    if unit not in ("day", "week"):
+        raise ValueError(f"Invalid time entry partition: {unit}")
+    # The epoch was a Thursday; shift by three days so weeks start on Monday
+    size, offset = (DAY_MS, 0) if unit == "day" else (7 * DAY_MS, -3 * DAY_MS)
+    partitions = []
+    start = (int(start_date) - offset) // size * size + offset
+    while start <= end_date:
+        moment = datetime.fromtimestamp(start / 1000, tz=timezone.utc)
+        if unit == "day":
+            label = moment.date().isoformat()
+        else:
+            year, week, _ = moment.isocalendar()
+            label = f"{year}-W{week:02d}"
+        partitions.append((label, start, start + size - 1))
+        start += size
+    return partitions
+
+def _contiguous_ranges(partitions: list[tuple[str, int, int]]) -> list[tuple[int, int]]:
+    ranges = []
+    for _, start, end in partitions:
+        if ranges and ranges[-1][1] + 1 == start:
+            ranges[-1] = (ranges[-1][0], end)
+        else:
+            ranges.append((start, end))
+    return ranges
+
+def _time_entry_namespace(client, team_id: str, filters: dict) -> str:
+    """Disk cache namespace: one per token, team, partition unit and filter set."""
+    digest = hashlib.sha256(json.dumps(filters, sort_keys=True, default=str).encode()).hexdigest()[:12]
+    return f"time_entries/{client.cache_namespace}/{team_id}/{client.time_entry_partition}-{digest}"
+
+def merge_time_entries(batches: list[list[dict]]) -> list[dict]:
+    """Merge entry batches, dropping duplicates returned by overlapping windows."""
+    merged = {}
+    for entries in batches:
+        for entry in entries:
+            merged.setdefault(entry.get("id"), entry)
+    return sorted(merged.values(), key=lambda e: int(e.get("start") or 0))
+
+def summarize_time_entries(entries: list[dict], group_by: list[str], tz: str = "UTC") -> dict:
+    """Roll time entries up into duration totals per group-by combination."""
+    unknown = [key for key in group_by if key not in GROUP_BY_KEYS]
+    if unknown:
+        raise ValueError(f"Invalid group_by: {', '.join(unknown)}")
+    zone = ZoneInfo(tz)
+    now_ms = int(time.time() * 1000)
+    rows = {}
+    total_ms = 0
+
+    for entry in entries:
+        duration = int(entry.get("duration") or 0)
+        if duration < 0:
+            # Running timers report -start; count the time elapsed so far
+            duration = now_ms + duration
+        total_ms += duration
+        for key in _group_keys(entry, group_by, zone):
+            row = rows.setdefault(key, {"duration_ms": 0, "entries": 0})
+            row["duration_ms"] += duration
+            row["entries"] += 1
+
+    groups = [
+        {**dict(zip(group_by, key)), **row, "hours": round(row["duration_ms"] / 3_600_000, 2)}
+        for key, row in rows.items()
+    ]
+    groups.sort(key=lambda g: g["duration_ms"], reverse=True)
+    return {
+        "group_by": group_by,
+        "entries": len(entries),
+        "total_duration_ms": total_ms,
+        "total_hours": round(total_ms / 3_600_000, 2),
+        "groups": groups
+    }
+
+def _group_keys(entry: dict, group_by: list[str], zone: ZoneInfo) -> list[tuple]:
+    """Group keys of an entry; an entry with several tags counts towards each of them."""
+    keys = [()]
+    started = datetime.fromtimestamp(int(entry.get("start") or 0) / 1000, tz=timezone.utc).astimezone(zone)
+    for field in group_by:
+        if field == "user":
+            user = entry.get("user") or {}
+            values = [user.get("username") or user.get("email") or str(user.get("id"))]
+        elif field == "task":
+            task = entry.get("task") if isinstance(entry.get("task"), dict) else {}
+            values = [task.get("name") or task.get("id") or "(no task)"]
+        elif field == "tag":
+            values = [tag.get("name") for tag in entry.get("tags") or [] if isinstance(tag, dict)] or ["(no tag)"]
+        elif field == "billable":
+            values = ["billable" if entry.get("billable") else "non-billable"]
+        elif field == "day":
+            values = [started.date().isoformat()]
+        else:
+            year, week, _ = started.isocalendar()
+            values = [f"{year}-W{week:02d}"]
+        keys = [key + (value,) for key in keys for value in values]
+    return keys
+
 TIME_TRACKING_TOOLS = [
     Tool(
         name="get-time-entries",
@@ -46,6 +208,31 @@ TIME_TRACKING_TOOLS = [
             "required": ["team_id"]
         }
     ),
+    Tool(
+        name="time-report",
+        description="Summarize time entries into duration totals grouped by user, task, tag, billable, day or week",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "team_id": {"type": "string"},
+                "start_date": {"type": "integer"},
+                "end_date": {"type": "integer", "optional": True},
+                "group_by": {
+                    "type": "array",
+                    "items": {"type": "string", "enum": GROUP_BY_KEYS},
+                    "optional": True
+                },
+                "assignee": {"type": "string", "description": "Comma separated user ids", "optional": True},
+                "space_id": {"type": "string", "optional": True},
+                "folder_id": {"type": "string", "optional": True},
+                "list_id": {"type": "string", "optional": True},
+                "task_id": {"type": "string", "optional": True},
+                "timezone": {"type": "string", "description": "IANA zone used for day/week buckets", "optional": True},
+                "window_days": {"type": "integer", "minimum": 1, "optional": True}
+            },
+            "required": ["team_id", "start_date"]
+        }
+    ),
     Tool(
         name="start-time-entry",
         description="Start time tracking for a task",
@@ -64,22 +251,34 @@ TIME_TRACKING_TOOLS = [
 async def handle_get_time_entries(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     return_mode = ReturnMode(arguments.pop("return_mode", "minimal"))
     team_id = arguments.pop("team_id")
-    entries = await client.get_time_entries(team_id, **arguments)
-    transformed_data = TimeEntryTransformer.transform(entries, return_mode)
-    return [TextContent(
-        type="text",
-        text=json.dumps(transformed_data, indent=2)
-    )]
+    if "start_date" in arguments and "end_date" in arguments:
+        entries = await client.get_time_entries_windowed(team_id, **arguments)
+    else:
+        entries = await client.get_time_entries(team_id, **arguments)
+    return await render(entries, TimeEntryTransformer, return_mode)
+
+async def handle_time_report(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+    team_id = arguments.pop("team_id")
+    start_date = arguments.pop("start_date")
+    end_date = arguments.pop("end_date", int(time.time() * 1000))
+    group_by = arguments.pop("group_by", ["user"])
+    tz = arguments.pop("timezone", "UTC")
+    window_days = arguments.pop("window_days", 7)
+    fetch_stats = {}
+    entries = await client.get_time_entries_windowed(
+        team_id, start_date, end_date, window_days=window_days, fetch_stats=fetch_stats, **arguments
+    )
+    report = summarize_time_entries(entries, group_by, tz)
+    report["fetch"] = fetch_stats
+    return await render(report)
 
 async def handle_start_time_entry(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     task_id = arguments.pop("task_id")
     entry = await client.start_time_entry(task_id, **arguments)
-    return [TextContent(
-        type="text",
-        text=json.dumps(entry, indent=2)
-    )]
+    return await render(entry)
 
 TIME_TRACKING_TOOL_HANDLERS = {
     "get-time-entries": handle_get_time_entries,
+    "time-report": handle_time_report,
     "start-time-entry": handle_start_time_entry
 }
\ No newline at end of file
@@ -1,7 +1,7 @@
 import json
 from typing import Any, Sequence, Optional
 from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
-from .base import ReturnMode, BaseTransformer, return_mode_schema
+from .base import ReturnMode, BaseTransformer, return_mode_schema, render
 
 class ViewAPI:
     async def get_view(self, view_id: str) -> dict:
@@ -19,6 +19,14 @@ class ViewAPI:
         response.raise_for_status()
         return response.json()
 
+    async def get_views(self, parent_type: str, parent_id: str) -> list[dict]:
+        """Get views of a team, space, folder or list."""
+        if parent_type not in ("team", "space", "folder", "list"):
+            raise ValueError(f"Invalid view parent type: {parent_type}")
+        response = await self.client.get(f"{self.base_url}/{parent_type}/{parent_id}/view")
+        response.raise_for_status()
+        return response.json()["views"]
+
 class ViewTransformer(BaseTransformer):
     @classmethod
     def get_fields(cls, mode: ReturnMode) -> list[str]:
@@ -59,21 +67,13 @@ VIEW_TOOLS = [
 async def handle_get_view(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     return_mode = ReturnMode(arguments.pop("return_mode", "minimal"))
     view = await client.get_view(arguments["view_id"])
-    transformed_data = ViewTransformer.transform(view, return_mode)
-    return [TextContent(
-        type="text",
-        text=json.dumps(transformed_data, indent=2)
-    )]
+    return await render(view, ViewTransformer, return_mode)
 
 async def handle_get_view_tasks(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     return_mode = ReturnMode(arguments.pop("return_mode", "minimal"))
     page = arguments.pop("page", 0)
     tasks = await client.get_view_tasks(arguments["view_id"], page)
-    transformed_data = ViewTransformer.transform(tasks, return_mode)
-    return [TextContent(
-        type="text",
-        text=json.dumps(transformed_data, indent=2)
-    )]
+    return await render(tasks, ViewTransformer, return_mode)
 
 VIEW_TOOL_HANDLERS = {
     "get-view": handle_get_view,
@@ -1,14 +1,30 @@
+import asyncio
 import json
+import time
 from typing import Any, Sequence, Optional
 from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
-from .base import ReturnMode, BaseTransformer, return_mode_schema
+from .base import ReturnMode, BaseTransformer, return_mode_schema, render
+from .tasks import TaskTransformer
+from .. import deadlines
+from ..events import hub
+
+DEFAULT_WAIT_SECONDS = 300
+# Polling starts fast and backs off while nothing changes
+POLL_MIN_INTERVAL = 2.0
+POLL_MAX_INTERVAL = 30.0
+POLL_BACKOFF = 1.5
+# How long the webhooks listed by load_webhook_secrets are trusted before listing them again
+WEBHOOK_SECRETS_TTL = 300
 
 class WebhookAPI:
     async def get_webhooks(self, team_id: str) -> dict:
-        """Get webhooks."""
+        """Get webhooks, remembering their secrets to verify deliveries."""
         response = await self.client.get(f"{self.base_url}/team/{team_id}/webhook")
         response.raise_for_status()
-        return response.json()
+        webhooks = response.json()
+        for webhook in webhooks.get("webhooks", []):
+            hub.register(webhook.get("id"), webhook.get("secret"), self.cache_namespace, webhook.get("endpoint"))
+        return webhooks
 
     async def create_webhook(self, team_id: str, endpoint: str, events: list[str], **kwargs) -> dict:
         """Create a webhook."""
@@ -22,7 +38,23 @@ class WebhookAPI:
             json=data
         )
         response.raise_for_status()
-        return response.json()
+        webhook = response.json()
+        details = webhook.get("webhook") or {}
+        hub.register(details.get("id") or webhook.get("id"), details.get("secret"), self.cache_namespace,
+                     details.get("endpoint") or endpoint)
+        return webhook
+
+    async def load_webhook_secrets(self) -> None:
+        """Register the secrets of the token's existing webhooks, e.g. after a restart.
+
+        Listed at most once per WEBHOOK_SECRETS_TTL seconds; webhooks created through
+        this server are registered right away anyway.
+        """
+        if self.cache.get(("webhook_secrets",)):
+            return
+        for team in await self.get_teams():
+            await self.get_webhooks(team["id"])
+        self.cache.set(("webhook_secrets",), True, WEBHOOK_SECRETS_TTL)
 
 class WebhookTransformer(BaseTransformer):
     @classmethod
@@ -62,29 +94,139 @@ WEBHOOK_TOOLS = [
             },
             "required": ["team_id", "endpoint", "events"]
         }
+    ),
+    Tool(
+        name="wait-for-task-change",
+        description="Wait until a task, or any task in a list, changes (optionally to a given status) instead of "
+                    "polling. Uses webhook deliveries when the token has a webhook delivering to this server's "
+                    "CLICKUP_WEBHOOK_URL, adaptive polling otherwise",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "task_id": {"type": "string", "optional": True},
+                "list_id": {"type": "string", "optional": True},
+                "events": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Webhook events to wait for, e.g. taskStatusUpdated, taskCommentPosted "
+                                   "(default any). Not applied when polling",
+                    "optional": True
+                },
+                "status": {"type": "string", "description": "Only return once the task has this status", "optional": True},
+                "wait_seconds": {
+                    "type": "number",
+                    "description": f"Give up after this many seconds (default {DEFAULT_WAIT_SECONDS})",
+                    "optional": True
+                }
+            },
+            "required": []
+        }
     )
 ]
 
 async def handle_get_webhooks(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     return_mode = ReturnMode(arguments.pop("return_mode", "minimal"))
     webhooks = await client.get_webhooks(arguments["team_id"])
-    transformed_data = WebhookTransformer.transform(webhooks.get("webhooks", []), return_mode)
-    return [TextContent(
-        type="text",
-        text=json.dumps(transformed_data, indent=2)
-    )]
+    return await render(webhooks.get("webhooks", []), WebhookTransformer, return_mode)
 
 async def handle_create_webhook(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     team_id = arguments.pop("team_id")
     endpoint = arguments.pop("endpoint")
     events = arguments.pop("events")
     webhook = await client.create_webhook(team_id, endpoint, events, **arguments)
-    return [TextContent(
-        type="text",
-        text=json.dumps(webhook, indent=2)
-    )]
+    return await render(webhook)
+
+async def handle_wait_for_task_change(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+    task_id = arguments.get("task_id")
+    list_id = arguments.get("list_id")
+    if not task_id and not list_id:
+        raise ValueError("Either task_id or list_id is required")
+    wait = float(arguments.get("wait_seconds", DEFAULT_WAIT_SECONDS))
+    remaining = deadlines.remaining()
+    if remaining is not None:
+        # Answer "nothing changed" before the call's own deadline cuts it off
+        wait = max(min(wait, remaining - 1), 0)
+    if hub.listening and not hub.available(client.cache_namespace):
+        await client.load_webhook_secrets()
+    started = time.monotonic()
+    if hub.available(client.cache_namespace):
+        result = await _wait_for_event(client, arguments, started + wait)
+    else:
+        result = await _poll_for_change(client, arguments, started + wait)
+    result["waited_seconds"] = round(time.monotonic() - started, 1)
+    return await render(result)
+
+async def _wait_for_event(client, arguments: dict, until: float) -> dict:
+    task_id, list_id, status = arguments.get("task_id"), arguments.get("list_id"), arguments.get("status")
+    events = set(arguments.get("events") or [])
+
+    def matches(event: dict) -> bool:
+        return (
+            event.get("namespace") == client.cache_namespace
+            and bool(event.get("task_id"))
+            and (not events or event.get("event") in events)
+            and (not task_id or str(event["task_id"]) == str(task_id))
+        )
+
+    with hub.subscribe(matches) as deliveries:
+        while True:
+            try:
+                event = deliveries.get_nowait() if not deliveries.empty() else await asyncio.wait_for(
+                    deliveries.get(), max(until - time.monotonic(), 0))
+            except asyncio.TimeoutError:
+                return {"changed": False, "source": "webhook"}
+            task = None
+            if list_id or status:
+                # Deliveries carry neither the list nor the resulting status; events arriving meanwhile queue up
+                task = await client.get_task_details(event["task_id"])
+                if list_id and str((task.get("list") or {}).get("id")) != str(list_id):
+                    continue
+                if status and not _has_status(task, status):
+                    continue
+            return {
+                "changed": True,
+                "source": "webhook",
+                "event": event.get("event"),
+                "task_id": event["task_id"],
+                "history_items": event.get("history_items", []),
+                "task": TaskTransformer.transform(task, ReturnMode.MINIMAL) if task else None
+            }
+
+async def _poll_for_change(client, arguments: dict, until: float) -> dict:
+    task_id, list_id, status = arguments.get("task_id"), arguments.get("list_id"), arguments.get("status")
+    interval = POLL_MIN_INTERVAL
+    polls = 0
+    if task_id:
+        last_updated = (await client.get_task_details(task_id)).get("date_updated")
+    else:
+        since = int(time.time() * 1000)
+    while time.monotonic() < until:
+        await asyncio.sleep(min(interval, max(until - time.monotonic(), 0)))
+        polls += 1
+        if task_id:
+            task = await client.get_task_details(task_id)
+            changed = [task] if task.get("date_updated") != last_updated else []
+            last_updated = task.get("date_updated")
+        else:
+            changed = (await client.get_tasks(list_id, date_updated_gt=since, include_closed="true")).get("tasks", [])
+            since = max([int(t.get("date_updated") or 0) for t in changed] + [since])
+        matching = [t for t in changed if not status or _has_status(t, status)]
+        if matching:
+            return {
+                "changed": True,
+                "source": "polling",
+                "polls": polls,
+                "tasks": TaskTransformer.transform(matching, ReturnMode.MINIMAL)
+            }
+        # Changes that did not match yet suggest more are coming
+        interval = POLL_MIN_INTERVAL if changed else min(interval * POLL_BACKOFF, POLL_MAX_INTERVAL)
+    return {"changed": False, "source": "polling", "polls": polls}
+
+def _has_status(task: dict, status: str) -> bool:
+    return str((task.get("status") or {}).get("status", "")).casefold() == status.casefold()
 
 WEBHOOK_TOOL_HANDLERS = {
     "get-webhooks": handle_get_webhooks,
-    "create-webhook": handle_create_webhook
+    "create-webhook": handle_create_webhook,
+    "wait-for-task-change": handle_wait_for_task_change
 }
\ No newline at end of file
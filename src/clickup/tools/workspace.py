@@ -0,0 +1,128 @@
+import asyncio
+from typing import Any, Sequence, Optional
+from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
+from .base import gather_all, render
+
+WORKSPACE_TREE_TTL = 600
+
+# Depth levels of the workspace tree
+DEPTH_TEAMS = 1
+DEPTH_SPACES = 2
+DEPTH_LISTS = 3
+DEPTH_VIEWS = 4
+
+class WorkspaceAPI:
+    async def get_workspace_tree(self, team_id: Optional[str] = None, max_depth: int = DEPTH_LISTS,
+                                 concurrency: int = 5, refresh: bool = False) -> dict:
+        """Walk teams, spaces, folders, lists and views into a compact id/name tree.
+
+        All requests of the walk share one concurrency limit, and the result is
+        cached on the client for WORKSPACE_TREE_TTL seconds.
+        """
+        key = ("workspace_tree", team_id, max_depth)
+        if not refresh:
+            tree = self.cache.get(key)
+            if tree is not None:
+                return tree
+
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def call(method, *args):
+            async with semaphore:
+                return await method(*args)
+
+        async def views(parent_type: str, parent_id: str) -> list[dict]:
+            return [_node(view, type=view.get("type")) for view in await call(self.get_views, parent_type, parent_id)]
+
+        async def list_node(item: dict) -> dict:
+            node = _node(item)
+            if max_depth >= DEPTH_VIEWS:
+                node["views"] = await views("list", item["id"])
+            return node
+
+        async def folder_node(folder: dict) -> dict:
+            node = _node(folder)
+            lists, folder_views = await gather_all(
+                gather_all(*(list_node(item) for item in folder.get("lists") or [])),
+                views("folder", folder["id"]) if max_depth >= DEPTH_VIEWS else _none()
+            )
+            node["lists"] = list(lists)
+            if folder_views is not None:
+                node["views"] = folder_views
+            return node
+
+        async def space_node(space: dict) -> dict:
+            node = _node(space, statuses=[s.get("status") for s in space.get("statuses") or []])
+            if max_depth < DEPTH_LISTS:
+                return node
+            folders, lists = await gather_all(
+                call(self.get_folders, space["id"]),
+                call(self.get_lists, space["id"])
+            )
+            folder_nodes, list_nodes, space_views = await gather_all(
+                gather_all(*(folder_node(folder) for folder in folders)),
+                gather_all(*(list_node(item) for item in lists)),
+                views("space", space["id"]) if max_depth >= DEPTH_VIEWS else _none()
+            )
+            node["folders"] = list(folder_nodes)
+            node["lists"] = list(list_nodes)
+            if space_views is not None:
+                node["views"] = space_views
+            return node
+
+        async def team_node(team: dict) -> dict:
+            node = _node(team)
+            if max_depth >= DEPTH_SPACES:
+                spaces = await call(self.get_spaces, team["id"], refresh)
+                node["spaces"] = list(await gather_all(*(space_node(space) for space in spaces)))
+            return node
+
+        teams = await call(self.get_teams, refresh)
+        if team_id is not None:
+            teams = [team for team in teams if str(team["id"]) == str(team_id)]
+            if not teams:
+                raise ValueError(f"Team {team_id} not found")
+        tree = {"teams": list(await gather_all(*(team_node(team) for team in teams)))}
+        self.cache.set(key, tree, WORKSPACE_TREE_TTL)
+        return tree
+
+def _node(entity: dict, **extra) -> dict:
+    return {"id": entity.get("id"), "name": entity.get("name"), **{k: v for k, v in extra.items() if v}}
+
+async def _none():
+    return None
+
+WORKSPACE_TOOLS = [
+    Tool(
+        name="get-workspace-tree",
+        description="Get the team > space > folder > list > view hierarchy with ids and names in one call",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "team_id": {"type": "string", "optional": True},
+                "max_depth": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "maximum": 4,
+                    "description": "1 teams, 2 spaces, 3 folders and lists (default), 4 views",
+                    "optional": True
+                },
+                "concurrency": {"type": "integer", "minimum": 1, "maximum": 10, "optional": True},
+                "refresh": {"type": "boolean", "description": "Bypass the cached tree", "optional": True}
+            }
+        }
+    )
+]
+
+async def handle_get_workspace_tree(client, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+    tree = await client.get_workspace_tree(
+        team_id=arguments.get("team_id"),
+        max_depth=arguments.get("max_depth", DEPTH_LISTS),
+        concurrency=arguments.get("concurrency", 5),
+        refresh=arguments.get("refresh", False)
+    )
+    return await render(tree)
+
+WORKSPACE_TOOL_HANDLERS = {
+    "get-workspace-tree": handle_get_workspace_tree
+}
@@ -0,0 +1,120 @@
+import contextlib
+import contextvars
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+from typing import Any, Iterator, Optional, Protocol
+
+logger = logging.getLogger(__name__)
+
+# Innermost open span of the running task; asyncio tasks inherit it, so fan-out stays in one trace
+current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("current_span", default=None)
+
+
+class Span:
+    """One timed operation of a trace, exported when finished."""
+
+    def __init__(self, name: str, parent: Optional["Span"] = None, attributes: Optional[dict] = None,
+                 start: Optional[float] = None):
+        self.name = name
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = dict(attributes or {})
+        # Monotonic clock for durations, wall clock only to place the span in time
+        self.start = time.perf_counter() if start is None else start
+        self.start_time = time.time() - (time.perf_counter() - self.start)
+        self.end: Optional[float] = None
+        self.error: Optional[str] = None
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def finish(self, end: Optional[float] = None) -> None:
+        self.end = time.perf_counter() if end is None else end
+        for exporter in list(_exporters):
+            try:
+                exporter.export(self)
+            except Exception:
+                logger.exception("Trace exporter %r failed", exporter)
+
+    @property
+    def duration(self) -> Optional[float]:
+        return None if self.end is None else self.end - self.start
+
+    def to_dict(self) -> dict:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start": round(self.start_time, 6),
+            "duration_ms": None if self.end is None else round(self.duration * 1000, 3),
+            "attributes": self.attributes,
+            "error": self.error
+        }
+
+
+class Exporter(Protocol):
+    def export(self, span: Span) -> None: ...
+
+
+class JsonLinesExporter:
+    """Append finished spans to a file, one JSON object per line."""
+
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(path)
+        self._lock = threading.Lock()
+        self._file = open(self.path, "a", encoding="utf-8", buffering=1)
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def close(self) -> None:
+        self._file.close()
+
+
+_exporters: list[Exporter] = []
+
+
+def add_exporter(exporter: Exporter) -> None:
+    _exporters.append(exporter)
+
+
+def remove_exporter(exporter: Exporter) -> None:
+    if exporter in _exporters:
+        _exporters.remove(exporter)
+
+
+def enabled() -> bool:
+    return bool(_exporters)
+
+
+@contextlib.contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Run a block as a child of the current span; yields None (and costs nothing) without exporters."""
+    if not _exporters:
+        yield None
+        return
+    current = Span(name, current_span.get(), attributes)
+    token = current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        current_span.reset(token)
+        current.finish()
+
+
+def configure_from_env() -> None:
+    """Install the JSON-lines exporter when CLICKUP_TRACE_FILE is set."""
+    path = os.getenv("CLICKUP_TRACE_FILE")
+    if path and not any(isinstance(e, JsonLinesExporter) and e.path == os.path.expanduser(path) for e in _exporters):
+        add_exporter(JsonLinesExporter(path))